@@ -0,0 +1,424 @@
+#!/usr/bin/env python3
+"""
+Message catalog and renderer for code-based analysis output.
+
+With advice_format "codes" the analyzer reports strengths, weaknesses, skill
+gaps and the optimization report as stable message codes with parameters
+instead of finished text, which keeps per-student payloads and stored
+documents small. This module turns those codes into the text the analyzer
+returns by default. The analyzer renders its text output through the same
+functions, so rendering a "codes" result always gives the "text" result.
+
+A message is a [code, params] pair. Templates are str.format strings over the
+params, with two extra conversions: "{x!c}" capitalizes a value and "{x!j}"
+joins a list with ", ". Codes are part of the output format: change what a
+code says, never what it means, and add a new code for a new message.
+
+Usage:
+    from advice_messages import render_message, render_strengths
+
+    render_message(["strength.skills", {"count": 17}])
+    # -> {"strength": "Strong technical skills", "tip": "You have 17 skills listed."}
+
+Missing skills per category are not part of a "codes" result; they follow
+from skills_found and the skill tables, so ats_resume_analyzer.render_result
+supplies them when rendering a whole result.
+"""
+
+import re
+from typing import Dict, List, Tuple, Any, Union
+
+Message = List[Any]  # [code, params]
+
+RULE = "=" * 70
+
+
+def _section(title: str, *lines: str) -> tuple:
+    """Lines of an advice report section: a ruled title, a blank line, the body."""
+    return (RULE, title, RULE, "") + lines
+
+
+# ============================================================================
+# MESSAGE CATALOG
+# ============================================================================
+
+MESSAGES: Dict[str, Union[str, Dict[str, str], tuple]] = {
+    # Strengths: the verbose result keeps each tip
+    "strength.section_present": {
+        "strength": "{section!c} section present",
+        "tip": "Your {section} section is well-structured."
+    },
+    "strength.skills": {"strength": "Strong technical skills", "tip": "You have {count} skills listed."},
+    "strength.action_verbs": {"strength": "Good experience indicators", "tip": "You use {count} action verbs."},
+    "strength.keyword_diversity": {"strength": "Good keyword diversity", "tip": "Your vocabulary is varied."},
+    "strength.education": {
+        "strength": "Education credentials clear",
+        "tip": "Educational background is well-documented."
+    },
+    "strength.contact_complete": {
+        "strength": "Complete contact info",
+        "tip": "Excellent! You have {count} contact methods."
+    },
+    "strength.contact_good": {"strength": "Good contact info", "tip": "You have {count} contact methods."},
+    "strength.metrics": {
+        "strength": "Quantifiable achievements",
+        "tip": "Great! You include metrics and numbers in your resume."
+    },
+    "strengths.summary": (
+        "Your resume demonstrates {count} key strengths that contribute to your ATS score of {score}/100."
+    ),
+
+    # Weaknesses
+    "weakness.section_missing": {
+        "weakness": "{section!c} section missing",
+        "impact": "Reduces ATS compatibility.",
+        "fix": "Add a '{section!c}' section."
+    },
+
+    # Skill gaps
+    "gaps.none.summary": "Excellent! No significant skill gaps identified across all tracked categories.",
+    "gaps.none.impact": (
+        "Your resume demonstrates comprehensive technical skill coverage, which is highly beneficial for "
+        "ATS matching across a wide range of positions."
+    ),
+    "gaps.none.recommendation": (
+        "Continue to keep your skills updated with emerging technologies. Align your skillset with specific "
+        "job descriptions when applying to maximize match scores."
+    ),
+    "gaps.summary": (
+        "Analysis identified {total} skill gaps across various categories. "
+        "Priority breakdown: {high} high-importance, {medium} medium-importance, {low} low-importance. "
+        "Key missing skills include: {skills!j}."
+    ),
+    "gaps.impact.critical": (
+        "⚠️ CRITICAL CONCERN: {high} high-importance skills are missing. "
+        "These gaps could severely limit your resume's visibility in ATS systems and may lead to automatic "
+        "disqualification for many relevant positions. "
+        "High-priority skills like {skills!j} are frequently used as filter criteria by ATS."
+    ),
+    "gaps.impact.moderate": (
+        "⚠ MODERATE CONCERN: {high} high-importance skills and {medium} medium-importance skills are missing. "
+        "This could moderately impact your ATS ranking and limit shortlisting opportunities for positions "
+        "requiring these core competencies. "
+        "Focus on acquiring: {skills!j}."
+    ),
+    "gaps.impact.low_to_moderate": (
+        "◐ LOW TO MODERATE CONCERN: The missing skills are mainly medium-importance ({medium} skills). "
+        "While not critical, adding these skills could broaden your appeal and improve ATS matching for a "
+        "wider range of positions."
+    ),
+    "gaps.impact.low": (
+        "✓ LOW CONCERN: The identified gaps are primarily in lower-priority or specialized skills. "
+        "These have minimal direct impact on ATS matching for general positions, but may be important for "
+        "specific niche roles."
+    ),
+    "gaps.recommendation.high": (
+        "🎯 IMMEDIATE ACTIONS NEEDED:\n"
+        "1. PRIORITIZE HIGH-IMPORTANCE SKILLS: Focus on acquiring these {high} critical skills first: "
+        "{skills!j}. These are often mandatory requirements in job descriptions.\n"
+        "2. LEARN AND DEMONSTRATE: Take online courses (Coursera, Udemy, edX), complete hands-on projects, "
+        "or contribute to open-source to gain practical experience.\n"
+        "3. UPDATE RESUME: Once proficient, add these skills to your resume with specific examples of usage "
+        "in your projects or experience.\n"
+        "4. USE PRECISE KEYWORDS: Mirror the exact terminology from job descriptions. For example, if a job "
+        "mentions 'React.js', include 'React.js' or 'React' rather than just 'frontend frameworks'.\n"
+        "5. VALIDATE WITH PROJECTS: Build portfolio projects showcasing new skills to strengthen credibility."
+    ),
+    "gaps.recommendation.medium": (
+        "📈 RECOMMENDED IMPROVEMENTS:\n"
+        "1. Expand your skillset gradually by learning medium-priority skills like: {skills!j}.\n"
+        "2. Integrate new skills into your existing projects and update your resume accordingly.\n"
+        "3. Focus on skills relevant to your target role and industry.\n"
+        "4. Use online resources, certifications, or personal projects to demonstrate competency."
+    ),
+    "gaps.recommendation.maintain": (
+        "✓ MAINTAIN AND REFINE:\n"
+        "1. Your skill coverage is strong. Continue to keep current skills updated.\n"
+        "2. Stay informed about emerging technologies in your field.\n"
+        "3. Tailor your resume for specific job applications by emphasizing relevant skills from your "
+        "existing skillset."
+    ),
+
+    # Advice report blocks (tuples of lines)
+    "advice.score.excellent": (
+        "✓✓✓ EXCELLENT! Your resume scored {score}/100",
+        "",
+        "Your resume is highly optimized for ATS systems. You're in the top tier",
+        "and should pass most automated screenings. Focus on tailoring for specific",
+        "roles to maximize your success rate.",
+        "",
+    ),
+    "advice.score.strong": (
+        "✓✓ STRONG! Your resume scored {score}/100",
+        "",
+        "Your resume is well-optimized and likely to pass most ATS screenings.",
+        "With some targeted improvements, you can reach the excellent tier.",
+        "",
+    ),
+    "advice.score.good": (
+        "◐ GOOD! Your resume scored {score}/100",
+        "",
+        "Your resume will pass many ATS screenings but has significant room for",
+        "improvement. Focus on the high-priority items below to boost your score.",
+        "",
+    ),
+    "advice.score.needs_improvement": (
+        "⚠ NEEDS IMPROVEMENT! Your resume scored {score}/100",
+        "",
+        "Your resume may struggle with many ATS systems. Immediate optimization",
+        "is recommended to improve your chances of getting past automated screening.",
+        "",
+    ),
+    "advice.score.critical": (
+        "⚠⚠ CRITICAL! Your resume scored {score}/100",
+        "",
+        "Your resume is at high risk of being filtered out by ATS systems.",
+        "Urgent optimization needed. Follow the recommendations below carefully.",
+        "",
+    ),
+    "advice.tips": _section(
+        "💡 GENERAL ATS OPTIMIZATION TIPS",
+        "1. TAILOR FOR EACH JOB:",
+        "   • Customize your resume for each application",
+        "   • Mirror keywords from the job description",
+        "   • Highlight most relevant experiences first",
+        "",
+        "2. USE STANDARD FORMATTING:",
+        "   • Use standard section headers (Experience, Education, Skills)",
+        "   • Avoid tables, text boxes, headers/footers",
+        "   • Use standard fonts (Arial, Calibri, Times New Roman)",
+        "   • Save as PDF for consistency",
+        "",
+        "3. OPTIMIZE KEYWORD USAGE:",
+        "   • Include both acronyms and full terms (AI and Artificial Intelligence)",
+        "   • Use industry-standard terminology",
+        "   • Add relevant synonyms naturally",
+        "",
+        "4. QUANTIFY ACHIEVEMENTS:",
+        "   • Use specific metrics (increased by 40%, managed team of 5)",
+        "   • Include numbers, percentages, timeframes",
+        "   • Show tangible impact of your work",
+        "",
+        "5. PROOFREAD CAREFULLY:",
+        "   • Check for spelling and grammar errors",
+        "   • Ensure consistent formatting",
+        "   • Verify all dates and information are accurate",
+        "",
+    ),
+    "advice.next_steps.immediate": _section(
+        "🎯 NEXT STEPS",
+        "IMMEDIATE PRIORITY:",
+        "1. Fix all critical weaknesses listed above",
+        "2. Add missing sections (if any)",
+        "3. Expand your skills section significantly",
+        "4. Add quantifiable achievements with metrics",
+        "5. Reanalyze your resume after changes",
+    ),
+    "advice.next_steps.recommended": _section(
+        "🎯 NEXT STEPS",
+        "RECOMMENDED ACTIONS:",
+        "1. Address high-impact weaknesses first",
+        "2. Add 5-10 more relevant technical skills",
+        "3. Incorporate more action verbs in experience descriptions",
+        "4. Add specific metrics to demonstrate impact",
+        "5. Review and update based on target job descriptions",
+    ),
+    "advice.next_steps.optimization": _section(
+        "🎯 NEXT STEPS",
+        "OPTIMIZATION ACTIONS:",
+        "1. Fine-tune for specific job applications",
+        "2. Keep skills updated with latest technologies",
+        "3. Continuously add quantifiable achievements",
+        "4. Maintain consistent formatting and structure",
+        "5. Consider adding certifications or recent projects",
+    ),
+}
+
+
+# ============================================================================
+# RENDERING
+# ============================================================================
+
+_CONVERSIONS = {
+    "c": lambda value: str(value).capitalize(),
+    "j": ", ".join,
+}
+_CONVERSION_FIELD = re.compile(r"\{(\w+)!([cj])\}")
+
+
+def _compile(template: str) -> Tuple[str, tuple]:
+    """
+    Split a template into a plain str.format template and the conversions it
+    needs: "{section!c}" becomes "{section_c}", filled with the capitalized
+    section. Compiled once per template.
+    """
+    conversions = tuple(
+        (f"{name}_{conversion}", name, _CONVERSIONS[conversion])
+        for name, conversion in dict.fromkeys(_CONVERSION_FIELD.findall(template))
+    )
+    return _CONVERSION_FIELD.sub(r"{\1_\2}", template), conversions
+
+
+_COMPILED: Dict[str, Tuple[str, tuple]] = {}
+
+# Block codes without fields, returned without formatting
+_STATIC_BLOCKS = {
+    code for code, template in MESSAGES.items()
+    if isinstance(template, tuple) and not any("{" in line for line in template)
+}
+
+
+def _fill(template: str, params: Dict[str, Any]) -> str:
+    compiled = _COMPILED.get(template)
+    if compiled is None:
+        compiled = _COMPILED[template] = _compile(template)
+    plain, conversions = compiled
+    if not conversions:
+        return plain.format_map(params)
+    values = dict(params)
+    for key, name, convert in conversions:
+        values[key] = convert(params[name])
+    return plain.format_map(values)
+
+
+def render_message(message: Message) -> Union[str, Dict[str, str], List[str]]:
+    """
+    Render one [code, params] message with its catalog template.
+
+    Returns:
+        A string, a dict of strings (strengths, weaknesses) or a list of
+        lines (advice blocks), following the shape of the template
+
+    Raises:
+        KeyError: If the code is not in MESSAGES or a parameter is missing
+    """
+    code, params = message
+    template = MESSAGES[code]
+    if isinstance(template, str):
+        return _fill(template, params)
+    if isinstance(template, dict):
+        return {field: _fill(text, params) for field, text in template.items()}
+    if code in _STATIC_BLOCKS:
+        return list(template)
+    return [_fill(line, params) for line in template]
+
+
+def render_strengths(messages: List[Message], score: int) -> Dict[str, Any]:
+    """The enhanced_strengths block for strength messages and the total score."""
+    return {
+        "summary": render_message(["strengths.summary", {"count": len(messages), "score": score}]),
+        "individual_tips": [_fill(MESSAGES[code]["tip"], params) for code, params in messages],
+        "strength_count": len(messages),
+        "score": score
+    }
+
+
+def render_weaknesses(messages: List[Message]) -> List[Dict[str, str]]:
+    """The resume_weaknesses list (weakness, impact, fix) for weakness messages."""
+    return [render_message(message) for message in messages]
+
+
+def render_skill_gaps(gaps: Dict[str, Any], missing_by_category: Dict[str, List[Dict[str, str]]]) -> Dict[str, Any]:
+    """
+    The skill_gaps block for a "codes" gap analysis.
+
+    Args:
+        gaps: Gap analysis with its summary, overall_impact and recommendation
+            as messages under "messages"
+        missing_by_category: Category -> missing skills with importance and
+            ats_impact, which "codes" results leave out
+    """
+    messages = gaps["messages"]
+    rendered = {
+        "summary": render_message(messages["summary"]),
+        "overall_impact": render_message(messages["overall_impact"]),
+    }
+    if "impact_level" in gaps:
+        rendered["impact_level"] = gaps["impact_level"]
+    rendered["recommendation"] = render_message(messages["recommendation"])
+    for field in ("missing_skills_count", "high_priority_gaps", "medium_priority_gaps", "low_priority_gaps"):
+        if field in gaps:
+            rendered[field] = gaps[field]
+    rendered["missing_by_category"] = missing_by_category
+    if "priority_breakdown" in gaps:
+        rendered["priority_breakdown"] = gaps["priority_breakdown"]
+    return rendered
+
+
+def _strength_lines(enhanced_strengths: Dict[str, Any]) -> List[str]:
+    lines = list(_section("✓ YOUR STRENGTHS",
+                          enhanced_strengths.get('summary', 'Your resume has several strong points.'),
+                          "",
+                          "KEY STRENGTHS:"))
+    for i, tip in enumerate(enhanced_strengths['individual_tips'][:8], 1):
+        lines.append(f"  {i}. {tip}")
+    lines.append("")
+    return lines
+
+
+def _weakness_lines(resume_weaknesses: List[Dict[str, str]]) -> List[str]:
+    lines = list(_section("⚠ AREAS FOR IMMEDIATE IMPROVEMENT",
+                          f"Identified {len(resume_weaknesses)} issues that need attention:",
+                          ""))
+    for i, weakness in enumerate(resume_weaknesses[:10], 1):
+        lines.append(f"{i}. ISSUE: {weakness.get('weakness', 'Issue identified')}")
+        lines.append(f"   IMPACT: {weakness.get('impact', 'May affect ATS performance')}")
+        lines.append(f"   FIX: {weakness.get('fix', 'Address this issue')}")
+        lines.append("")
+    return lines
+
+
+def _skill_gap_lines(skill_gaps: Dict[str, Any]) -> List[str]:
+    lines = list(_section("📊 SKILL GAP ANALYSIS",
+                          f"SUMMARY: {skill_gaps.get('summary', 'Analysis complete')}",
+                          "",
+                          f"ATS IMPACT: {skill_gaps.get('overall_impact', 'Variable impact based on role')}",
+                          ""))
+
+    # Show high priority gaps prominently
+    if skill_gaps.get('high_priority_gaps'):
+        lines.append("🎯 HIGH-PRIORITY MISSING SKILLS (Learn These First):")
+        for skill in skill_gaps['high_priority_gaps'][:8]:
+            lines.append(f"  • {skill}")
+        lines.append("")
+
+    # Show medium priority if space
+    if skill_gaps.get('medium_priority_gaps') and len(skill_gaps.get('high_priority_gaps', [])) < 5:
+        lines.append("📈 MEDIUM-PRIORITY MISSING SKILLS (Consider Learning):")
+        for skill in skill_gaps['medium_priority_gaps'][:5]:
+            lines.append(f"  • {skill}")
+        lines.append("")
+
+    lines.append("RECOMMENDATION:")
+    lines.append(skill_gaps.get('recommendation', 'Continue skill development'))
+    lines.append("")
+    return lines
+
+
+def render_advice(
+    messages: List[Message],
+    enhanced_strengths: Dict[str, Any],
+    resume_weaknesses: List[Dict[str, str]],
+    skill_gaps: Dict[str, Any]
+) -> List[str]:
+    """
+    The ats_optimization_advice report for advice block messages.
+
+    The advice.strengths, advice.weaknesses and advice.skill_gaps blocks
+    list the already rendered enhanced_strengths, resume_weaknesses and
+    skill_gaps; every other block comes from its catalog template.
+
+    Returns:
+        List of report lines
+    """
+    sections = {
+        "advice.strengths": lambda: _strength_lines(enhanced_strengths),
+        "advice.weaknesses": lambda: _weakness_lines(resume_weaknesses),
+        "advice.skill_gaps": lambda: _skill_gap_lines(skill_gaps),
+    }
+    advice = [RULE, "ATS RESUME ANALYSIS REPORT", RULE, ""]
+    for message in messages:
+        code = message[0]
+        advice.extend(sections[code]() if code in sections else render_message(message))
+    advice.extend(["", RULE, "End of ATS Analysis Report", RULE])
+    return advice
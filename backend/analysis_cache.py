@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+Content-addressed cache for resume analysis results.
+
+Results are keyed by the SHA-256 of the PDF bytes together with the analyzer
+version, a fingerprint of the rule tables (SKILL_DB / SKILL_DETAILS) and a
+fingerprint of the options that change the result (such as extraction limits),
+so an unchanged resume is answered from disk while any change to the analyzer,
+its rules or those options gets a fresh result.
+
+Two interchangeable on-disk backends are provided, both bounded by total size
+with least-recently-used eviction:
+
+    SQLiteCacheBackend     - a single SQLite file (good default, safe across processes)
+    DirectoryCacheBackend  - one JSON file per entry under a directory
+
+Usage:
+    from analysis_cache import open_cache
+
+    cache = open_cache("cache/ats.db", max_bytes=256 * 1024 * 1024)
+    key = cache.make_key(pdf_bytes, "1.0.0", rules_fingerprint, kind="analyze_resume", options=options_fingerprint)
+    result = cache.get(key)
+    if result is None:
+        result = expensive_analysis()
+        cache.put(key, result)
+"""
+
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024  # 256 MB
+
+
+# ============================================================================
+# BACKENDS
+# ============================================================================
+
+class SQLiteCacheBackend:
+    """
+    Cache entries stored in one SQLite table. Every read bumps the entry's
+    access time; writes evict the least recently used entries until the total
+    stored size fits within max_bytes.
+    """
+
+    def __init__(self, db_path: str, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.db_path = str(db_path)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            " key TEXT PRIMARY KEY,"
+            " value BLOB NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " last_access REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS entries_lru ON entries (last_access)")
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            self._conn.execute("UPDATE entries SET last_access = ? WHERE key = ?", (time.time(), key))
+            self._conn.commit()
+            return row[0]
+
+    def put(self, key: str, value: bytes) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries (key, value, size, last_access) VALUES (?, ?, ?, ?)",
+                (key, sqlite3.Binary(value), len(value), time.time())
+            )
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self) -> None:
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        rows = self._conn.execute("SELECT key, size FROM entries ORDER BY last_access ASC").fetchall()
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+            total -= size
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class DirectoryCacheBackend:
+    """
+    Cache entries stored as files under a directory, fanned out by key prefix.
+    File modification time doubles as the LRU access time.
+    """
+
+    def __init__(self, root: str, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._total = sum(p.stat().st_size for p in self._entries())
+
+    def _entries(self):
+        return self.root.glob("*/*.json")
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[bytes]:
+        path = self._path(key)
+        try:
+            data = path.read_bytes()
+            os.utime(path, None)
+        except FileNotFoundError:
+            return None
+        return data
+
+    def put(self, key: str, value: bytes) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+
+        with self._lock:
+            old_size = path.stat().st_size if path.exists() else 0
+            tmp_path.write_bytes(value)
+            os.replace(tmp_path, path)
+            self._total += len(value) - old_size
+            if self._total > self.max_bytes:
+                self._evict()
+
+    def _evict(self) -> None:
+        # Re-scan so entries written by other processes are accounted for
+        entries = []
+        for p in self._entries():
+            try:
+                st = p.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((st.st_mtime, st.st_size, p))
+        entries.sort()
+
+        self._total = sum(size for _, size, _ in entries)
+        for _, size, p in entries:
+            if self._total <= self.max_bytes:
+                break
+            try:
+                p.unlink()
+            except FileNotFoundError:
+                pass
+            self._total -= size
+
+    def close(self) -> None:
+        pass
+
+
+# ============================================================================
+# CACHE FRONT-END
+# ============================================================================
+
+class AnalysisCache:
+    """Serializes analysis results to and from a byte-oriented backend."""
+
+    def __init__(self, backend):
+        self.backend = backend
+
+    @staticmethod
+    def make_key(data: bytes, version: str, rules_fingerprint: str, kind: str = "analyze_resume",
+                 options: str = "") -> str:
+        """
+        Build the cache key for a document.
+
+        Args:
+            data: Raw PDF bytes
+            version: Analyzer version string
+            rules_fingerprint: Hash of the rule tables the result depends on
+            kind: Which pipeline produced the result (the CLI and the Node.js
+                wrapper emit different result shapes)
+            options: Fingerprint of the options the result depends on, such
+                as extraction limits (a page cap gives a different result)
+        """
+        digest = hashlib.sha256()
+        digest.update(data)
+        return AnalysisCache.content_key(digest.hexdigest(), version, rules_fingerprint, kind=kind, options=options)
+
+    @staticmethod
+    def content_key(content_hash: str, version: str, rules_fingerprint: str, kind: str = "analyze_resume",
+                    options: str = "") -> str:
+        """
+        The cache key make_key gives a document whose bytes have SHA-256
+        hex digest content_hash, for looking up another document's result.
+        """
+        return hashlib.sha256(
+            f"{kind}\0{version}\0{rules_fingerprint}\0{options}\0{content_hash}".encode("utf-8")
+        ).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        data = self.backend.get(key)
+        if data is None:
+            return None
+        try:
+            return json.loads(data.decode("utf-8"))
+        except (UnicodeDecodeError, json.JSONDecodeError):
+            return None
+
+    def put(self, key: str, result: Dict[str, Any]) -> None:
+        self.backend.put(key, json.dumps(result, ensure_ascii=False).encode("utf-8"))
+
+    def close(self) -> None:
+        self.backend.close()
+
+
+def open_cache(location: str, max_bytes: int = DEFAULT_MAX_BYTES) -> AnalysisCache:
+    """
+    Open a cache at `location`. Paths ending in .db, .sqlite or .sqlite3 use
+    the SQLite backend; anything else is treated as a cache directory.
+    """
+    if Path(location).suffix.lower() in (".db", ".sqlite", ".sqlite3"):
+        backend = SQLiteCacheBackend(location, max_bytes=max_bytes)
+    else:
+        backend = DirectoryCacheBackend(location, max_bytes=max_bytes)
+    return AnalysisCache(backend)
@@ -5,63 +5,199 @@ Called from Node.js backend via child_process.
 
 Usage:
     python analyze_resume_wrapper.py <path_to_resume.pdf>
-
-Outputs JSON to stdout for Node.js to parse.
+    python analyze_resume_wrapper.py --serve [--jobs N]
+    python analyze_resume_wrapper.py --serve --socket /tmp/ats.sock
+    python analyze_resume_wrapper.py <path_to_resume.pdf> --cache cache/ats.db
+    python analyze_resume_wrapper.py - --name resume.pdf < resume.pdf
+    python analyze_resume_wrapper.py <path_to_resume.pdf> --stage-deadline 20 --max-memory-mb 1024
+    python analyze_resume_wrapper.py <path_to_resume.pdf> --profile score
+    python analyze_resume_wrapper.py <path_to_resume.pdf> --advice-format codes
+    python analyze_resume_wrapper.py <path_to_resume.pdf> --cache cache/ats.db --near-duplicates cache/cohort.ndx
+    python analyze_resume_wrapper.py --serve --wire-format ats-wire
+    python analyze_resume_wrapper.py --wire-schema
+
+With "-" as the path the PDF is read from stdin, raw or base64-encoded, and
+parsed in memory; nothing is written to disk.
+
+Outputs JSON to stdout for Node.js to parse. In --serve mode the process stays
+alive and answers newline-delimited JSON jobs (see WORKER MODE below). With
+--wire-format ats-wire every result is written as a length-prefixed frame with
+interned skill IDs instead (see wire_format.py); --wire-schema prints the
+schema a reader needs to decode them.
+
+Dependencies:
+    pip install pdfplumber
+    pip install numpy    (optional: role suggestions as one matrix product,
+                          see role_matching.py; matched role by role without it)
 """
 
 import sys
 import json
 import os
 import io
-
-# Force UTF-8 encoding on stdout/stderr to avoid Windows charmap errors
-sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
-sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
+import re
+import argparse
+import hashlib
+import socket
+import socketserver
+import threading
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+# Force UTF-8 encoding on stdout/stderr to avoid Windows charmap errors.
+# Reconfigured in place, so importing this module (benchmarks, tests) does not
+# replace streams that others hold
+sys.stdout.reconfigure(encoding='utf-8', errors='replace')
+sys.stderr.reconfigure(encoding='utf-8', errors='replace')
 
 # Add the directory of this script to the path so we can import the analyzer
 script_dir = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, script_dir)
 
 from ats_resume_analyzer import (
-    extract_resume_text,
-    extract_skills,
-    detect_sections,
-    calculate_ats_score,
-    skill_gap_analysis,
-    get_ats_optimization_advice,
+    load_resume_artifact,
+    decode_pdf_payload,
+    as_document,
+    cache_lookup,
+    _get_worker_cache,
+    _get_worker_near_duplicates,
+    document_hash,
+    near_duplicate_lookup,
+    text_cache_lookup,
+    open_near_duplicate_index,
+    add_near_duplicate_arguments,
+    NEAR_DUPLICATE_THRESHOLD,
+    start_instrumentation,
+    annotate_result,
+    PreflightError,
+    PREFLIGHT_MESSAGES,
+    is_cacheable,
+    LimitExceeded,
+    DEFAULT_POLICY,
+    add_extraction_arguments,
+    extraction_options_from_args,
+    add_policy_arguments,
+    policy_from_args,
+    add_profile_argument,
+    add_advice_format_argument,
+    check_advice_format,
+    profile_stages,
+    profile_cache_kind,
+    run_stages,
+    stage_fields,
+    STAGE_DEPENDENCIES,
+    STAGE_RUNNERS,
+    ANALYSIS_PROFILES,
+    DEFAULT_PROFILE,
+    DEFAULT_ADVICE_FORMAT,
     SKILL_DB,
-    SKILL_DETAILS
+    SKILL_DETAILS,
+    DEFAULT_SKILL_DETAIL,
+    ANALYSIS_VERSION,
+    RULES_FINGERPRINT,
+    DATE_PATTERN,
+    STDIN_PATH,
+    BUFFER_NAME
 )
+from wire_format import WireSchema, WIRE_FORMAT
+
+ROLE_SKILL_MAP = {
+    "Full Stack Developer": ["javascript", "react", "node", "nodejs", "express", "mongodb", "html", "css", "sql"],
+    "Frontend Developer": ["react", "angular", "vue", "html", "css", "javascript", "typescript", "tailwind", "bootstrap"],
+    "Backend Developer": ["node", "nodejs", "express", "django", "flask", "spring", "java", "python", "sql"],
+    "Data Scientist": ["python", "machine learning", "pandas", "numpy", "tensorflow", "pytorch", "data analysis", "statistics"],
+    "Data Analyst": ["python", "sql", "excel", "tableau", "power bi", "data analysis", "pandas", "data visualization"],
+    "ML Engineer": ["python", "tensorflow", "pytorch", "machine learning", "deep learning", "scikit-learn", "keras"],
+    "DevOps Engineer": ["docker", "kubernetes", "jenkins", "terraform", "ansible", "aws", "linux", "ci/cd", "git"],
+    "Cloud Engineer": ["aws", "azure", "gcp", "docker", "kubernetes", "terraform", "serverless", "cloud computing"],
+    "Mobile App Developer": ["android", "ios", "react native", "flutter", "kotlin", "swift", "mobile development"],
+    "Cybersecurity Analyst": ["security", "cybersecurity", "penetration testing", "encryption", "firewall", "owasp"],
+    "QA / Test Engineer": ["testing", "selenium", "cypress", "jest", "pytest", "junit", "qa", "quality assurance"],
+    "Software Engineer": ["python", "java", "javascript", "c++", "git", "sql", "docker", "agile"],
+    "AI/NLP Engineer": ["nlp", "python", "deep learning", "transformers", "hugging face", "tensorflow", "pytorch"],
+    "Database Administrator": ["sql", "mysql", "postgresql", "mongodb", "redis", "oracle", "elasticsearch"],
+    "UI/UX Developer": ["html", "css", "javascript", "react", "figma", "bootstrap", "tailwind", "sass"],
+}
+
+# Results from this wrapper also depend on the role map, so its cache entries
+# are keyed on both rule sets
+WRAPPER_RULES_FINGERPRINT = hashlib.sha256(
+    json.dumps([RULES_FINGERPRINT, ROLE_SKILL_MAP], sort_keys=True).encode("utf-8")
+).hexdigest()[:16]
+
+
+# Role matcher over ROLE_SKILL_MAP, built on first use. It needs numpy;
+# without it (False) roles are matched one by one in suggest_roles_python
+_role_matcher = None
+
+
+def get_role_matcher():
+    """The shared RoleMatcher for ROLE_SKILL_MAP, or None if numpy is not installed."""
+    global _role_matcher
+    if _role_matcher is None:
+        try:
+            from role_matching import RoleMatcher
+        except ImportError:
+            _role_matcher = False
+        else:
+            _role_matcher = RoleMatcher(ROLE_SKILL_MAP)
+    return _role_matcher or None
+
+
+# Output encodings: one JSON document (or line, in worker mode) per result, or
+# length-prefixed ats-wire frames
+WIRE_FORMATS = ["json", WIRE_FORMAT]
+
+# Wire schema over every skill a result can name, built on first use
+_wire_schema = None
+
+
+def get_wire_schema():
+    """The WireSchema for SKILL_DB, SKILL_DETAILS and ROLE_SKILL_MAP."""
+    global _wire_schema
+    if _wire_schema is None:
+        skills = [skill for category_skills in SKILL_DB.values() for skill in category_skills]
+        # missing_by_category reports skills without details with the default
+        details = {skill: SKILL_DETAILS.get(skill, DEFAULT_SKILL_DETAIL) for skill in skills}
+        skills += [skill for role_skills in ROLE_SKILL_MAP.values() for skill in role_skills]
+        _wire_schema = WireSchema(skills, details)
+    return _wire_schema
+
+
+def encode_response(response, wire_format="json"):
+    """One result as written to stdout or a socket: a JSON line or an ats-wire frame."""
+    if wire_format == WIRE_FORMAT:
+        return get_wire_schema().pack(response)
+    return (json.dumps(response, ensure_ascii=False) + "\n").encode("utf-8")
+
 
 def suggest_roles(skills_found):
     """
     Suggest suitable job roles based on the skills found in the resume.
+    Returns up to 8 roles matching at least 30% of their skills, best first.
     """
-    role_skill_map = {
-        "Full Stack Developer": ["javascript", "react", "node", "nodejs", "express", "mongodb", "html", "css", "sql"],
-        "Frontend Developer": ["react", "angular", "vue", "html", "css", "javascript", "typescript", "tailwind", "bootstrap"],
-        "Backend Developer": ["node", "nodejs", "express", "django", "flask", "spring", "java", "python", "sql"],
-        "Data Scientist": ["python", "machine learning", "pandas", "numpy", "tensorflow", "pytorch", "data analysis", "statistics"],
-        "Data Analyst": ["python", "sql", "excel", "tableau", "power bi", "data analysis", "pandas", "data visualization"],
-        "ML Engineer": ["python", "tensorflow", "pytorch", "machine learning", "deep learning", "scikit-learn", "keras"],
-        "DevOps Engineer": ["docker", "kubernetes", "jenkins", "terraform", "ansible", "aws", "linux", "ci/cd", "git"],
-        "Cloud Engineer": ["aws", "azure", "gcp", "docker", "kubernetes", "terraform", "serverless", "cloud computing"],
-        "Mobile App Developer": ["android", "ios", "react native", "flutter", "kotlin", "swift", "mobile development"],
-        "Cybersecurity Analyst": ["security", "cybersecurity", "penetration testing", "encryption", "firewall", "owasp"],
-        "QA / Test Engineer": ["testing", "selenium", "cypress", "jest", "pytest", "junit", "qa", "quality assurance"],
-        "Software Engineer": ["python", "java", "javascript", "c++", "git", "sql", "docker", "agile"],
-        "AI/NLP Engineer": ["nlp", "python", "deep learning", "transformers", "hugging face", "tensorflow", "pytorch"],
-        "Database Administrator": ["sql", "mysql", "postgresql", "mongodb", "redis", "oracle", "elasticsearch"],
-        "UI/UX Developer": ["html", "css", "javascript", "react", "figma", "bootstrap", "tailwind", "sass"],
-    }
+    matcher = get_role_matcher()
+    if matcher is None:
+        return suggest_roles_python(skills_found)
+    return matcher.match(skills_found)
+
+
+def suggest_roles_cohort(skills_found_list):
+    """
+    suggest_roles for many resumes at once (one list of roles per resume),
+    scoring the whole cohort against every role in a single matrix product.
+    """
+    matcher = get_role_matcher()
+    if matcher is None:
+        return [suggest_roles_python(skills_found) for skills_found in skills_found_list]
+    return matcher.match_cohort(skills_found_list)
+
 
-    all_skills = []
-    for category_skills in skills_found.values():
-        all_skills.extend([s.lower() for s in category_skills])
-    all_skills_set = set(all_skills)
+def suggest_roles_python(skills_found):
+    """suggest_roles without numpy: each role's skills intersected with the resume's."""
+    all_skills_set = {s.lower() for category_skills in skills_found.values() for s in category_skills}
 
     suggested = []
-    for role, required_skills in role_skill_map.items():
+    for role, required_skills in ROLE_SKILL_MAP.items():
         match_count = len(all_skills_set.intersection(set(required_skills)))
         total_required = len(required_skills)
         if total_required > 0:
@@ -73,8 +209,8 @@ def suggest_roles(skills_found):
             suggested.append({
                 "role": role,
                 "match_percentage": round(match_pct, 1),
-                "matched_skills": sorted(list(all_skills_set.intersection(set(required_skills)))),
-                "missing_skills": sorted(list(set(required_skills) - all_skills_set)),
+                "matched_skills": sorted(all_skills_set.intersection(set(required_skills))),
+                "missing_skills": sorted(set(required_skills) - all_skills_set),
             })
 
     # Sort by match percentage descending
@@ -82,61 +218,45 @@ def suggest_roles(skills_found):
     return suggested[:8]  # Return top 8 suggestions
 
 
+# Experience and project entry parsing
+BULLET_CHARS = ('•', '-', '●', '▪', '*', '➢', '✓')
+
+# Substrings that often indicate a job title
+TITLE_KEYWORDS = [
+    "analyst", "intern", "developer", "engineer", "manager", "lead",
+    "internship", "consultant", "specialist", "coordinator", "officer", "associate", "trainee"
+]
+TITLE_KEYWORD_PATTERN = re.compile("|".join(map(re.escape, TITLE_KEYWORDS)))
+
+# Substrings that should NEVER be in a (short) project title
+FORBIDDEN_TITLES = ["technical", "skills", "core", "certifications", "education", "summary", "awards"]
+FORBIDDEN_TITLE_PATTERN = re.compile("|".join(map(re.escape, FORBIDDEN_TITLES)))
+
+
 def extract_experience_entries(resume_text):
     """
     Overhauled experience extraction:
     Isolates the experience block first, then parses entries.
     Handles sidebar interleaving by being smarter about section boundaries.
+    The block is the "experience" span of the document's section segmenter
+    (see SECTION_SPAN_RULES), shared with extract_projects.
     """
-    import re
-    
-    text = resume_text
     experiences = []
-    
-    lines = [l.strip() for l in text.split('\n') if l.strip()]
-    exp_start = -1
-    
-    # 1. Identify start of Experience section
-    for i, line in enumerate(lines):
-        if re.search(r'\b(?:experience|work history|employment|professional background|career history)\w*\b', line, re.IGNORECASE):
-            # Header check: Should be relatively short
-            if len(line.split()) < 5:
-                exp_start = i + 1
-                break
-                
-    if exp_start == -1:
+
+    exp_lines = as_document(resume_text).section_lines("experience")
+    if not exp_lines:
         return []
 
-    # 2. Extract until next major section header
-    exp_lines = []
-    stop_headers = r'\b(?:education|skills|projects|certifications|awards|references|summary|contact|hobbies|languages|technical)\b'
-    
-    for line in lines[exp_start:]:
-        # If we see a very likely header for the next section, stop
-        if len(line) < 40 and re.search(stop_headers, line, re.IGNORECASE):
-            # Ensure it's not just a word in a sentence
-            if line.isupper() or len(line.split()) < 4:
-                break
-        exp_lines.append(line)
-
-    # 3. Parse the collected lines into entries
+    # Parse the collected lines into entries
     current_entry = None
-    bullet_chars = ('•', '-', '●', '▪', '*', '➢', '✓')
-    
-    # Keywords that often indicate a job title
-    title_keywords = [
-        "analyst", "intern", "developer", "engineer", "manager", "lead", 
-        "internship", "consultant", "specialist", "coordinator", "officer", "associate", "trainee"
-    ]
-    
-    date_pattern = r'(?:\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*[\s,./]*\d{2,4})|(?:\d{2,4}[\s,./-]+\d{0,4})|(?:Present|Current|Now)'
+    bullet_chars = BULLET_CHARS
 
     for line in exp_lines:
         is_bullet = line.startswith(bullet_chars)
         # Check if line contains a date pattern
-        has_date = re.search(date_pattern, line, re.IGNORECASE)
+        has_date = DATE_PATTERN.search(line)
         # Check if line contains title keywords
-        has_title_kw = any(kw in line.lower() for kw in title_keywords)
+        has_title_kw = TITLE_KEYWORD_PATTERN.search(line.lower())
         
         # A new entry usually starts with a title keyword or a line that looks like Title | Date
         # But if it's just a date line and we already have a title, don't start a new entry
@@ -180,43 +300,16 @@ def extract_projects(resume_text):
     Extremely strict project extraction:
     Only considers lines with '|' as new project titles.
     Everything else is a bullet or detail.
+    The lines come from the "projects" span of the section segmenter.
     """
-    import re
-
-    text = resume_text
     projects = []
 
-    # Split into lines
-    lines = [l.strip() for l in text.split('\n') if l.strip()]
-    proj_section_start = -1
-    
-    # 1. Find the Projects section
-    for i, line in enumerate(lines):
-        if re.search(r'\b(?:projects|personal projects|academic projects|key projects|portfolio)\b', line, re.IGNORECASE):
-            proj_section_start = i + 1
-            break
-            
-    if proj_section_start == -1:
+    proj_lines = as_document(resume_text).section_lines("projects")
+    if not proj_lines:
         return []
 
-    # 2. Extract lines until the next major section
-    proj_lines = []
-    # Major section headers to stop at
-    stop_headers = r'\b(?:experience|work history|employment|education|skills|certifications|awards|references|summary|contact|hobbies|languages|technical)\w*\b'
-    
-    for line in lines[proj_section_start:]:
-        # If we hit another major section, stop
-        if len(line) < 40 and re.search(stop_headers, line, re.IGNORECASE):
-            # Only stop if it's likely a header (short, capitalized or all caps)
-            if line.isupper() or len(line.split()) < 4:
-                break
-        proj_lines.append(line)
-
-    bullet_chars = ('•', '-', '●', '▪', '*', '➢', '✓')
+    bullet_chars = BULLET_CHARS
     current_project = None
-    
-    # Words that should NEVER be project titles
-    forbidden_titles = ["technical", "skills", "core", "certifications", "education", "summary", "awards"]
 
     for line in proj_lines:
         lower_line = line.lower()
@@ -225,7 +318,7 @@ def extract_projects(resume_text):
         # PRECISE TITLE DETECTION:
         # In this professional format, titles MUST have a pipe '|'
         # Also ensure we aren't picking up a stray header
-        is_forbidden = any(word in lower_line for word in forbidden_titles) and len(line.split()) < 4
+        is_forbidden = FORBIDDEN_TITLE_PATTERN.search(lower_line) and len(line.split()) < 4
         is_new_title = '|' in line and not is_bullet and not is_forbidden
 
         if is_new_title:
@@ -258,93 +351,568 @@ def extract_projects(resume_text):
     return projects
 
 
-def main():
-    if len(sys.argv) < 2:
-        print(json.dumps({
+# The analyzer's stage graph plus the wrapper's own stages
+WRAPPER_STAGE_DEPENDENCIES = {
+    **STAGE_DEPENDENCIES,
+    "roles": ["skills"],
+    "experience": [],
+    "projects": [],
+}
+WRAPPER_STAGE_RUNNERS = {
+    **STAGE_RUNNERS,
+    "roles": lambda doc, done: suggest_roles(done["skills"]),
+    "experience": lambda doc, done: extract_experience_entries(doc),
+    "projects": lambda doc, done: extract_projects(doc),
+}
+# Same profiles as the analyzer; "skills" also suggests roles
+WRAPPER_PROFILES = {
+    "score": ANALYSIS_PROFILES["score"],
+    "skills": ANALYSIS_PROFILES["skills"] + ["roles"],
+    "full": list(WRAPPER_STAGE_DEPENDENCIES),
+}
+
+
+def run_analysis(file_path, cache=None, use_sidecar=False, extract_options=None, instrument=False,
+                 data=None, policy=None, profile=DEFAULT_PROFILE, advice_format=DEFAULT_ADVICE_FORMAT,
+                 near_duplicates=None, near_duplicate_threshold=NEAR_DUPLICATE_THRESHOLD):
+    """
+    Run the full analysis pipeline on a single resume and build the result dict.
+    Raises on failure; callers are responsible for shaping the error output.
+    When a cache is given, unchanged PDFs are answered from it; with
+    use_sidecar, extracted text is stored next to the PDF and reused.
+    extract_options sets the extraction page cap, word budget and workers.
+    With instrument, metadata.instrumentation reports per-stage timings and
+    counters for this run. data is the document itself (raw or base64 PDF
+    bytes), parsed in memory; file_path then only names it in the metadata.
+    policy (default: DEFAULT_POLICY) bounds the job: a limit hit during
+    extraction gives a "partial" result, any other raises LimitExceeded.
+    profile ("score", "skills" or "full", see WRAPPER_PROFILES) picks the
+    outputs; only the stages they depend on run, and only their fields are
+    in the result. advice_format "codes" reports strengths, weaknesses, skill
+    gaps and advice as compact messages (see ats_resume_analyzer.render_result).
+    With a near_duplicates index (see near_duplicates.py) every analyzed
+    resume is fingerprinted, and one at least near_duplicate_threshold
+    similar to an analyzed resume gets metadata.near_duplicate_of; with a
+    cache, one with exactly the text of an analyzed resume reuses its result.
+    """
+    policy = policy or DEFAULT_POLICY
+    stages = profile_stages(profile, WRAPPER_PROFILES, WRAPPER_STAGE_DEPENDENCIES)
+    check_advice_format(advice_format)
+    instrumentation = start_instrumentation(file_path, instrument, policy)
+
+    if data is not None:
+        data = decode_pdf_payload(data)
+
+    kind = profile_cache_kind("wrapper", profile, advice_format)
+    extract_options = policy.extract_options(extract_options)
+    content_hash = document_hash(file_path, data) if near_duplicates is not None else None
+    with instrumentation.stage("cache_lookup"):
+        cache_key, cached = cache_lookup(
+            cache, file_path, kind=kind, rules_fingerprint=WRAPPER_RULES_FINGERPRINT, data=data,
+            content_hash=content_hash, extract_options=extract_options
+        )
+    if cached is not None:
+        if instrument:
+            cached["metadata"]["instrumentation"] = instrumentation.report()
+        return cached
+
+    # Extract text from PDF (or its stored sidecar)
+    with instrumentation.stage("extract", check_deadline=False):
+        artifact = load_resume_artifact(
+            file_path, use_sidecar=use_sidecar, extract_options=extract_options, data=data
+        )
+    instrumentation.counters["page_count"] = artifact.get("page_count")
+
+    text_key = signature = duplicate_of = result = None
+    if near_duplicates is not None:
+        with instrumentation.stage("near_duplicate_lookup"):
+            text_key, result = text_cache_lookup(
+                cache, artifact, file_path, kind=kind, rules_fingerprint=WRAPPER_RULES_FINGERPRINT
+            )
+            signature, duplicate_of = near_duplicate_lookup(
+                near_duplicates, artifact, content_hash, threshold=near_duplicate_threshold
+            )
+    if result is None:
+        result = score_artifact(artifact, file_path, stages, instrumentation, profile, advice_format)
+        if text_key is not None and is_cacheable(result):
+            cache.put(text_key, result)
+
+    if cache_key is not None and is_cacheable(result):
+        cache.put(cache_key, result)
+    if signature is not None:
+        near_duplicates.add(content_hash, signature, path=file_path)
+    # Attached after caching: the match depends on what was indexed before
+    if duplicate_of is not None:
+        result["metadata"]["near_duplicate_of"] = duplicate_of
+    # Attached after caching: timings describe this run, not the cached result
+    if instrument:
+        instrumentation.counters["char_count"] = len(artifact["text"])
+        instrumentation.counters["word_count"] = result.get("word_count")
+        result["metadata"]["instrumentation"] = instrumentation.report()
+    return result
+
+
+def score_artifact(artifact, file_path, stages, instrumentation, profile, advice_format):
+    """Run the profile's stages over an extraction artifact and build the result dict."""
+    # Tokenize once; every scorer below shares these views
+    doc = as_document(artifact["text"])
+
+    # Skills, score, sections, gaps, advice, roles, experience and projects,
+    # as far as the profile needs them
+    done = run_stages(doc, stages, WRAPPER_STAGE_RUNNERS, instrumentation)
+
+    # Build the result from the stages that ran
+    with instrumentation.stage("render"):
+        result = {"success": True, **stage_fields(done, advice_format)}
+    for stage, field in (("sections", "sections_detected"), ("roles", "suggested_roles"),
+                         ("experience", "experience"), ("projects", "projects")):
+        if stage in done:
+            result[field] = done[stage]
+    result["word_count"] = doc.word_count
+    result["metadata"] = {
+        "file_path": file_path,
+        "file_name": os.path.basename(file_path),
+        "analysis_version": ANALYSIS_VERSION,
+        "profile": profile,
+        "advice_format": advice_format
+    }
+
+    annotate_result(result, artifact)
+    return result
+
+
+def error_result(e):
+    """Shape an exception into the error payload Node.js expects."""
+    result = {
+        "success": False,
+        "error": str(e),
+        "error_type": type(e).__name__,
+        "message": f"Analysis failed: {str(e)}"
+    }
+    if isinstance(e, LimitExceeded):
+        result["message"] = "Analysis stopped: the resume exceeded a resource limit."
+        result["limit_exceeded"] = e.details()
+    elif isinstance(e, PreflightError):
+        result["error_code"] = e.code
+        result["message"] = PREFLIGHT_MESSAGES[e.code]
+        result["preflight"] = e.report
+    return result
+
+
+# ============================================================================
+# WORKER MODE
+# ============================================================================
+#
+# A long-lived worker pays for the pdfplumber import and the module-level
+# setup once, then analyzes resumes as newline-delimited JSON jobs arrive:
+#
+#   -> {"id": "42", "file_path": "/path/to/resume.pdf"}
+#   <- {"id": "42", "success": true, "ats_score": 78, ...}
+#
+# A job may carry the document inline instead of a path, as base64 PDF bytes
+# with an optional name for the metadata:
+#
+#   -> {"id": "43", "pdf_base64": "JVBERi0xLjQK...", "file_name": "resume.pdf"}
+#
+# A job may also pick its own analysis profile, e.g. "profile": "score" for
+# bulk ranking (see WRAPPER_PROFILES), and its own "advice_format" ("codes"
+# for compact messages); otherwise the worker's --profile and
+# --advice-format apply.
+#
+# With --jobs > 1 jobs run in a pool of worker processes (extraction and
+# scoring are CPU-bound Python, so threads would serialize on the GIL); each
+# process opens the cache and near-duplicate index once. Every response
+# echoes the job's "id", so answers may come back out of order. With --wire-format ats-wire each response is a
+# length-prefixed frame rather than a line. A job of {"cmd": "ping"} answers {"id": ..., "pong": true}
+# and {"cmd": "shutdown"} stops the worker after in-flight jobs finish.
+
+def handle_job(job, analysis_options=None):
+    """
+    Process one decoded job and return the response dict (never raises).
+    analysis_options are keyword arguments for run_analysis (cache,
+    use_sidecar, extract_options, instrument, policy, near_duplicates) shared
+    by every job of the worker; a job may also ask for instrumentation with "instrument": true
+    and choose its own "profile" and "advice_format".
+    """
+    if not isinstance(job, dict):
+        return {
+            "id": None,
             "success": False,
-            "error": "No file path provided",
-            "message": "Usage: python analyze_resume_wrapper.py <path_to_resume.pdf>"
-        }))
-        sys.exit(1)
+            "error": "Job must be a JSON object",
+            "error_type": "ValueError",
+            "message": "Invalid job format."
+        }
+
+    job_id = job.get("id")
+    cmd = job.get("cmd", "analyze")
 
-    file_path = sys.argv[1]
+    if cmd == "ping":
+        return {"id": job_id, "success": True, "pong": True}
+
+    if cmd != "analyze":
+        return {
+            "id": job_id,
+            "success": False,
+            "error": f"Unknown command: {cmd}",
+            "error_type": "ValueError",
+            "message": "Supported commands are: analyze, ping, shutdown."
+        }
+
+    options = dict(analysis_options or {})
+    if job.get("instrument"):
+        options["instrument"] = True
+    if job.get("profile"):
+        options["profile"] = job["profile"]
+    if job.get("advice_format"):
+        options["advice_format"] = job["advice_format"]
+
+    if job.get("pdf_base64"):
+        try:
+            response = run_analysis(job.get("file_name") or BUFFER_NAME, data=job["pdf_base64"], **options)
+        except Exception as e:
+            response = error_result(e)
+        return {"id": job_id, **response}
+
+    file_path = job.get("file_path")
+    if not file_path:
+        return {
+            "id": job_id,
+            "success": False,
+            "error": "No file path provided",
+            "error_type": "ValueError",
+            "message": "Each job needs a 'file_path' or 'pdf_base64'."
+        }
 
     if not os.path.exists(file_path):
-        print(json.dumps({
+        return {
+            "id": job_id,
             "success": False,
             "error": f"File not found: {file_path}",
+            "error_type": "FileNotFoundError",
             "message": "The specified resume file does not exist."
-        }))
-        sys.exit(1)
+        }
 
     try:
-        # Extract text from PDF
-        resume_text = extract_resume_text(file_path)
+        response = run_analysis(file_path, **options)
+    except Exception as e:
+        response = error_result(e)
 
-        # Extract skills
-        skills_found = extract_skills(resume_text)
+    return {"id": job_id, **response}
 
-        # Calculate ATS score
-        ats_score, enhanced_strengths, resume_weaknesses, score_breakdown = calculate_ats_score(
-            resume_text, skills_found
-        )
 
-        # Detect sections
-        sections = detect_sections(resume_text)
+def _parse_job_line(line):
+    """Decode one NDJSON line; returns (job, error_response)."""
+    try:
+        return json.loads(line), None
+    except json.JSONDecodeError as e:
+        return None, {
+            "id": None,
+            "success": False,
+            "error": f"Invalid JSON: {e}",
+            "error_type": "JSONDecodeError",
+            "message": "Each job must be a single line of JSON."
+        }
 
-        # Skill gap analysis
-        skill_gaps = skill_gap_analysis(skills_found)
 
-        # Get optimization advice
-        advice = get_ats_optimization_advice(
-            ats_score, enhanced_strengths, resume_weaknesses, skill_gaps
-        )
+def worker_analysis_options(settings):
+    """
+    run_analysis keyword arguments from picklable worker settings: the
+    analysis options with "cache_location", "cache_max_bytes" and
+    "near_duplicates_location" in place of the opened cache and index. Each
+    process opens those once and reuses them.
+    """
+    options = dict(settings or {})
+    options["cache"] = _get_worker_cache(options.pop("cache_location", None), options.pop("cache_max_bytes", 0))
+    options["near_duplicates"] = _get_worker_near_duplicates(options.pop("near_duplicates_location", None))
+    return options
 
-        # Suggest roles based on skills
-        suggested_roles = suggest_roles(skills_found)
-
-        # Extract experience entries
-        experience = extract_experience_entries(resume_text)
-
-        # Extract projects
-        projects = extract_projects(resume_text)
-
-        # Count total skills
-        total_skills = sum(len(v) for v in skills_found.values())
-
-        # Build comprehensive result
-        result = {
-            "success": True,
-            "ats_score": ats_score,
-            "score_breakdown": score_breakdown,
-            "skills_found": skills_found,
-            "total_skills_found": total_skills,
-            "sections_detected": sections,
-            "skill_gaps": skill_gaps,
-            "enhanced_strengths": enhanced_strengths,
-            "resume_weaknesses": resume_weaknesses,
-            "ats_optimization_advice": advice,
-            "suggested_roles": suggested_roles,
-            "experience": experience,
-            "projects": projects,
-            "word_count": len(resume_text.split()),
-            "metadata": {
-                "file_path": file_path,
-                "file_name": os.path.basename(file_path),
-                "analysis_version": "1.0.0"
-            }
-        }
 
-        # Output JSON to stdout
-        print(json.dumps(result, ensure_ascii=False))
+# Options of a pool process, set once by its initializer
+_pool_options = None
 
-    except Exception as e:
-        print(json.dumps({
+
+def _init_pool_process(settings):
+    global _pool_options
+    _pool_options = worker_analysis_options(settings)
+
+
+def _handle_pooled_job(job):
+    return handle_job(job, _pool_options)
+
+
+class JobRunner:
+    """
+    The executor jobs run on, shared by every stream a server reads. settings
+    are the worker settings (see worker_analysis_options). With jobs > 1 the
+    jobs run in that many worker processes, otherwise one at a time in a
+    worker thread; either way at most `jobs` run at once, however many
+    streams submit them.
+    """
+
+    def __init__(self, jobs=1, settings=None):
+        if jobs > 1:
+            self.executor = ProcessPoolExecutor(max_workers=jobs, initializer=_init_pool_process,
+                                                initargs=(settings,))
+            self.options = None
+        else:
+            self.executor = ThreadPoolExecutor(max_workers=1)
+            self.options = worker_analysis_options(settings)
+
+    def submit(self, job):
+        if self.options is None:
+            return self.executor.submit(_handle_pooled_job, job)
+        return self.executor.submit(handle_job, job, self.options)
+
+    def shutdown(self):
+        self.executor.shutdown(wait=True)
+
+
+def serve_stream(reader, write, runner, wire_format="json"):
+    """
+    Read NDJSON jobs from `reader` until EOF or a shutdown command, run them
+    on `runner` (a JobRunner) and hand each encoded response (see
+    encode_response) to `write` as bytes. Responses are written as soon as
+    each job completes, so with several workers they can arrive out of order.
+    Returns once every job read from this stream has been answered.
+    """
+    write_lock = threading.Lock()
+    answered = threading.Condition()
+    outstanding = 0
+
+    def emit(response):
+        data = encode_response(response, wire_format)
+        with write_lock:
+            write(data)
+
+    def emit_result(future, job_id):
+        nonlocal outstanding
+        try:
+            response = future.result()
+        except Exception as e:
+            # The worker process itself died (e.g. crashed inside the PDF parser)
+            response = {"id": job_id, **error_result(e)}
+        try:
+            emit(response)
+        finally:
+            with answered:
+                outstanding -= 1
+                answered.notify_all()
+
+    shutdown_job = None
+
+    for raw in reader:
+        raw = raw.strip()
+        if not raw:
+            continue
+
+        job, parse_error = _parse_job_line(raw)
+        if parse_error:
+            emit(parse_error)
+            continue
+
+        if isinstance(job, dict) and job.get("cmd") == "shutdown":
+            shutdown_job = job
+            break
+
+        job_id = job.get("id") if isinstance(job, dict) else None
+        with answered:
+            outstanding += 1
+        runner.submit(job).add_done_callback(lambda f, job_id=job_id: emit_result(f, job_id))
+
+    # Wait for this stream's in-flight jobs, so the shutdown acknowledgement
+    # is always the last line written
+    with answered:
+        answered.wait_for(lambda: outstanding == 0)
+    if shutdown_job is not None:
+        emit({"id": shutdown_job.get("id"), "success": True, "shutdown": True})
+
+
+def serve_stdin(jobs=1, settings=None, wire_format="json"):
+    """Worker loop over stdin/stdout."""
+    def write(data):
+        sys.stdout.buffer.write(data)
+        sys.stdout.buffer.flush()
+
+    runner = JobRunner(jobs, settings)
+    try:
+        serve_stream(sys.stdin, write, runner, wire_format=wire_format)
+    finally:
+        runner.shutdown()
+
+
+def serve_unix_socket(socket_path, jobs=1, settings=None, wire_format="json"):
+    """
+    Worker loop over a local Unix socket. Each connection is an independent
+    NDJSON stream; a shutdown command closes only that connection. All
+    connections share one JobRunner, so --jobs bounds the whole server.
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        raise OSError("Unix sockets are not supported on this platform; use stdin mode.")
+
+    if os.path.exists(socket_path):
+        os.unlink(socket_path)
+
+    runner = JobRunner(jobs, settings)
+
+    class JobHandler(socketserver.StreamRequestHandler):
+        def handle(self):
+            reader = io.TextIOWrapper(self.rfile, encoding='utf-8', errors='replace')
+
+            def write(data):
+                self.wfile.write(data)
+                self.wfile.flush()
+
+            serve_stream(reader, write, runner, wire_format=wire_format)
+
+    server = socketserver.ThreadingUnixStreamServer(socket_path, JobHandler)
+    server.daemon_threads = True
+    try:
+        print(f"Analyzer worker listening on {socket_path}", file=sys.stderr)
+        server.serve_forever()
+    finally:
+        server.server_close()
+        runner.shutdown()
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+
+
+def write_result(result, wire_format="json", **json_options):
+    """Print a single-run result (or error) to stdout in the chosen wire format."""
+    if wire_format == "json":
+        print(json.dumps(result, **json_options))
+        return
+    sys.stdout.flush()
+    sys.stdout.buffer.write(encode_response(result, wire_format))
+    sys.stdout.buffer.flush()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Analyze a resume and print JSON for the Node.js backend'
+    )
+    parser.add_argument(
+        'file_path',
+        nargs='?',
+        help=f'Path to the PDF resume file, or {STDIN_PATH} to read raw or base64 PDF bytes from stdin'
+    )
+    parser.add_argument(
+        '--name',
+        default=BUFFER_NAME,
+        help=f'File name recorded in metadata for a resume read from stdin (default: {BUFFER_NAME})'
+    )
+    parser.add_argument(
+        '--serve',
+        action='store_true',
+        help='Run as a long-lived worker reading NDJSON jobs from stdin'
+    )
+    parser.add_argument(
+        '--socket',
+        metavar='PATH',
+        help='With --serve, listen on this Unix socket instead of stdin'
+    )
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=1,
+        help='With --serve, number of worker processes analyzing jobs concurrently (default: 1)'
+    )
+    parser.add_argument(
+        '--cache',
+        metavar='PATH',
+        help='Result cache: a .db/.sqlite file or a directory (reuses results for unchanged PDFs)'
+    )
+    parser.add_argument(
+        '--cache-max-mb',
+        type=int,
+        default=256,
+        help='Maximum cache size in MB before least recently used entries are evicted (default: 256)'
+    )
+    parser.add_argument(
+        '--sidecar',
+        action='store_true',
+        help='Store extracted text next to the PDF and reuse it when the PDF is unchanged'
+    )
+    parser.add_argument(
+        '--instrument',
+        action='store_true',
+        help='Add per-stage timings and counters to metadata.instrumentation'
+    )
+    add_extraction_arguments(parser)
+    add_policy_arguments(parser)
+    add_profile_argument(parser, WRAPPER_PROFILES)
+    add_advice_format_argument(parser)
+    add_near_duplicate_arguments(parser)
+    parser.add_argument(
+        '--wire-format',
+        choices=WIRE_FORMATS,
+        default="json",
+        help=f'Write each result as a JSON document/line, or as a length-prefixed {WIRE_FORMAT} frame '
+             'with interned skill IDs (default: json)'
+    )
+    parser.add_argument(
+        '--wire-schema',
+        action='store_true',
+        help=f'Print the {WIRE_FORMAT} schema (skill IDs and details) as JSON and exit'
+    )
+    args = parser.parse_args()
+
+    if args.wire_schema:
+        print(json.dumps(get_wire_schema().to_dict(), ensure_ascii=False))
+        return
+
+    settings = {
+        "cache_location": args.cache,
+        "cache_max_bytes": args.cache_max_mb * 1024 * 1024,
+        "use_sidecar": args.sidecar,
+        "extract_options": extraction_options_from_args(args),
+        "instrument": args.instrument,
+        "policy": policy_from_args(args),
+        "profile": args.profile,
+        "advice_format": args.advice_format,
+        "near_duplicates_location": args.near_duplicates,
+        "near_duplicate_threshold": args.near_duplicate_threshold
+    }
+    # CPU time accumulates over a worker's lifetime, so workers only cap memory
+    settings["policy"].apply_process_limits(cpu=not args.serve)
+
+    if args.serve:
+        if args.near_duplicates:
+            # Create the index once up front, so pool processes only ever open it
+            open_near_duplicate_index(args.near_duplicates)
+        if args.socket:
+            serve_unix_socket(args.socket, jobs=args.jobs, settings=settings, wire_format=args.wire_format)
+        else:
+            serve_stdin(jobs=args.jobs, settings=settings, wire_format=args.wire_format)
+        return
+
+    if not args.file_path:
+        write_result({
             "success": False,
-            "error": str(e),
-            "error_type": type(e).__name__,
-            "message": f"Analysis failed: {str(e)}"
-        }))
+            "error": "No file path provided",
+            "message": "Usage: python analyze_resume_wrapper.py <path_to_resume.pdf>"
+        }, args.wire_format)
+        sys.exit(1)
+
+    file_path, data = args.file_path, None
+
+    if file_path == STDIN_PATH:
+        file_path, data = args.name, sys.stdin.buffer.read()
+    elif not os.path.exists(file_path):
+        write_result({
+            "success": False,
+            "error": f"File not found: {file_path}",
+            "message": "The specified resume file does not exist."
+        }, args.wire_format)
+        sys.exit(1)
+
+    try:
+        result = run_analysis(file_path, data=data, **worker_analysis_options(settings))
+
+        # Output JSON (or an ats-wire frame) to stdout
+        write_result(result, args.wire_format, ensure_ascii=False)
+
+    except Exception as e:
+        write_result(error_result(e), args.wire_format)
         sys.exit(1)
 
 
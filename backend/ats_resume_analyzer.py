@@ -7,9 +7,13 @@ Usage:
     python ats_resume_analyzer.py <resume.pdf>
     python ats_resume_analyzer.py <resume.pdf> --output results.json
     python ats_resume_analyzer.py <resume.pdf> --pretty
+    python ats_resume_analyzer.py --batch <dir|glob|manifest.txt> --output results.jsonl
+    python ats_resume_analyzer.py - --name resume.pdf < resume.pdf
 
 Features:
     - PDF text extraction
+    - Pre-flight triage that rejects image-only, encrypted or damaged PDFs in
+      milliseconds with a specific error_code
     - Skill detection across 8+ categories (100+ skills)
     - ATS score calculation (0-100)
     - Section detection (Education, Skills, Experience, Projects, Certifications)
@@ -17,9 +21,27 @@ Features:
     - Strengths and weaknesses identification
     - Actionable optimization advice
     - JSON output for easy integration
+    - Batch mode: score a whole cohort in parallel, streamed as JSON Lines
+    - Content-addressed result cache (--cache) for unchanged resumes
+    - Reusable extraction sidecars (--sidecar) so rule changes re-score without PDF parsing
+    - Optional per-stage timing and counters (--instrument) plus trace hooks
+    - Execution policy: words-per-page, per-stage deadline, memory and CPU caps
+      that stop a pathological PDF with a structured "limit exceeded" result
+    - In-memory input: analyze raw or base64 PDF bytes from stdin (use "-" as
+      the path) or a buffer, without writing a temporary file
+    - Analysis profiles (--profile score|skills|full) that run only the
+      stages the requested outputs depend on
+    - Compact output (--advice-format codes): strengths, weaknesses, skill gaps
+      and advice as stable message codes, rendered to text on demand
+    - Near-duplicate detection (--near-duplicates): MinHash fingerprints of every
+      analyzed resume, so near-exact copies reuse an earlier cached result
 
 Dependencies:
-    pip install pdfplumber nltk
+    pip install pdfplumber
+
+    pdfplumber is imported lazily, only when a PDF is actually parsed, so
+    scoring already-extracted text (sidecars, score_resume_text) starts fast
+    and works without it.
 
 Author: ATS Analyzer Team
 Version: 1.0.0
@@ -27,33 +49,37 @@ License: MIT
 """
 
 import sys
+import io
 import json
-import argparse
 import re
+import os
+import base64
+import time
+import hashlib
+import threading
+from operator import itemgetter
+from functools import cached_property
 from pathlib import Path
-from typing import Dict, List, Tuple, Any
-
-try:
-    import pdfplumber
-except ImportError:
-    print(json.dumps({"error": "pdfplumber not installed. Run: pip install pdfplumber"}), file=sys.stderr)
-    sys.exit(1)
-
-try:
-    import nltk
-    from nltk.corpus import stopwords
-except ImportError:
-    print(json.dumps({"error": "nltk not installed. Run: pip install nltk"}), file=sys.stderr)
-    sys.exit(1)
-
-# Download NLTK data silently
-try:
-    nltk.data.find('corpora/stopwords')
-except LookupError:
+from typing import Dict, List, Tuple, Any, Optional, Union, Callable, TYPE_CHECKING
+
+from advice_messages import Message, render_strengths, render_weaknesses, render_skill_gaps, render_advice
+
+# Heavy or entry-point-specific modules (pdfplumber, concurrent.futures,
+# argparse, the cache backends) are imported inside the functions that need
+# them to keep `import ats_resume_analyzer` cheap.
+if TYPE_CHECKING:
+    import argparse
+    from analysis_cache import AnalysisCache
+    from near_duplicates import NearDuplicateIndex
+
+
+def _import_pdfplumber():
+    """Import pdfplumber on first use, with an actionable error if missing."""
     try:
-        nltk.download('stopwords', quiet=True)
-    except:
-        pass  # Continue even if download fails
+        import pdfplumber
+    except ImportError:
+        raise ImportError("pdfplumber not installed. Run: pip install pdfplumber")
+    return pdfplumber
 
 
 # ============================================================================
@@ -215,400 +241,1955 @@ SKILL_DETAILS = {
 }
 
 
+ANALYSIS_VERSION = "1.0.1"
+
+# Extraction artifacts ("sidecars") store the text and word geometry of a PDF
+# so scoring rules can be re-applied without parsing the PDF again. Bump
+# EXTRACTOR_VERSION whenever extraction output changes.
+ARTIFACT_FORMAT = "ats-extract"
+EXTRACTOR_VERSION = 5
+SIDECAR_SUFFIX = ".extract.json"
+
+# Extraction limits so one huge upload (e.g. a 200-page portfolio) cannot
+# monopolize a worker. Faculty CVs can exceed 20 pages, so the page cap
+# leaves room for those.
+DEFAULT_MAX_PAGES = 40
+DEFAULT_WORD_BUDGET = 30000
+
+# extract_resume_artifact options that change the extracted text, with their
+# defaults there. Results and sidecars are kept per combination of these (see
+# extraction_fingerprint); workers only changes how the text is extracted,
+# and deadline_s is a transient limit whose results are never kept.
+RESULT_EXTRACT_OPTIONS = {
+    "max_pages": DEFAULT_MAX_PAGES,
+    "word_budget": DEFAULT_WORD_BUDGET,
+    "max_words_per_page": None,
+    "preflight": True,
+}
+
+# Page-parallel extraction only pays off for long documents
+PARALLEL_MIN_PAGES = 8
+
+# In-memory documents: "-" as the path means stdin, and BUFFER_NAME is
+# recorded in metadata when the caller does not name the document. The PDF
+# spec allows the %PDF- header anywhere in the first 1024 bytes.
+STDIN_PATH = "-"
+BUFFER_NAME = "resume.pdf"
+PDF_HEADER = b"%PDF-"
+PDF_HEADER_WINDOW = 1024
+
+# Fingerprint of the rule tables; part of every cache key so that editing
+# SKILL_DB or SKILL_DETAILS invalidates cached results automatically
+RULES_FINGERPRINT = hashlib.sha256(
+    json.dumps([SKILL_DB, SKILL_DETAILS], sort_keys=True).encode("utf-8")
+).hexdigest()[:16]
+
+
 # ============================================================================
-# CORE FUNCTIONS
+# INSTRUMENTATION - Optional per-stage timing, counters and trace hooks
 # ============================================================================
 
-def extract_resume_text(file_path: str) -> str:
+# Regex scans are counted per thread so that concurrent worker-mode jobs
+# each report their own totals
+_scan_counter = threading.local()
+
+
+def _count_scans(n: int = 1) -> None:
+    _scan_counter.count = getattr(_scan_counter, "count", 0) + n
+
+
+def regex_scans() -> int:
+    """Number of regex scans the current thread has performed so far."""
+    return getattr(_scan_counter, "count", 0)
+
+
+def peak_rss_kb() -> Optional[int]:
+    """Peak resident set size of this process in KB (None where unsupported)."""
+    try:
+        import resource
+    except ImportError:
+        return None  # Windows
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KB, macOS reports bytes
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+TraceHook = Callable[[Dict[str, Any]], None]
+_trace_hooks: List[TraceHook] = []
+
+
+def add_trace_hook(hook: TraceHook) -> None:
     """
-    Extract text from PDF resume with better layout preservation.
+    Register a callable that receives one event per completed analysis stage:
+    {"stage", "wall_ms", "cpu_ms", "file_path"}. While any hook is registered,
+    stages are timed even if the instrumentation block itself is not requested.
     """
-    if not Path(file_path).exists():
-        raise FileNotFoundError(f"Resume file not found: {file_path}")
-    
-    text = ""
-    try:
-        with pdfplumber.open(file_path) as pdf:
-            for page in pdf.pages:
-                # Use a more robust extraction method that handles columns better
-                # We sort characters by top, then left to maintain reading order
-                words = page.extract_words(x_tolerance=3, y_tolerance=3)
-                if words:
-                    # Group words by line (same top or very close top)
-                    lines_dict = {}
-                    for w in words:
-                        top = round(float(w['top']))
-                        if top not in lines_dict:
-                            lines_dict[top] = []
-                        lines_dict[top].append(w)
-                    
-                    # Sort lines by top
-                    sorted_tops = sorted(lines_dict.keys())
-                    for top in sorted_tops:
-                        # Sort words in line by left position
-                        line_words = sorted(lines_dict[top], key=lambda x: float(x['x0']))
-                        line_text = " ".join(w['text'] for w in line_words)
-                        text += line_text + "\n"
-                else:
-                    # Fallback to standard extraction
-                    page_text = page.extract_text()
-                    if page_text:
-                        text += page_text + "\n"
-        
-        if not text.strip():
-            raise ValueError("No text could be extracted from the PDF.")
-        
-        return text
-    except Exception as e:
-        raise Exception(f"Error extracting text from PDF: {str(e)}")
+    _trace_hooks.append(hook)
+
 
+def remove_trace_hook(hook: TraceHook) -> None:
+    """Unregister a hook added with add_trace_hook."""
+    if hook in _trace_hooks:
+        _trace_hooks.remove(hook)
 
-def extract_skills(resume_text: str) -> Dict[str, List[str]]:
+
+class _Stage:
     """
-    Extract skills from resume text based on comprehensive skill database.
-    
-    Args:
-        resume_text: The resume text content
-        
-    Returns:
-        Dictionary of categorized skills found in the resume
+    Context manager timing one stage of an Instrumentation. With an execution
+    policy, the stage is also where limit errors get their stage name and
+    where the per-stage deadline is enforced.
     """
-    text = resume_text.lower()
-    skills_found = {category: [] for category in SKILL_DB}
-    
-    for category, skills in SKILL_DB.items():
-        for skill in skills:
-            # Use word boundaries for better matching
-            # Handle multi-word skills and special characters
-            skill_pattern = skill.replace('.', r'\.').replace('+', r'\+')
-            pattern = r'\b' + skill_pattern + r'\b'
-            
-            if re.search(pattern, text):
-                if skill not in skills_found[category]:  # Avoid duplicates
-                    skills_found[category].append(skill)
-    
-    return skills_found
 
+    __slots__ = ("owner", "name", "check_deadline", "wall_start", "cpu_start")
 
-def detect_sections(resume_text: str) -> Dict[str, bool]:
+    def __init__(self, owner: "Instrumentation", name: str, check_deadline: bool = True):
+        self.owner = owner
+        self.name = name
+        self.check_deadline = check_deadline
+
+    def __enter__(self):
+        self.wall_start = time.perf_counter()
+        self.cpu_start = time.thread_time()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        wall_ms = round((time.perf_counter() - self.wall_start) * 1000, 3)
+        cpu_ms = round((time.thread_time() - self.cpu_start) * 1000, 3)
+        self.owner.record(self.name, wall_ms, cpu_ms)
+        if self.owner.policy is not None:
+            self.owner.policy.check_stage(self.name, wall_ms, exc, self.check_deadline)
+        return False
+
+
+class Instrumentation:
     """
-    Detect presence of key resume sections.
+    Per-stage wall and CPU time plus document counters for one analysis.
     
-    Args:
-        resume_text: The resume text content
-        
-    Returns:
-        Dictionary indicating which sections are present
+    Usage:
+        instr = Instrumentation(file_path)
+        with instr.stage("extract"):
+            ...
+        instr.counters["page_count"] = 2
+        metadata["instrumentation"] = instr.report()
     """
-    text = resume_text.lower()
-    sections = {
-        "education": False,
-        "skills": False,
-        "experience": False,
-        "projects": False,
-        "certification": False
-    }
-    
-    # Comprehensive section detection patterns
-    section_patterns = {
-        "education": [
-            r'\beducation\b', r'\bacademic\b', r'\bdegree\b', r'\buniversity\b', 
-            r'\bcollege\b', r'\bschool\b', r'\beducational background\b',
-            r'\bacademic qualifications\b'
-        ],
-        "skills": [
-            r'\bskills\b', r'\btechnical skills\b', r'\bcompetencies\b', 
-            r'\bexpertise\b', r'\bproficiencies\b', r'\bcore competencies\b',
-            r'\btechnologies\b', r'\btools\b'
-        ],
-        "experience": [
-            r'\bexperience\b', r'\bwork history\b', r'\bemployment\b', 
-            r'\bprofessional experience\b', r'\bwork experience\b',
-            r'\bcareer history\b', r'\bprofessional background\b'
-        ],
-        "projects": [
-            r'\bprojects\b', r'\bportfolio\b', r'\bwork samples\b',
-            r'\bpersonal projects\b', r'\bacademic projects\b',
-            r'\bkey projects\b'
-        ],
-        "certification": [
-            r'\bcertification\b', r'\bcertificate\b', r'\blicense\b', 
-            r'\baccreditation\b', r'\bcertified\b', r'\bcertifications\b',
-            r'\bprofessional certifications\b'
-        ]
-    }
-    
-    for section, patterns in section_patterns.items():
-        for pattern in patterns:
-            if re.search(pattern, text):
-                sections[section] = True
-                break
-    
-    return sections
 
+    enabled = True
 
-def calculate_ats_score(resume_text: str, skills_found: Dict[str, List[str]]) -> Tuple[int, Dict[str, Any], List[Dict[str, str]], Dict[str, int]]:
+    def __init__(self, file_path: str = "", policy: Optional["ExecutionPolicy"] = None):
+        self.file_path = file_path
+        self.policy = policy
+        self.stages: Dict[str, Dict[str, float]] = {}
+        self.counters: Dict[str, Any] = {}
+        self._scans_at_start = regex_scans()
+
+    def stage(self, name: str, check_deadline: bool = True) -> _Stage:
+        """
+        Time a stage. check_deadline=False leaves the deadline to the stage
+        itself (extraction stops between pages and keeps what it has).
+        """
+        return _Stage(self, name, check_deadline)
+
+    def record(self, name: str, wall_ms: float, cpu_ms: float) -> None:
+        self.stages[name] = {"wall_ms": wall_ms, "cpu_ms": cpu_ms}
+        for hook in tuple(_trace_hooks):
+            hook({"stage": name, "wall_ms": wall_ms, "cpu_ms": cpu_ms, "file_path": self.file_path})
+
+    def report(self) -> Dict[str, Any]:
+        """The metadata["instrumentation"] block."""
+        return {
+            "stages": self.stages,
+            **self.counters,
+            "regex_scans": regex_scans() - self._scans_at_start,
+            "peak_rss_kb": peak_rss_kb()
+        }
+
+
+class _NullStage:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+class _NullInstrumentation:
+    """Stand-in used when nothing is being measured; every call is a no-op."""
+
+    enabled = False
+    _stage = _NullStage()
+
+    def stage(self, name: str, check_deadline: bool = True) -> _NullStage:
+        return self._stage
+
+    @property
+    def counters(self) -> Dict[str, Any]:
+        return {}  # Writes are discarded
+
+    def report(self) -> None:
+        return None
+
+
+NULL_INSTRUMENTATION = _NullInstrumentation()
+
+
+def start_instrumentation(
+    file_path: str,
+    enabled: bool = False,
+    policy: Optional["ExecutionPolicy"] = None
+) -> Union[Instrumentation, _NullInstrumentation]:
     """
-    Calculate comprehensive ATS score. 
-    Each of the 5 categories is worth 20 points, totaling 100.
+    Instrumentation for one analysis: a real collector when the block was
+    requested, a trace hook is registered or the policy has stage-level
+    limits to enforce, otherwise the shared no-op.
     """
-    temp_strengths_list = []
-    resume_weaknesses = []
-    
-    text = resume_text.lower()
-    words = text.split()
-    word_count = len(words)
-    
-    # 1. FORMATTING (20 points: 15 for sections + 5 for length)
-    sections = detect_sections(resume_text)
-    section_points = sum(3 for present in sections.values() if present) # 5 sections * 3 = 15
-    for section, present in sections.items():
-        if present:
-            temp_strengths_list.append({"strength": f"{section.capitalize()} section present", "tip": f"Your {section} section is well-structured."})
-        else:
-            resume_weaknesses.append({"weakness": f"{section.capitalize()} section missing", "impact": "Reduces ATS compatibility.", "fix": f"Add a '{section.capitalize()}' section."})
-            
-    len_points = 0
-    if 400 <= word_count <= 700: len_points = 5
-    elif 300 <= word_count <= 900: len_points = 4
+    if enabled or _trace_hooks or (policy is not None and policy.checks_stages):
+        return Instrumentation(file_path, policy)
+    return NULL_INSTRUMENTATION
+
+
+# ============================================================================
+# EXECUTION POLICY - Cooperative resource limits for one analysis job
+# ============================================================================
+
+# A dense one-page resume has well under 1,500 words; pages far beyond this
+# are usually hidden text or glyph-drawn graphics that pdfplumber is slow to
+# group into words. The per-page cap is opt-in (a resume that parsed before
+# must not start coming back partial); this is the value to opt in with
+SUGGESTED_MAX_WORDS_PER_PAGE = 5000
+
+# CPU seconds between the SIGXCPU warning (soft rlimit) and the kernel's
+# SIGKILL (hard rlimit), for a job that cannot get back to Python code
+CPU_LIMIT_GRACE_S = 5
+
+# Memory held back while a memory cap is active and released on MemoryError,
+# so that the limit result can still be built and written out
+MEMORY_RESERVE_BYTES = 4 * 1024 * 1024
+_memory_reserve: Optional[bytearray] = None
+
+# Limits whose outcome depends on machine load; results cut short by them are
+# neither cached nor stored as sidecars. The other limits (page cap, word
+# budget, words per page) cut a document short the same way every time and
+# are part of cache keys and sidecars (see RESULT_EXTRACT_OPTIONS), so their
+# partial results are kept, but only for requests under the same limits.
+TRANSIENT_LIMITS = frozenset({"stage_deadline_s", "max_memory_mb", "max_cpu_s"})
+
+
+class LimitExceeded(Exception):
+    """
+    A resource limit stopped the job.
     
-    formatting_score = section_points + len_points # Max 20
+    Attributes:
+        limit: The limit that was hit: an ExecutionPolicy field, or the
+            "max_pages" / "word_budget" extraction options
+        stage: Stage that was running, when known
+        value: Measured value that crossed the limit, when known
+        threshold: The configured limit
+    """
 
-    # 2. SKILLS MATCH (20 points)
-    total_skills = sum(len(v) for v in skills_found.values())
-    skills_score = 0
-    if total_skills >= 20: skills_score = 20
-    elif total_skills >= 15: skills_score = 18
-    elif total_skills >= 10: skills_score = 15
-    elif total_skills >= 6: skills_score = 10
-    else: skills_score = 5
+    def __init__(self, limit: str, stage: Optional[str], value: Any, threshold: Any):
+        super().__init__(limit, stage, value, threshold)
+        self.limit = limit
+        self.stage = stage
+        self.value = value
+        self.threshold = threshold
+
+    def __str__(self) -> str:
+        measured = f" ({self.value} > {self.threshold})" if self.value is not None else f" ({self.threshold})"
+        return f"{self.limit} exceeded during {self.stage or 'analysis'}{measured}"
+
+    def details(self) -> Dict[str, Any]:
+        """The "limit_exceeded" block of a result."""
+        return {"limit": self.limit, "stage": self.stage, "value": self.value, "threshold": self.threshold}
+
+
+class ExecutionPolicy:
+    """
+    Resource limits for one analysis job.
     
-    if skills_score >= 15:
-        temp_strengths_list.append({"strength": "Strong technical skills", "tip": f"You have {total_skills} skills listed."})
+    max_words_per_page and stage_deadline_s are checked cooperatively, between
+    pages and between stages. max_memory_mb and max_cpu_s are process rlimits
+    (see apply_process_limits); the MemoryError or SIGXCPU they cause is
+    turned into LimitExceeded at the stage it interrupts. The page cap and
+    word budget remain extraction options.
     
-    # 3. EXPERIENCE RELEVANCE (20 points)
-    exp_keywords = ["intern", "internship", "worked", "developed", "implemented", "built", "created", "designed", "managed", "led", "achieved", "improved", "delivered", "launched", "optimized", "automated", "reduced", "increased", "established", "coordinated", "collaborated"]
-    exp_hits = sum(1 for k in exp_keywords if re.search(r'\b' + k + r'\b', text))
-    experience_score = 0
-    if exp_hits >= 8: experience_score = 20
-    elif exp_hits >= 5: experience_score = 16
-    elif exp_hits >= 3: experience_score = 12
-    elif exp_hits >= 1: experience_score = 8
+    Either way the job ends with a result rather than being killed: pages
+    extracted before an extraction limit are still scored and the result is
+    marked "partial", while any other limit produces an error result with
+    error_type "LimitExceeded" (see limit_exceeded_result).
     
-    if experience_score >= 12:
-        temp_strengths_list.append({"strength": "Good experience indicators", "tip": f"You use {exp_hits} action verbs."})
+    Usage:
+        policy = ExecutionPolicy(stage_deadline_s=20, max_memory_mb=1024)
+        policy.apply_process_limits()
+        result = analyze_resume("resume.pdf", policy=policy)
+    """
+
+    __slots__ = ("max_words_per_page", "stage_deadline_s", "max_memory_mb", "max_cpu_s")
+
+    def __init__(
+        self,
+        max_words_per_page: Optional[int] = None,
+        stage_deadline_s: Optional[float] = None,
+        max_memory_mb: Optional[int] = None,
+        max_cpu_s: Optional[int] = None
+    ):
+        self.max_words_per_page = max_words_per_page
+        self.stage_deadline_s = stage_deadline_s
+        self.max_memory_mb = max_memory_mb
+        self.max_cpu_s = max_cpu_s
+
+    @property
+    def checks_stages(self) -> bool:
+        """Whether stages need a real Instrumentation to enforce this policy."""
+        return any(limit is not None for limit in (self.stage_deadline_s, self.max_memory_mb, self.max_cpu_s))
+
+    def extract_options(self, extract_options: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """extract_options plus this policy's page-level limits."""
+        return {
+            **(extract_options or {}),
+            "max_words_per_page": self.max_words_per_page,
+            "deadline_s": self.stage_deadline_s
+        }
+
+    def check_stage(self, name: str, wall_ms: float, error: Optional[BaseException], check_deadline: bool) -> None:
+        """
+        Called as each instrumented stage exits. Names the stage on limit
+        errors raised inside it, turns MemoryError under a memory cap into
+        LimitExceeded, and raises LimitExceeded for an overrun deadline.
+        """
+        global _memory_reserve
+        if isinstance(error, LimitExceeded):
+            if error.stage is None:
+                error.stage = name
+        elif isinstance(error, MemoryError):
+            if self.max_memory_mb is not None:
+                _memory_reserve = None
+                raise LimitExceeded("max_memory_mb", name, None, self.max_memory_mb) from error
+        elif error is None and check_deadline and self.stage_deadline_s is not None:
+            if wall_ms > self.stage_deadline_s * 1000:
+                raise LimitExceeded("stage_deadline_s", name, round(wall_ms / 1000, 3), self.stage_deadline_s)
+
+    def apply_process_limits(self, cpu: bool = True) -> None:
+        """
+        Install max_memory_mb (RLIMIT_AS) and max_cpu_s (RLIMIT_CPU) on this
+        process; pool workers started afterwards inherit them. RLIMIT_CPU
+        counts the whole process lifetime, so long-lived workers and batch
+        runs pass cpu=False. A no-op where rlimits are unavailable (Windows).
+        """
+        try:
+            import resource
+        except ImportError:
+            return
         
-    # 4. KEYWORDS (20 points)
-    unique_words = set(words)
-    unique_ratio = len(unique_words) / max(len(words), 1)
-    keywords_score = 0
-    if unique_ratio > 0.50: keywords_score = 20
-    elif unique_ratio > 0.45: keywords_score = 16
-    elif unique_ratio > 0.35: keywords_score = 12
-    
-    if keywords_score >= 12:
-        temp_strengths_list.append({"strength": "Good keyword diversity", "tip": f"Your vocabulary is varied."})
+        try:
+            if self.max_memory_mb is not None:
+                _, hard = resource.getrlimit(resource.RLIMIT_AS)
+                soft = self.max_memory_mb * 1024 * 1024
+                if hard != resource.RLIM_INFINITY:
+                    soft = min(soft, hard)
+                resource.setrlimit(resource.RLIMIT_AS, (soft, hard))
+                global _memory_reserve
+                _memory_reserve = bytearray(MEMORY_RESERVE_BYTES)
+            
+            if cpu and self.max_cpu_s is not None:
+                import signal
+                usage = resource.getrusage(resource.RUSAGE_SELF)
+                used = usage.ru_utime + usage.ru_stime
+                soft = int(used + self.max_cpu_s) + 1
+                hard = soft + CPU_LIMIT_GRACE_S
+                _, current_hard = resource.getrlimit(resource.RLIMIT_CPU)
+                if current_hard != resource.RLIM_INFINITY:
+                    soft, hard = min(soft, current_hard), min(hard, current_hard)
+                threshold = self.max_cpu_s
+                
+                def on_cpu_limit(signum, frame):
+                    # SIGXCPU repeats every second until the hard limit; one
+                    # LimitExceeded is enough to unwind the job
+                    signal.signal(signal.SIGXCPU, signal.SIG_IGN)
+                    spent = resource.getrusage(resource.RUSAGE_SELF)
+                    raise LimitExceeded("max_cpu_s", None, round(spent.ru_utime + spent.ru_stime - used, 1), threshold)
+                
+                signal.signal(signal.SIGXCPU, on_cpu_limit)
+                resource.setrlimit(resource.RLIMIT_CPU, (soft, hard))
+        except (ValueError, OSError) as e:
+            # e.g. RLIMIT_AS is not enforceable on macOS
+            print(f"✗ Could not apply resource limits: {e}", file=sys.stderr)
 
-    # 5. EDUCATION (20 points)
-    edu_keywords = ["b.tech", "btech", "be", "b.e", "b.e.", "bca", "mca", "degree", "bachelor", "master", "diploma", "ph.d", "phd", "m.tech", "mtech", "ms", "bs", "mba"]
-    edu_found = any(re.search(r'\b' + k + r'\b', text) for k in edu_keywords)
-    education_score = 20 if edu_found else 0
-    if edu_found:
-        temp_strengths_list.append({"strength": "Education credentials clear", "tip": "Educational background is well-documented."})
 
-    # CONTACT INFORMATION (Bonus analysis)
-    has_email = bool(re.search(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', text))
-    has_phone = bool(re.search(r'\b\d{10}\b|\b\d{3}[-.\s]?\d{3}[-.\s]?\d{4}\b|\+\d{1,3}[-.\s]?\d{10}\b', text))
-    has_linkedin = bool(re.search(r'linkedin\.com', text))
-    has_github = bool(re.search(r'github\.com', text))
-    contact_count = sum([has_email, has_phone, has_linkedin, has_github])
-    
-    if contact_count >= 3:
-        temp_strengths_list.append({"strength": "Complete contact info", "tip": f"Excellent! You have {contact_count} contact methods."})
-    elif contact_count >= 2:
-        temp_strengths_list.append({"strength": "Good contact info", "tip": f"You have {contact_count} contact methods."})
-    
-    # QUANTIFIABLE ACHIEVEMENTS (Bonus analysis)
-    numbers_pattern = r'\b\d+%|\b\d+x|\b\d+\+|\b\d+ (percent|users|customers|million|thousand|projects|applications)\b'
-    if bool(re.search(numbers_pattern, text, re.IGNORECASE)):
-        temp_strengths_list.append({"strength": "Quantifiable achievements", "tip": "Great! You include metrics and numbers in your resume."})
+DEFAULT_POLICY = ExecutionPolicy()
 
-    total_score = formatting_score + skills_score + experience_score + keywords_score + education_score
-    
-    score_breakdown = {
-        "formatting": formatting_score,
-        "skills": skills_score,
-        "experience": experience_score,
-        "keywords": keywords_score,
-        "education": education_score
-    }
 
-    enhanced_strengths = {
-        "summary": f"Your resume demonstrates {len(temp_strengths_list)} key strengths that contribute to your ATS score of {total_score}/100.",
-        "individual_tips": [s["tip"] for s in temp_strengths_list],
-        "strength_count": len(temp_strengths_list),
-        "score": total_score
+def limit_exceeded_result(error: LimitExceeded) -> Dict[str, Any]:
+    """Error result for a job stopped by a resource limit."""
+    return {
+        "success": False,
+        "error": str(error),
+        "error_type": "LimitExceeded",
+        "message": "Analysis stopped: the resume exceeded a resource limit.",
+        "limit_exceeded": error.details()
     }
+
+
+def annotate_result(result: Dict[str, Any], artifact: Dict[str, Any]) -> None:
+    """
+    Carry extraction caveats over to a result: "partial" plus the
+    limit_exceeded block when a limit cut extraction short, and
+    metadata["preflight_flags"] when pre-flight triage flagged the file.
+    """
+    limit = artifact.get("limit_exceeded")
+    if limit:
+        result["partial"] = True
+        result["limit_exceeded"] = limit
+    flags = (artifact.get("preflight") or {}).get("flags")
+    if flags:
+        result["metadata"]["preflight_flags"] = flags
+
+
+def is_cacheable(result: Dict[str, Any]) -> bool:
+    """
+    False for results cut short by a load-dependent limit. Results cut short
+    by an extraction limit are cacheable because cache keys include those
+    limits (see cache_lookup).
+    """
+    return (result.get("limit_exceeded") or {}).get("limit") not in TRANSIENT_LIMITS
+
+
+# ============================================================================
+# PRE-FLIGHT TRIAGE - Reject unusable PDFs before layout analysis
+# ============================================================================
+#
+# Layout analysis (extract_words) costs tens of milliseconds per page, and a
+# scanned resume pays it on every page only to end with "no text". Triage
+# reads the document structure instead: header and size, encryption, the
+# page tree, and each page's fonts, images and decompressed content streams,
+# where text appears as text-showing operators. That takes a few
+# milliseconds, and the content streams it decodes are reused by extraction.
+
+PREFLIGHT_MAX_FILE_BYTES = 20 * 1024 * 1024
+
+PREFLIGHT_MESSAGES = {
+    "empty_file": "The uploaded file is empty.",
+    "file_too_large": "The file is too large to be a resume. Please upload a PDF under "
+                      f"{PREFLIGHT_MAX_FILE_BYTES // (1024 * 1024)} MB.",
+    "not_pdf": "The file is not a PDF document.",
+    "malformed_pdf": "The PDF is damaged and could not be read. Please re-export it and upload it again.",
+    "encrypted": "The PDF is password-protected. Please upload a copy without a password.",
+    "no_pages": "The PDF has no pages.",
+    "image_only": "The PDF contains only images (it looks like a scan), so ATS systems cannot read it. "
+                  "Please upload a text-based PDF exported from your editor.",
+    "no_text": "The PDF contains no text.",
+}
+
+# A string operand followed by Tj, TJ, ' or "
+_TEXT_SHOW_PATTERN = re.compile(rb"[)>\]]\s*(?:Tj|TJ|'|\")")
+_INLINE_IMAGE_PATTERN = re.compile(rb"\bBI\b")
+
+
+class PreflightError(ValueError):
+    """
+    Pre-flight triage rejected the file.
     
-    return total_score, enhanced_strengths, resume_weaknesses, score_breakdown
+    Attributes:
+        code: Machine-readable reason, a key of PREFLIGHT_MESSAGES
+        report: What triage had found when it stopped
+    """
 
+    def __init__(self, code: str, detail: str, report: Optional[Dict[str, Any]] = None):
+        super().__init__(detail)
+        self.code = code
+        self.report = report or {}
 
-def skill_gap_analysis(skills_found: Dict[str, List[str]]) -> Dict[str, Any]:
+
+def preflight_error_result(error: PreflightError) -> Dict[str, Any]:
+    """Error result for a file rejected by pre-flight triage."""
+    return {
+        "success": False,
+        "error": str(error),
+        "error_type": "PreflightError",
+        "error_code": error.code,
+        "message": PREFLIGHT_MESSAGES[error.code],
+        "preflight": error.report
+    }
+
+
+def _check_pdf_bytes(data: bytes, max_file_bytes: Optional[int]) -> None:
+    if not data:
+        raise PreflightError("empty_file", "File is empty", {"file_size": 0})
+    if max_file_bytes is not None and len(data) > max_file_bytes:
+        raise PreflightError("file_too_large", f"File is {len(data)} bytes (limit {max_file_bytes})",
+                             {"file_size": len(data)})
+    if PDF_HEADER not in data[:PDF_HEADER_WINDOW]:
+        raise PreflightError("not_pdf", "No %PDF- header", {"file_size": len(data)})
+
+
+def _open_pdf(pdfplumber, data: bytes):
+    """pdfplumber.open on in-memory bytes, with open failures mapped to triage codes."""
+    try:
+        return pdfplumber.open(io.BytesIO(data))
+    except Exception as e:
+        # pdfplumber wraps pdfminer's errors; PDFPasswordIncorrect and
+        # PDFEncryptionError (unsupported scheme) both mean "encrypted"
+        cause = e.args[0] if e.args and isinstance(e.args[0], Exception) else e
+        name = type(cause).__name__
+        code = "encrypted" if "Password" in name or "Encryption" in name else "malformed_pdf"
+        raise PreflightError(code, f"{name}: {cause}", {"file_size": len(data)})
+
+
+def _stream_data(obj) -> Optional[bytes]:
+    """Decoded data of a PDF stream object (None if it cannot be decoded)."""
+    from pdfminer.pdftypes import resolve1
+    try:
+        return resolve1(obj).get_data()
+    except Exception:
+        return None
+
+
+def _inspect_content(contents, resources, fonts: set, seen: set) -> Tuple[bool, bool]:
     """
-    Analyze skill gaps with comprehensive ATS impact assessment.
+    Look for text-showing operators and images in content streams, following
+    Form XObjects (where page content is sometimes wrapped). Fonts found on
+    the way are added to `fonts`. Streams that cannot be decoded count as
+    text, so triage never rejects a file it could not fully read.
     
-    Args:
-        skills_found: Dictionary of categorized skills found in resume
-        
     Returns:
-        Dictionary containing gap analysis summary, impact, and recommendations
+        (has_text, has_images)
     """
-    all_missing_skills = []
-    overall_impact_statements = []
-    
-    # Identify all missing skills and their metadata
-    for category, skills_in_db in SKILL_DB.items():
-        for skill in skills_in_db:
-            if skill not in skills_found[category]:
-                all_missing_skills.append(skill)
-                
-                # Get importance and ATS impact for this skill
-                detail = SKILL_DETAILS.get(skill, {
-                    "importance": "Medium",
-                    "ats_impact": "Skill adds value to specific roles and may improve ATS matching for relevant positions."
-                })
-                
-                overall_impact_statements.append({
-                    "skill": skill,
-                    "category": category,
-                    "importance": detail["importance"],
-                    "ats_impact": detail["ats_impact"]
-                })
-    
-    # If no gaps found - excellent coverage
-    if not all_missing_skills:
-        return {
-            "summary": "Excellent! No significant skill gaps identified across all tracked categories.",
-            "overall_impact": "Your resume demonstrates comprehensive technical skill coverage, which is highly beneficial for ATS matching across a wide range of positions.",
-            "recommendation": "Continue to keep your skills updated with emerging technologies. Align your skillset with specific job descriptions when applying to maximize match scores.",
-            "missing_skills_count": 0,
-            "high_priority_gaps": [],
-            "medium_priority_gaps": [],
-            "missing_by_category": {}
-        }
+    from pdfminer.pdftypes import resolve1
+    resources = resolve1(resources) or {}
+    # Indirect references identify a font across pages; resource names don't
+    fonts.update(getattr(font, "objid", name) for name, font in (resolve1(resources.get("Font")) or {}).items())
     
-    # Analyze missing skills by priority
-    num_gaps = len(all_missing_skills)
-    high_importance_gaps = [item for item in overall_impact_statements if item["importance"] == "High"]
-    medium_importance_gaps = [item for item in overall_impact_statements if item["importance"] == "Medium"]
-    low_importance_gaps = [item for item in overall_impact_statements if item["importance"] == "Low"]
-    
-    high_count = len(high_importance_gaps)
-    medium_count = len(medium_importance_gaps)
-    low_count = len(low_importance_gaps)
-    
-    # Categorize missing skills by category
-    missing_by_category = {}
-    for item in overall_impact_statements:
-        cat = item["category"]
-        if cat not in missing_by_category:
-            missing_by_category[cat] = []
-        missing_by_category[cat].append({
-            "skill": item["skill"],
-            "importance": item["importance"],
-            "ats_impact": item["ats_impact"]
-        })
+    has_text = False
+    has_images = False
+    for stream in contents:
+        content = _stream_data(stream)
+        if content is None or _TEXT_SHOW_PATTERN.search(content):
+            has_text = True
+        if content is not None and _INLINE_IMAGE_PATTERN.search(content):
+            has_images = True
     
-    # Generate summary highlighting top missing skills
-    top_missing_high = [g["skill"] for g in high_importance_gaps[:5]]
-    top_missing_medium = [g["skill"] for g in medium_importance_gaps[:5]]
+    for ref in (resolve1(resources.get("XObject")) or {}).values():
+        xobject = resolve1(ref)
+        attrs = getattr(xobject, "attrs", None)
+        if attrs is None or id(xobject) in seen:
+            continue
+        seen.add(id(xobject))
+        subtype = getattr(attrs.get("Subtype"), "name", None)
+        if subtype == "Image":
+            has_images = True
+        elif subtype == "Form":
+            form_text, form_images = _inspect_content([xobject], attrs.get("Resources"), fonts, seen)
+            has_text = has_text or form_text
+            has_images = has_images or form_images
+    return has_text, has_images
+
+
+def _inspect_document(pdf, data: bytes, page_limit: Optional[int]) -> Dict[str, Any]:
+    """
+    Triage an open pdfplumber document (see preflight_pdf).
     
-    if top_missing_high:
-        summary_preview = ", ".join(top_missing_high)
-    elif top_missing_medium:
-        summary_preview = ", ".join(top_missing_medium)
-    else:
-        summary_preview = ", ".join(sorted(set(all_missing_skills))[:10])
+    Raises:
+        PreflightError: If no page within page_limit can yield text
+    """
+    pages = pdf.pages
+    report = {
+        "file_size": len(data),
+        "page_count": len(pages),
+        "text_pages": 0,
+        "image_pages": 0,
+        "font_count": 0,
+        "encrypted": getattr(pdf.doc, "encryption", None) is not None,
+        "flags": []
+    }
+    if not pages:
+        raise PreflightError("no_pages", "Document has no pages", report)
     
-    summary_text = (
-        f"Analysis identified {num_gaps} skill gaps across various categories. "
-        f"Priority breakdown: {high_count} high-importance, {medium_count} medium-importance, {low_count} low-importance. "
-        f"Key missing skills include: {summary_preview}."
-    )
+    fonts = set()
+    for page in pages[:page_limit]:
+        has_text, has_images = _inspect_content(page.page_obj.contents, page.page_obj.resources, fonts, set())
+        if has_text:
+            report["text_pages"] += 1
+        elif has_images:
+            report["image_pages"] += 1
+    report["font_count"] = len(fonts)
     
-    # Determine overall ATS impact based on missing skill priorities
-    if high_count >= num_gaps / 2 and high_count >= 5:
-        impact_level = "CRITICAL"
-        overall_impact_summary = (
-            f"⚠️ CRITICAL CONCERN: {high_count} high-importance skills are missing. "
-            f"These gaps could severely limit your resume's visibility in ATS systems and may lead to automatic disqualification for many relevant positions. "
-            f"High-priority skills like {', '.join([g['skill'] for g in high_importance_gaps[:3]])} are frequently used as filter criteria by ATS."
-        )
-    elif high_count >= 3:
-        impact_level = "MODERATE"
-        overall_impact_summary = (
-            f"⚠ MODERATE CONCERN: {high_count} high-importance skills and {medium_count} medium-importance skills are missing. "
-            f"This could moderately impact your ATS ranking and limit shortlisting opportunities for positions requiring these core competencies. "
-            f"Focus on acquiring: {', '.join([g['skill'] for g in high_importance_gaps[:3]])}."
-        )
-    elif medium_count >= 10:
-        impact_level = "LOW TO MODERATE"
-        overall_impact_summary = (
-            f"◐ LOW TO MODERATE CONCERN: The missing skills are mainly medium-importance ({medium_count} skills). "
-            f"While not critical, adding these skills could broaden your appeal and improve ATS matching for a wider range of positions."
-        )
-    else:
-        impact_level = "LOW"
-        overall_impact_summary = (
-            f"✓ LOW CONCERN: The identified gaps are primarily in lower-priority or specialized skills. "
-            f"These have minimal direct impact on ATS matching for general positions, but may be important for specific niche roles."
-        )
+    if report["encrypted"]:
+        report["flags"].append("encrypted")  # Opened without a password
+    if not report["text_pages"]:
+        if report["image_pages"]:
+            raise PreflightError("image_only", "No page has text; pages contain only images", report)
+        raise PreflightError("no_text", "No page has text", report)
+    if report["image_pages"]:
+        report["flags"].append("image_pages")
+    return report
+
+
+def preflight_pdf(
+    data: bytes,
+    max_pages: Optional[int] = DEFAULT_MAX_PAGES,
+    max_file_bytes: Optional[int] = PREFLIGHT_MAX_FILE_BYTES
+) -> Dict[str, Any]:
+    """
+    Cheap structural triage of a PDF, run before full extraction.
     
-    # Generate comprehensive recommendations
-    if high_count > 0:
-        consolidated_recommendation = (
-            f"🎯 IMMEDIATE ACTIONS NEEDED:\n"
-            f"1. PRIORITIZE HIGH-IMPORTANCE SKILLS: Focus on acquiring these {high_count} critical skills first: "
-            f"{', '.join([g['skill'] for g in high_importance_gaps[:5]])}. These are often mandatory requirements in job descriptions.\n"
-            f"2. LEARN AND DEMONSTRATE: Take online courses (Coursera, Udemy, edX), complete hands-on projects, "
-            f"or contribute to open-source to gain practical experience.\n"
-            f"3. UPDATE RESUME: Once proficient, add these skills to your resume with specific examples of usage in your projects or experience.\n"
-            f"4. USE PRECISE KEYWORDS: Mirror the exact terminology from job descriptions. For example, if a job mentions 'React.js', "
-            f"include 'React.js' or 'React' rather than just 'frontend frameworks'.\n"
-            f"5. VALIDATE WITH PROJECTS: Build portfolio projects showcasing new skills to strengthen credibility."
+    Args:
+        data: The PDF bytes
+        max_pages: Only pages that extraction would read are inspected
+        max_file_bytes: Larger files are rejected outright (None = no limit)
+        
+    Returns:
+        Report with file_size, page_count, text_pages, image_pages (pages
+        with images but no text), font_count, encrypted, and "flags" for
+        usable files with caveats ("encrypted", "image_pages")
+        
+    Raises:
+        PreflightError: With a code from PREFLIGHT_MESSAGES when the file
+            cannot yield any text
+    """
+    _check_pdf_bytes(data, max_file_bytes)
+    pdfplumber = _import_pdfplumber()
+    with _open_pdf(pdfplumber, data) as pdf:
+        return _inspect_document(pdf, data, max_pages)
+
+
+# ============================================================================
+# SKILL MATCHER - Compiled once at import, finds every skill in a single pass
+# ============================================================================
+
+def _trie_to_regex(node: Dict[str, Any], last_char: str = "") -> str:
+    """
+    Render a character trie as a factored regex alternation. At each node the
+    longer continuations are tried before ending the match, so the regex
+    always yields the longest skill that starts at a given position.
+    last_char is the character that leads into `node`.
+    """
+    branches = [re.escape(char) + _trie_to_regex(child, char)
+                for char, child in sorted(node.items()) if char != ""]
+    if "" in node:
+        if re.match(r"\w", last_char):
+            # A skill may end here, but only on a word boundary
+            branches.append(r"(?!\w)")
+        else:
+            # A skill ending in a symbol (c++, c#) ends there whatever
+            # follows: a version as in "C++17", punctuation or a space
+            branches.append("")
+    if len(branches) == 1:
+        return branches[0]
+    return "(?:" + "|".join(branches) + ")"
+
+
+def _build_skill_matcher() -> Tuple["re.Pattern[str]", Dict[str, Tuple[str, ...]]]:
+    """
+    Build the single-pass skill matcher.
+
+    Returns:
+        A compiled pattern whose lookahead group captures the longest skill
+        starting at every word start, and a map from each skill to the shorter
+        skills it implies (e.g. "spring boot" -> "spring", "c++" -> "c"),
+        since those match at the same position but are hidden by the longer one.
+    """
+    all_skills = {skill for skills in SKILL_DB.values() for skill in skills}
+
+    trie: Dict[str, Any] = {}
+    for skill in all_skills:
+        node = trie
+        for char in skill:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    # The lookahead makes each match zero-width, so finditer() tries every
+    # word start exactly once and overlapping skills are still reported.
+    pattern = re.compile(r"(?<!\w)(?=(" + _trie_to_regex(trie) + r"))")
+
+    word_char = re.compile(r"\w")
+    implied = {}
+    for skill in all_skills:
+        implied[skill] = tuple(
+            skill[:end] for end in range(1, len(skill))
+            if skill[:end] in all_skills and not word_char.match(skill[end])
         )
+
+    return pattern, implied
+
+
+_skill_matcher = None
+
+
+def match_skills(text: str) -> set:
+    """
+    Return the set of SKILL_DB entries present in already-lowercased text.
+    The matcher is compiled on first use rather than at import.
+    """
+    global _skill_matcher
+    if _skill_matcher is None:
+        _skill_matcher = _build_skill_matcher()
+    pattern, implied_skills = _skill_matcher
+    _count_scans()
+    
+    found = set()
+    for match in pattern.finditer(text):
+        skill = match.group(1)
+        found.add(skill)
+        found.update(implied_skills[skill])
+    return found
+
+
+# ============================================================================
+# PATTERN REGISTRY - Every scoring regex, compiled once at import
+# ============================================================================
+
+class KeywordFamily:
+    """
+    A family of keyword regexes compiled into one alternation with a named
+    group per member, so a single scan reports which members occur.
+    
+    Members are regex fragments matched between word boundaries. Each scan
+    is counted for instrumentation (see regex_scans).
+    """
+
+    def __init__(self, members: Dict[str, List[str]]):
+        self.labels = {}
+        groups = []
+        for i, (label, alternatives) in enumerate(members.items()):
+            group = f"m{i}"
+            self.labels[group] = label
+            groups.append(f"(?P<{group}>" + "|".join(alternatives) + ")")
+        self.pattern = re.compile(r"\b(?:" + "|".join(groups) + r")\b")
+
+    def hits(self, text: str) -> set:
+        """Labels of every member that occurs in text."""
+        _count_scans()
+        found = set()
+        target = len(self.labels)
+        for match in self.pattern.finditer(text):
+            found.add(self.labels[match.lastgroup])
+            if len(found) == target:
+                break
+        return found
+
+    def any(self, text: str) -> bool:
+        """Whether any member occurs in text."""
+        _count_scans()
+        return self.pattern.search(text) is not None
+
+
+# Section headings, one member per section (members are regex fragments)
+SECTION_FAMILY = KeywordFamily({
+    "education": [
+        r'education', r'academic', r'degree', r'university',
+        r'college', r'school', r'educational background',
+        r'academic qualifications'
+    ],
+    "skills": [
+        r'skills', r'technical skills', r'competencies',
+        r'expertise', r'proficiencies', r'core competencies',
+        r'technologies', r'tools'
+    ],
+    "experience": [
+        r'experience', r'work history', r'employment',
+        r'professional experience', r'work experience',
+        r'career history', r'professional background'
+    ],
+    "projects": [
+        r'projects', r'portfolio', r'work samples',
+        r'personal projects', r'academic projects',
+        r'key projects'
+    ],
+    "certification": [
+        r'certification', r'certificate', r'license',
+        r'accreditation', r'certified', r'certifications',
+        r'professional certifications'
+    ]
+})
+
+# Action verbs counted towards experience relevance
+ACTION_VERBS = [
+    "intern", "internship", "worked", "developed", "implemented", "built", "created",
+    "designed", "managed", "led", "achieved", "improved", "delivered", "launched",
+    "optimized", "automated", "reduced", "increased", "established", "coordinated",
+    "collaborated"
+]
+ACTION_VERB_FAMILY = KeywordFamily({verb: [verb] for verb in ACTION_VERBS})
+
+# Degree keywords (regex fragments: "." matches any character, as it always has)
+DEGREE_KEYWORDS = [
+    "b.tech", "btech", "be", "b.e", "b.e.", "bca", "mca", "degree", "bachelor",
+    "master", "diploma", "ph.d", "phd", "m.tech", "mtech", "ms", "bs", "mba"
+]
+DEGREE_FAMILY = KeywordFamily({keyword: [keyword] for keyword in DEGREE_KEYWORDS})
+
+# Contact details and metrics. These overlap each other (an email address
+# can contain "github.com"), so each keeps its own pattern rather than
+# sharing an alternation.
+#
+# Resume text is untrusted, so every pattern here runs in linear time: no
+# unbounded repeat may be rescanned from many start positions, and repeats
+# that follow each other use disjoint character classes so backtracking never
+# has more than one way to split a run. benchmarks/bench_regex_adversarial.py
+# checks this on pathological inputs.
+#
+# Email parts are capped at the RFC 5321 lengths (64-character local part,
+# 253-character domain, 63-character label): an uncapped local part restarts
+# at every word boundary of a long "a.b.c..." run and scans to its end,
+# which is quadratic.
+EMAIL_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]{1,64}@[A-Za-z0-9.-]{1,253}\.[A-Za-z]{2,63}\b')
+# Ten plain digits is the separator-free case of the second form
+PHONE_PATTERN = re.compile(r'\b\d{3}[-.\s]?\d{3}[-.\s]?\d{4}\b|\+\d{1,3}[-.\s]?\d{10}\b')
+LINKEDIN_PATTERN = re.compile(r'linkedin\.com')
+GITHUB_PATTERN = re.compile(r'github\.com')
+# One scan of the digit run, then the suffixes; each alternative used to
+# rescan the same digits
+QUANTIFIED_PATTERN = re.compile(
+    r'\b\d+(?:%|x|\+| (?:percent|users|customers|million|thousand|projects|applications)\b)',
+    re.IGNORECASE
+)
+
+# Dates on experience lines ("Jan 2020", "2019 - 2021", "Present"). Month
+# letters, separators and digits are disjoint classes, and the year-range
+# form always succeeds once its separators are consumed.
+DATE_PATTERN = re.compile(
+    r'(?:\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*[\s,./]*\d{2,4})'
+    r'|(?:\d{2,4}[\s,./-]+\d{0,4})|(?:Present|Current|Now)',
+    re.IGNORECASE
+)
+
+# Words that make a short line a section header. One scan of a line finds all
+# of them; each word has its own group so the match says which one it was, and
+# the character after the match tells the word on its own ("skills") from the
+# start of a longer one ("skillset"). "certifications" precedes
+# "certification" so the plural is reported as itself.
+SECTION_HEADING_WORDS = [
+    "experience", "work history", "employment", "professional background", "career history",
+    "education", "skills", "projects", "portfolio", "certifications", "certification",
+    "awards", "references", "summary", "contact", "hobbies", "languages", "technical"
+]
+
+
+def _heading_pattern(words: List[str]) -> re.Pattern:
+    """
+    Alternation of words grouped by first letter, behind a lookahead on the
+    first letters: most word starts are rejected by one character-class test
+    instead of trying every word (about 3x faster than a flat alternation).
+    """
+    by_initial = {}
+    for i, word in enumerate(words):
+        by_initial.setdefault(word[0], []).append(f'(?P<h{i}>{re.escape(word[1:])})')
+    branches = [initial + '(?:' + '|'.join(rest) + ')' for initial, rest in by_initial.items()]
+    return re.compile(
+        r'\b(?=[' + ''.join(by_initial) + r'])(?:' + '|'.join(branches) + ')',
+        re.IGNORECASE
+    )
+
+
+SECTION_HEADER_PATTERN = _heading_pattern(SECTION_HEADING_WORDS)
+_HEADING_GROUPS = {f'h{i}': word for i, word in enumerate(SECTION_HEADING_WORDS)}
+_WORD_CHAR = re.compile(r'\w')
+
+# Section spans, found in the same pass over the lines. A section opens after
+# the first line containing one of its start words (a line of at most
+# start_max_words words, when set) and closes before the first later line
+# that looks like a header (under 40 characters, and all caps or under 4
+# words) and contains one of its stop words. With *_exact the word must stand
+# on its own; otherwise it may begin a longer word.
+SECTION_SPAN_RULES = {
+    "experience": {
+        "start": {"experience", "work history", "employment", "professional background", "career history"},
+        "start_exact": False,
+        "start_max_words": 4,
+        "stop": {"education", "skills", "projects", "certifications", "awards", "references",
+                 "summary", "contact", "hobbies", "languages", "technical"},
+        "stop_exact": True,
+    },
+    "projects": {
+        "start": {"projects", "portfolio"},
+        "start_exact": True,
+        "start_max_words": None,
+        "stop": {"experience", "work history", "employment", "education", "skills", "certifications",
+                 "awards", "references", "summary", "contact", "hobbies", "languages", "technical"},
+        "stop_exact": False,
+    },
+    "education": {
+        "start": {"education"},
+        "start_exact": False,
+        "start_max_words": 4,
+        "stop": set(SECTION_HEADING_WORDS) - {"education"},
+        "stop_exact": False,
+    },
+    "certifications": {
+        "start": {"certifications", "certification"},
+        "start_exact": False,
+        "start_max_words": 4,
+        "stop": set(SECTION_HEADING_WORDS) - {"certifications", "certification"},
+        "stop_exact": False,
+    },
+}
+# Longer lines can only open a section whose start has no word limit, so once
+# those are open, long lines that do not look like headers are not scanned
+_HEADER_MAX_WORDS = max([4] + [r["start_max_words"] for r in SECTION_SPAN_RULES.values() if r["start_max_words"]])
+_UNBOUNDED_STARTS = [name for name, r in SECTION_SPAN_RULES.items() if r["start_max_words"] is None]
+
+
+# ============================================================================
+# LINE ASSEMBLY - Rebuilds reading order from word boxes
+# ============================================================================
+
+WordBox = Tuple[float, float, float, float, str]  # (x0, top, x1, bottom, text)
+
+# Words whose tops differ by at most this many points share a line
+LINE_TOLERANCE = 2.0
+
+# Two-column detection: a gutter is a vertical band at least this wide, in
+# the middle of the page, that almost no line crosses
+COLUMN_GUTTER_MIN_WIDTH = 8.0
+COLUMN_GUTTER_MAX_CROSSING = 0.10
+COLUMN_MIN_LINES = 5
+
+_BY_TOP = itemgetter(1)
+_BY_LEFT = itemgetter(0)
+_WORD_TEXT = itemgetter(4)
+
+
+def _cluster_lines(words: List[WordBox]) -> List[List[WordBox]]:
+    """
+    Group word boxes into lines in one pass over words sorted by top. A line
+    is anchored at its first word, so baselines a pixel or two apart stay
+    together without the line drifting downwards.
+    """
+    lines = []
+    current = None
+    line_top = 0.0
+    for w in sorted(words, key=_BY_TOP):
+        top = w[1]
+        if current is None or top - line_top > LINE_TOLERANCE:
+            current = [w]
+            lines.append(current)
+            line_top = top
+        else:
+            current.append(w)
+
+    for line in lines:
+        line.sort(key=_BY_LEFT)
+    return lines
+
+
+def _find_column_gutter(lines: List[List[WordBox]], page_width: float) -> Optional[Tuple[float, float]]:
+    """
+    Look for the gutter of a two-column layout.
+    
+    Returns:
+        (gutter_start, gutter_end) x-coordinates, or None for single-column pages
+    """
+    if len(lines) < 2 * COLUMN_MIN_LINES or page_width <= 0:
+        return None
+
+    # Cheap rejection: right-column lines start well away from the left
+    # margin, and single-column pages have almost none of those
+    lo, hi = page_width * 0.2, page_width * 0.8
+    if sum(1 for line in lines if line[0][0] >= lo) < COLUMN_MIN_LINES:
+        return None
+
+    # Count, for each 2pt vertical strip across the middle of the page, how
+    # many words cover it (words on one line never overlap, so this is
+    # effectively the number of lines crossing the strip)
+    bin_width = 2.0
+    num_bins = int((hi - lo) / bin_width)
+    if num_bins <= 0:
+        return None
+    delta = [0] * (num_bins + 1)
+    scale = 1.0 / bin_width
+    last_bin = num_bins - 1
+    for line in lines:
+        for w in line:
+            x0 = w[0]
+            x1 = w[2]
+            if x1 < lo or x0 >= hi:
+                continue
+            first = int((x0 - lo) * scale) if x0 > lo else 0
+            last = int((x1 - lo) * scale)
+            if last > last_bin:
+                last = last_bin
+            delta[first] += 1
+            delta[last + 1] -= 1
+    coverage = []
+    running = 0
+    for d in delta[:num_bins]:
+        running += d
+        coverage.append(running)
+
+    # Widest run of strips that almost no line crosses
+    max_crossing = len(lines) * COLUMN_GUTTER_MAX_CROSSING
+    best = None
+    run_start = None
+    for b in range(num_bins + 1):
+        open_strip = b < num_bins and coverage[b] <= max_crossing
+        if open_strip and run_start is None:
+            run_start = b
+        elif not open_strip and run_start is not None:
+            if best is None or b - run_start > best[1] - best[0]:
+                best = (run_start, b)
+            run_start = None
+    if best is None or (best[1] - best[0]) * bin_width < COLUMN_GUTTER_MIN_WIDTH:
+        return None
+    gutter = (lo + best[0] * bin_width, lo + best[1] * bin_width)
+
+    # Genuine columns flow independently: both sides carry many lines, and
+    # most lines sit on only one side (a title with a right-aligned date is
+    # a single column, not two)
+    left_only = right_only = both = 0
+    for line in lines:
+        # Words are sorted left to right, so the outermost words decide
+        has_left = line[0][2] <= gutter[1]
+        has_right = line[-1][0] >= gutter[0]
+        if has_left and has_right:
+            both += 1
+        elif has_left:
+            left_only += 1
+        elif has_right:
+            right_only += 1
+    if left_only < COLUMN_MIN_LINES or right_only < COLUMN_MIN_LINES or both > (left_only + right_only):
+        return None
+    return gutter
+
+
+def assemble_page_lines(words: List[WordBox], page_width: Optional[float] = None) -> Tuple[List[str], int]:
+    """
+    Rebuild reading-order lines for one page from word boxes.
+    
+    Lines are clustered with a small vertical tolerance. On two-column pages
+    each run of lines between full-width lines (e.g. a header) is emitted
+    left column first, then right column, instead of interleaving the two.
+    
+    Args:
+        words: (x0, top, x1, bottom, text) word boxes
+        page_width: Page width in points (defaults to the rightmost word edge)
+        
+    Returns:
+        (lines of text, number of columns detected)
+    """
+    lines = _cluster_lines(words)
+    if page_width is None:
+        page_width = max((w[2] for w in words), default=0.0)
+
+    gutter = _find_column_gutter(lines, page_width)
+    if gutter is None:
+        return [" ".join(map(_WORD_TEXT, line)) for line in lines], 1
+
+    split_x = (gutter[0] + gutter[1]) / 2
+    output = []
+    left_block = []
+    right_block = []
+    for line in lines:
+        # Words are sorted left to right: find where the right column starts
+        k = 0
+        while k < len(line) and line[k][0] < split_x:
+            k += 1
+        if k and line[k - 1][2] > split_x:
+            # A word straddles the gutter: full-width line, flush the block
+            output.extend(left_block)
+            output.extend(right_block)
+            left_block, right_block = [], []
+            output.append(" ".join(map(_WORD_TEXT, line)))
+            continue
+        if k:
+            left_block.append(" ".join(map(_WORD_TEXT, line[:k])))
+        if k < len(line):
+            right_block.append(" ".join(map(_WORD_TEXT, line[k:])))
+    output.extend(left_block)
+    output.extend(right_block)
+    return output, 2
+
+
+# ============================================================================
+# RESUME DOCUMENT - Text features computed once and shared by every scorer
+# ============================================================================
+
+def heading_words(line: str) -> Dict[str, bool]:
+    """
+    Section heading words in a line (see SECTION_HEADING_WORDS), each mapped
+    to whether it appears as a word on its own at least once.
+    """
+    found = {}
+    for match in SECTION_HEADER_PATTERN.finditer(line):
+        word = _HEADING_GROUPS[match.lastgroup]
+        found[word] = found.get(word, False) or _WORD_CHAR.match(line, match.end()) is None
+    return found
+
+
+def _has_heading_word(words: Dict[str, bool], wanted: set, exact: bool) -> bool:
+    return any(word in wanted and (alone or not exact) for word, alone in words.items())
+
+
+class ResumeDocument:
+    """
+    Extracted resume text plus derived views (lowercased text, tokens, lines,
+    section headers and spans). Each view is computed on first use and memoized, so a
+    resume is lowercased and tokenized exactly once however many scorers
+    read it. Scorers may also memoize their own results in `memo`.
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+        self.memo: Dict[str, Any] = {}
+
+    @cached_property
+    def lower(self) -> str:
+        return self.text.lower()
+
+    @cached_property
+    def tokens(self) -> List[str]:
+        """Whitespace tokens of the lowercased text."""
+        return self.lower.split()
+
+    @cached_property
+    def token_set(self) -> set:
+        return set(self.tokens)
+
+    @property
+    def word_count(self) -> int:
+        return len(self.tokens)
+
+    @cached_property
+    def lines(self) -> List[str]:
+        return self.text.split('\n')
+
+    @cached_property
+    def stripped_lines(self) -> List[str]:
+        """Non-empty lines with surrounding whitespace removed."""
+        return [l.strip() for l in self.lines if l.strip()]
+
+    @cached_property
+    def _segmentation(self) -> Tuple[List[int], Dict[str, Tuple[int, int]]]:
+        """
+        Single pass over stripped_lines: each line's heading words come from
+        one SECTION_HEADER_PATTERN scan, and feed both the header list and
+        every section span in SECTION_SPAN_RULES.
+        """
+        lines = self.stripped_lines
+        boundaries = []
+        opened = {}
+        spans = {}
+        scanned = 0
+        unopened = set(_UNBOUNDED_STARTS)
+        for i, line in enumerate(lines):
+            word_count = len(line.split())
+            looks_like_header = len(line) < 40 and (line.isupper() or word_count < 4)
+            if word_count > _HEADER_MAX_WORDS and not looks_like_header and not unopened:
+                continue
+            scanned += 1
+            words = heading_words(line)
+            if not words:
+                continue
+            if word_count < 5:
+                boundaries.append(i)
+            for name, rule in SECTION_SPAN_RULES.items():
+                if name in spans:
+                    continue
+                if name in opened:
+                    if looks_like_header and _has_heading_word(words, rule["stop"], rule["stop_exact"]):
+                        spans[name] = (opened.pop(name), i)
+                elif (rule["start_max_words"] is None or word_count <= rule["start_max_words"]) \
+                        and _has_heading_word(words, rule["start"], rule["start_exact"]):
+                    opened[name] = i + 1
+                    unopened.discard(name)
+        for name, start in opened.items():
+            spans[name] = (start, len(lines))
+        _count_scans(scanned)
+        return boundaries, spans
+
+    @property
+    def section_boundaries(self) -> List[int]:
+        """Indices into stripped_lines of lines that look like section headers."""
+        return self._segmentation[0]
+
+    @property
+    def section_spans(self) -> Dict[str, Tuple[int, int]]:
+        """
+        Section name -> (first, end) slice of stripped_lines holding the
+        section's body, for each SECTION_SPAN_RULES section that has a header.
+        """
+        return self._segmentation[1]
+
+    def section_lines(self, name: str) -> List[str]:
+        """Body lines of a section, or [] when the resume has no header for it."""
+        span = self.section_spans.get(name)
+        return self.stripped_lines[span[0]:span[1]] if span else []
+
+
+def as_document(resume: Union[str, ResumeDocument]) -> ResumeDocument:
+    """Accept either raw text or an existing ResumeDocument."""
+    if isinstance(resume, ResumeDocument):
+        return resume
+    return ResumeDocument(resume)
+
+
+# ============================================================================
+# CORE FUNCTIONS
+# ============================================================================
+
+def _extract_page(page) -> Tuple[Dict[str, Any], List[str], int]:
+    """
+    Extract one pdfplumber page.
+    
+    Returns:
+        (page entry for the artifact, text lines, word count)
+    """
+    page_width = float(page.width)
+    page_entry = {
+        "width": round(page_width, 2),
+        "height": round(float(page.height), 2),
+        "columns": 1,
+        "words": []
+    }
+    # Use a more robust extraction method that handles columns better
+    # We sort characters by top, then left to maintain reading order
+    words = page.extract_words(x_tolerance=3, y_tolerance=3)
+    if words:
+        boxes = [
+            (float(w['x0']), float(w['top']), float(w['x1']), float(w['bottom']), w['text'])
+            for w in words
+        ]
+        lines, page_entry["columns"] = assemble_page_lines(boxes, page_width)
+        page_entry["words"] = [
+            [round(x0, 2), round(top, 2), round(x1, 2), round(bottom, 2), word]
+            for x0, top, x1, bottom, word in boxes
+        ]
+        return page_entry, lines, len(boxes)
+    
+    # Fallback to standard extraction
+    page_text = page.extract_text()
+    if page_text:
+        page_entry["text"] = page_text
+        return page_entry, [page_text], len(page_text.split())
+    return page_entry, [], 0
+
+
+def _extraction_limit(limit: str, value: Any, threshold: Any) -> Dict[str, Any]:
+    return LimitExceeded(limit, "extract", value, threshold).details()
+
+
+def _extract_pages(
+    pages,
+    word_budget: Optional[int] = None,
+    max_words_per_page: Optional[int] = None,
+    deadline: Optional[float] = None
+) -> Tuple[List[Tuple[Dict[str, Any], List[str], int]], Optional[Dict[str, Any]]]:
+    """
+    Extract pdfplumber pages in order until they run out or a limit is hit.
+    The deadline (a time.time() timestamp) is checked before each page, and
+    the caller fills in its measured value; a page over max_words_per_page
+    is dropped, while the page on which the word budget is reached is kept.
+    
+    Returns:
+        (page results, limit details or None)
+    """
+    results = []
+    words_seen = 0
+    for page in pages:
+        if deadline is not None and time.time() > deadline:
+            return results, _extraction_limit("stage_deadline_s", None, None)
+        result = _extract_page(page)
+        if max_words_per_page is not None and result[2] > max_words_per_page:
+            return results, _extraction_limit("max_words_per_page", result[2], max_words_per_page)
+        results.append(result)
+        words_seen += result[2]
+        if word_budget is not None and words_seen >= word_budget:
+            return results, _extraction_limit("word_budget", words_seen, word_budget)
+    return results, None
+
+
+def _extract_page_range(
+    source: Any,
+    start: int,
+    stop: int,
+    word_budget: Optional[int] = None,
+    max_words_per_page: Optional[int] = None,
+    deadline: Optional[float] = None
+) -> Tuple[List[Tuple[Dict[str, Any], List[str], int]], Optional[Dict[str, Any]]]:
+    """
+    Open the document (a path or the PDF bytes) independently and extract
+    pages [start, stop) with _extract_pages. Runs in pool workers for
+    page-parallel extraction, so it must stay a module-level function.
+    """
+    pdfplumber = _import_pdfplumber()
+    if isinstance(source, bytes):
+        source = io.BytesIO(source)
+    with pdfplumber.open(source) as pdf:
+        return _extract_pages(pdf.pages[start:stop], word_budget, max_words_per_page, deadline)
+
+
+def decode_pdf_payload(payload: Union[bytes, bytearray, memoryview, str]) -> bytes:
+    """
+    Normalize an in-memory document to raw PDF bytes.
+    
+    Accepts the PDF bytes themselves or the same bytes base64-encoded (as
+    stored in MongoDB's resumeData, optionally as a data: URL). Raw input is
+    recognized by its %PDF- header, so either form can be piped in unlabeled.
+    
+    Raises:
+        ValueError: If the payload is neither a PDF nor base64 of one
+    """
+    if isinstance(payload, str):
+        payload = payload.encode('utf-8')
+    data = bytes(payload)
+    if PDF_HEADER in data[:PDF_HEADER_WINDOW]:
+        return data
+    
+    encoded = b"".join(data.split())
+    if encoded[:5].lower() == b"data:":
+        encoded = encoded.partition(b",")[2]
+    try:
+        decoded = base64.b64decode(encoded, validate=True)
+    except ValueError:
+        decoded = b""
+    if PDF_HEADER not in decoded[:PDF_HEADER_WINDOW]:
+        raise ValueError("Input is not a PDF document (expected raw or base64-encoded PDF bytes)")
+    return decoded
+
+
+def extraction_settings(extract_options: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    The extract_options that change the extracted text (see
+    RESULT_EXTRACT_OPTIONS), with defaults filled in for missing ones.
+    """
+    options = extract_options or {}
+    return {name: options.get(name, default) for name, default in RESULT_EXTRACT_OPTIONS.items()}
+
+
+def extract_resume_artifact(
+    file_path: str,
+    max_pages: Optional[int] = DEFAULT_MAX_PAGES,
+    word_budget: Optional[int] = DEFAULT_WORD_BUDGET,
+    workers: int = 1,
+    data: Optional[bytes] = None,
+    max_words_per_page: Optional[int] = None,
+    deadline_s: Optional[float] = None,
+    preflight: bool = True
+) -> Dict[str, Any]:
+    """
+    Extract text and word geometry from a PDF resume.
+    
+    This is the expensive PDF-parsing stage. Its output is a self-contained
+    artifact that can be saved as a sidecar (see save_artifact) and re-scored
+    later without touching the PDF again.
+    
+    Args:
+        file_path: Path to the PDF resume file
+        max_pages: Only the first max_pages pages are extracted (None = all)
+        word_budget: Stop after the page on which this many words have been
+            collected (None = no limit)
+        workers: With more than one worker, documents longer than
+            PARALLEL_MIN_PAGES are split into page ranges that are extracted
+            concurrently in separate processes and merged in page order
+        data: The PDF bytes, already in memory; file_path then only names
+            the document and is never read
+        max_words_per_page: Stop before the first page with more words than
+            this (None = no limit)
+        deadline_s: Seconds after which no further page is started
+        preflight: Triage the document first (see preflight_pdf) so that
+            unusable files are rejected before any layout analysis
+        
+    Returns:
+        Dictionary with the extracted "text", per-page "words" as
+        [x0, top, x1, bottom, text] boxes, and the source file's SHA-256.
+        "truncated" is set when a limit cut extraction short, and
+        "limit_exceeded" then says which one (see LimitExceeded.details).
+        "extract_options" records the options the text depends on (see
+        extraction_settings), so a stored sidecar is only reused under them.
+        
+    Raises:
+        PreflightError: If triage rejected the file
+        LimitExceeded: If a limit was hit before any text was extracted
+    """
+    started = time.time()
+    deadline = None if deadline_s is None else started + deadline_s
+    
+    # Parallel workers reopen the document themselves: by path when there is
+    # a file, otherwise from a copy of the bytes
+    source = data
+    if data is None:
+        if not Path(file_path).exists():
+            raise FileNotFoundError(f"Resume file not found: {file_path}")
+        
+        with open(file_path, 'rb') as f:
+            data = f.read()
+        source = file_path
+    
+    if preflight:
+        _check_pdf_bytes(data, PREFLIGHT_MAX_FILE_BYTES)
+    pdfplumber = _import_pdfplumber()
+    
+    text_parts = []
+    pages = []
+    preflight_report = None
+    try:
+        with _open_pdf(pdfplumber, data) as pdf:
+            total_pages = len(pdf.pages)
+            page_limit = total_pages if max_pages is None else min(total_pages, max_pages)
+            if preflight:
+                preflight_report = _inspect_document(pdf, data, page_limit)
+            
+            if workers > 1 and page_limit >= PARALLEL_MIN_PAGES:
+                page_results = None
+            else:
+                page_results, limit = _extract_pages(
+                    pdf.pages[:page_limit], word_budget, max_words_per_page, deadline
+                )
+        
+        if page_results is None:
+            page_results, limit = _extract_pages_parallel(
+                source, page_limit, word_budget, workers, max_words_per_page, deadline
+            )
+        
+        for page_entry, lines, _ in page_results:
+            pages.append(page_entry)
+            for line in lines:
+                text_parts.append(line)
+                text_parts.append("\n")
+        
+        if len(pages) == total_pages:
+            limit = None  # e.g. the word budget ran out on the last page
+        elif limit is None:
+            limit = _extraction_limit("max_pages", total_pages, page_limit)
+        elif limit["limit"] == "stage_deadline_s":
+            limit.update(value=round(time.time() - started, 3), threshold=deadline_s)
+        
+        text = "".join(text_parts)
+        if not text.strip():
+            if limit is not None:
+                raise LimitExceeded(**limit)
+            raise ValueError("No text could be extracted from the PDF.")
+    except (PreflightError, LimitExceeded, MemoryError):
+        raise
+    except Exception as e:
+        raise Exception(f"Error extracting text from PDF: {str(e)}")
+    
+    return {
+        "format": ARTIFACT_FORMAT,
+        "extractor_version": EXTRACTOR_VERSION,
+        "source_sha256": hashlib.sha256(data).hexdigest(),
+        "source_name": Path(file_path).name,
+        "page_count": len(pages),
+        "total_pages": total_pages,
+        "truncated": len(pages) < total_pages,
+        "limit_exceeded": limit,
+        "preflight": preflight_report,
+        "extract_options": extraction_settings({
+            "max_pages": max_pages, "word_budget": word_budget,
+            "max_words_per_page": max_words_per_page, "preflight": preflight
+        }),
+        "text": text,
+        "pages": pages
+    }
+
+
+def _extract_pages_parallel(
+    source: Union[str, bytes],
+    page_limit: int,
+    word_budget: Optional[int],
+    workers: int,
+    max_words_per_page: Optional[int] = None,
+    deadline: Optional[float] = None
+) -> Tuple[List[Tuple[Dict[str, Any], List[str], int]], Optional[Dict[str, Any]]]:
+    """
+    Extract pages [0, page_limit) across a process pool. Ranges are consumed
+    in page order; once the word budget or another limit is reached, ranges
+    that have not started yet are cancelled and later pages are dropped.
+    
+    Returns:
+        (page results, limit details or None), as from _extract_pages
+    """
+    chunk = max(1, -(-page_limit // workers))
+    ranges = [(start, min(start + chunk, page_limit)) for start in range(0, page_limit, chunk)]
+    
+    from concurrent.futures import ProcessPoolExecutor
+    
+    results = []
+    words_seen = 0
+    with ProcessPoolExecutor(max_workers=min(workers, len(ranges))) as executor:
+        futures = [
+            executor.submit(_extract_page_range, source, start, stop, word_budget, max_words_per_page, deadline)
+            for start, stop in ranges
+        ]
+        for future in futures:
+            range_results, limit = future.result()
+            for result in range_results:
+                results.append(result)
+                words_seen += result[2]
+                if word_budget is not None and words_seen >= word_budget:
+                    limit = _extraction_limit("word_budget", words_seen, word_budget)
+                    break
+            if limit is not None:
+                for pending in futures:
+                    pending.cancel()
+                return results, limit
+    return results, None
+
+
+def extract_resume_text(file_path: str, extract_options: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Extract text from PDF resume with better layout preservation.
+    extract_options are passed through to extract_resume_artifact.
+    """
+    return extract_resume_artifact(file_path, **(extract_options or {}))["text"]
+
+
+def sidecar_path(file_path: str) -> str:
+    """Location of the extraction sidecar stored next to an uploaded PDF."""
+    return str(file_path) + SIDECAR_SUFFIX
+
+
+def save_artifact(artifact: Dict[str, Any], path: str) -> None:
+    """Write an extraction artifact as compact JSON."""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(artifact, f, ensure_ascii=False, separators=(',', ':'))
+    os.replace(tmp_path, path)
+
+
+def load_artifact(path: str) -> Dict[str, Any]:
+    """
+    Read an extraction artifact written by save_artifact.
+    
+    Raises:
+        ValueError: If the file is not an artifact from this extractor version
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        artifact = json.load(f)
+    if artifact.get("format") != ARTIFACT_FORMAT or artifact.get("extractor_version") != EXTRACTOR_VERSION:
+        raise ValueError(f"Not a current extraction artifact: {path}")
+    return artifact
+
+
+def load_resume_artifact(
+    file_path: str,
+    use_sidecar: bool = False,
+    extract_options: Optional[Dict[str, Any]] = None,
+    data: Optional[bytes] = None
+) -> Dict[str, Any]:
+    """
+    Get the extraction artifact for a resume, reusing stored sidecars where
+    possible.
+    
+    Args:
+        file_path: A PDF, or a sidecar artifact (*.extract.json) to re-score
+            without the PDF
+        use_sidecar: For PDFs, reuse the sidecar next to the file when its
+            hash still matches and it was extracted under the same
+            extract_options (see extraction_settings), and write one after a
+            fresh extraction
+        extract_options: Page cap / word budget / workers for extraction
+        data: PDF bytes already in memory; they are parsed directly and no
+            sidecar is read or written (file_path only names the document)
+        
+    Returns:
+        The extraction artifact (see extract_resume_artifact)
+    """
+    if data is not None:
+        return extract_resume_artifact(file_path, data=data, **(extract_options or {}))
+    
+    if str(file_path).endswith(SIDECAR_SUFFIX):
+        return load_artifact(file_path)
+    
+    if not use_sidecar:
+        return extract_resume_artifact(file_path, **(extract_options or {}))
+    
+    artifact_path = sidecar_path(file_path)
+    if Path(artifact_path).exists() and Path(file_path).exists():
+        try:
+            artifact = load_artifact(artifact_path)
+            with open(file_path, 'rb') as f:
+                if (artifact.get("source_sha256") == hashlib.sha256(f.read()).hexdigest()
+                        and artifact.get("extract_options") == extraction_settings(extract_options)):
+                    return artifact
+        except (OSError, ValueError):
+            pass  # Stale, unreadable or extracted under other limits; extract again
+    
+    artifact = extract_resume_artifact(file_path, **(extract_options or {}))
+    if (artifact["limit_exceeded"] or {}).get("limit") in TRANSIENT_LIMITS:
+        return artifact  # A deadline cut this one short; extract in full next time
+    try:
+        save_artifact(artifact, artifact_path)
+    except OSError:
+        pass  # Read-only upload directory; the analysis itself still succeeds
+    return artifact
+
+
+def load_resume_text(
+    file_path: str,
+    use_sidecar: bool = False,
+    extract_options: Optional[Dict[str, Any]] = None,
+    data: Optional[bytes] = None
+) -> str:
+    """
+    Get resume text, reusing stored extraction artifacts where possible
+    (see load_resume_artifact).
+    """
+    return load_resume_artifact(file_path, use_sidecar, extract_options, data)["text"]
+
+
+def extract_skills(resume_text: Union[str, ResumeDocument]) -> Dict[str, List[str]]:
+    """
+    Extract skills from resume text based on comprehensive skill database.
+    
+    Args:
+        resume_text: The resume text content (or its ResumeDocument)
+        
+    Returns:
+        Dictionary of categorized skills found in the resume
+    """
+    found = match_skills(as_document(resume_text).lower)
+    
+    # Credit each skill to every category that lists it (e.g. "bash" is in
+    # both Programming and Tools), keeping SKILL_DB order within a category
+    return {
+        category: [skill for skill in skills if skill in found]
+        for category, skills in SKILL_DB.items()
+    }
+
+
+def detect_sections(resume_text: Union[str, ResumeDocument]) -> Dict[str, bool]:
+    """
+    Detect presence of key resume sections.
+    
+    Args:
+        resume_text: The resume text content (or its ResumeDocument)
+        
+    Returns:
+        Dictionary indicating which sections are present
+    """
+    doc = as_document(resume_text)
+    if "sections" in doc.memo:
+        return dict(doc.memo["sections"])
+    
+    found = SECTION_FAMILY.hits(doc.lower)
+    sections = {section: section in found for section in SECTION_FAMILY.labels.values()}
+    
+    doc.memo["sections"] = sections
+    return dict(sections)
+
+
+def ats_score_codes(resume_text: Union[str, ResumeDocument], skills_found: Dict[str, List[str]]) -> Tuple[int, List[Message], List[Message], Dict[str, int]]:
+    """
+    Calculate comprehensive ATS score, with strengths and weaknesses as
+    messages (see advice_messages). calculate_ats_score renders them.
+    Each of the 5 categories is worth 20 points, totaling 100.
+    """
+    strengths = []
+    weaknesses = []
+    
+    doc = as_document(resume_text)
+    text = doc.lower
+    words = doc.tokens
+    word_count = len(words)
+    
+    # 1. FORMATTING (20 points: 15 for sections + 5 for length)
+    sections = detect_sections(doc)
+    section_points = sum(3 for present in sections.values() if present) # 5 sections * 3 = 15
+    for section, present in sections.items():
+        if present:
+            strengths.append(["strength.section_present", {"section": section}])
+        else:
+            weaknesses.append(["weakness.section_missing", {"section": section}])
+            
+    len_points = 0
+    if 400 <= word_count <= 700: len_points = 5
+    elif 300 <= word_count <= 900: len_points = 4
+    
+    formatting_score = section_points + len_points # Max 20
+
+    # 2. SKILLS MATCH (20 points)
+    total_skills = sum(len(v) for v in skills_found.values())
+    skills_score = 0
+    if total_skills >= 20: skills_score = 20
+    elif total_skills >= 15: skills_score = 18
+    elif total_skills >= 10: skills_score = 15
+    elif total_skills >= 6: skills_score = 10
+    else: skills_score = 5
+    
+    if skills_score >= 15:
+        strengths.append(["strength.skills", {"count": total_skills}])
+    
+    # 3. EXPERIENCE RELEVANCE (20 points)
+    exp_hits = len(ACTION_VERB_FAMILY.hits(text))
+    experience_score = 0
+    if exp_hits >= 8: experience_score = 20
+    elif exp_hits >= 5: experience_score = 16
+    elif exp_hits >= 3: experience_score = 12
+    elif exp_hits >= 1: experience_score = 8
+    
+    if experience_score >= 12:
+        strengths.append(["strength.action_verbs", {"count": exp_hits}])
+        
+    # 4. KEYWORDS (20 points)
+    unique_words = doc.token_set
+    unique_ratio = len(unique_words) / max(len(words), 1)
+    keywords_score = 0
+    if unique_ratio > 0.50: keywords_score = 20
+    elif unique_ratio > 0.45: keywords_score = 16
+    elif unique_ratio > 0.35: keywords_score = 12
+    
+    if keywords_score >= 12:
+        strengths.append(["strength.keyword_diversity", {}])
+
+    # 5. EDUCATION (20 points)
+    edu_found = DEGREE_FAMILY.any(text)
+    education_score = 20 if edu_found else 0
+    if edu_found:
+        strengths.append(["strength.education", {}])
+
+    # CONTACT INFORMATION (Bonus analysis)
+    has_email = bool(EMAIL_PATTERN.search(text))
+    has_phone = bool(PHONE_PATTERN.search(text))
+    has_linkedin = bool(LINKEDIN_PATTERN.search(text))
+    has_github = bool(GITHUB_PATTERN.search(text))
+    _count_scans(5)  # The four contact patterns above plus QUANTIFIED_PATTERN
+    contact_count = sum([has_email, has_phone, has_linkedin, has_github])
+    
+    if contact_count >= 3:
+        strengths.append(["strength.contact_complete", {"count": contact_count}])
+    elif contact_count >= 2:
+        strengths.append(["strength.contact_good", {"count": contact_count}])
+    
+    # QUANTIFIABLE ACHIEVEMENTS (Bonus analysis)
+    if bool(QUANTIFIED_PATTERN.search(text)):
+        strengths.append(["strength.metrics", {}])
+
+    total_score = formatting_score + skills_score + experience_score + keywords_score + education_score
+    
+    score_breakdown = {
+        "formatting": formatting_score,
+        "skills": skills_score,
+        "experience": experience_score,
+        "keywords": keywords_score,
+        "education": education_score
+    }
+    
+    return total_score, strengths, weaknesses, score_breakdown
+
+
+def calculate_ats_score(resume_text: Union[str, ResumeDocument], skills_found: Dict[str, List[str]]) -> Tuple[int, Dict[str, Any], List[Dict[str, str]], Dict[str, int]]:
+    """
+    Calculate comprehensive ATS score. 
+    Each of the 5 categories is worth 20 points, totaling 100.
+    """
+    total_score, strengths, weaknesses, score_breakdown = ats_score_codes(resume_text, skills_found)
+    return total_score, render_strengths(strengths, total_score), render_weaknesses(weaknesses), score_breakdown
+
+
+# Static gap tables, built once from SKILL_DB and SKILL_DETAILS:
+#   GAP_TABLE_BY_CATEGORY    category -> (skill set, ((skill, importance, ats_impact), ...))
+#   GAP_TABLE_BY_IMPORTANCE  importance -> ((category, skill), ...)
+#   GAP_IMPORTANCE_SETS      category -> {importance: skill set}
+# Entries keep SKILL_DB order, so slicing a table gives the same "first N
+# missing" skills as walking SKILL_DB. A skill listed twice in one category
+# counts once.
+DEFAULT_SKILL_DETAIL = {
+    "importance": "Medium",
+    "ats_impact": "Skill adds value to specific roles and may improve ATS matching for relevant positions."
+}
+
+
+def _build_gap_tables():
+    by_category = {}
+    by_importance = {}
+    importance_sets = {}
+    for category, skills in SKILL_DB.items():
+        entries = {}
+        for skill in skills:
+            if skill in entries:
+                continue
+            detail = SKILL_DETAILS.get(skill, DEFAULT_SKILL_DETAIL)
+            entries[skill] = (skill, detail["importance"], detail["ats_impact"])
+            by_importance.setdefault(detail["importance"], []).append((category, skill))
+        by_category[category] = (frozenset(entries), tuple(entries.values()))
+        levels = {}
+        for skill, importance, _ in entries.values():
+            levels.setdefault(importance, set()).add(skill)
+        importance_sets[category] = {importance: frozenset(level) for importance, level in levels.items()}
+    return by_category, {k: tuple(v) for k, v in by_importance.items()}, importance_sets
+
+
+GAP_TABLE_BY_CATEGORY, GAP_TABLE_BY_IMPORTANCE, GAP_IMPORTANCE_SETS = _build_gap_tables()
+
+
+def _top_missing(importance: str, missing: Dict[str, frozenset], limit: int) -> List[str]:
+    """The first `limit` missing skills of one importance level, in SKILL_DB order."""
+    top = []
+    if limit <= 0:
+        return top
+    for category, skill in GAP_TABLE_BY_IMPORTANCE.get(importance, ()):
+        missing_in_category = missing.get(category)
+        if missing_in_category and skill in missing_in_category:
+            top.append(skill)
+            if len(top) == limit:
+                break
+    return top
+
+
+def _missing_skills(skills_found: Dict[str, List[str]]) -> Dict[str, frozenset]:
+    """Missing skills per category, as set differences against the gap tables."""
+    missing = {}
+    for category, (category_skills, _) in GAP_TABLE_BY_CATEGORY.items():
+        category_missing = category_skills.difference(skills_found[category])
+        if category_missing:
+            missing[category] = category_missing
+    return missing
+
+
+def _missing_by_category(missing: Dict[str, frozenset]) -> Dict[str, List[Dict[str, str]]]:
+    """Missing skills with their importance and ATS impact, in SKILL_DB order."""
+    return {
+        category: [
+            {"skill": skill, "importance": importance, "ats_impact": ats_impact}
+            for skill, importance, ats_impact in GAP_TABLE_BY_CATEGORY[category][1]
+            if skill in category_missing
+        ]
+        for category, category_missing in missing.items()
+    }
+
+
+def _gap_codes(missing: Dict[str, frozenset]) -> Dict[str, Any]:
+    num_gaps = sum(len(m) for m in missing.values())
+    priority_counts = {"High": 0, "Medium": 0, "Low": 0}
+    for category, category_missing in missing.items():
+        for importance, level_skills in GAP_IMPORTANCE_SETS[category].items():
+            priority_counts[importance] = priority_counts.get(importance, 0) + len(category_missing & level_skills)
+    
+    # If no gaps found - excellent coverage
+    if not num_gaps:
+        return {
+            "messages": {
+                "summary": ["gaps.none.summary", {}],
+                "overall_impact": ["gaps.none.impact", {}],
+                "recommendation": ["gaps.none.recommendation", {}]
+            },
+            "missing_skills_count": 0,
+            "high_priority_gaps": [],
+            "medium_priority_gaps": []
+        }
+    
+    # Only the slices that are reported are materialized
+    high_count = priority_counts["High"]
+    medium_count = priority_counts["Medium"]
+    low_count = priority_counts["Low"]
+    high_priority_gaps = _top_missing("High", missing, min(10, high_count))
+    medium_priority_gaps = _top_missing("Medium", missing, min(10, medium_count))
+    low_priority_gaps = _top_missing("Low", missing, min(10, low_count))
+    
+    # Generate summary highlighting top missing skills
+    top_missing_high = high_priority_gaps[:5]
+    top_missing_medium = medium_priority_gaps[:5]
+    
+    if top_missing_high:
+        summary_preview = top_missing_high
+    elif top_missing_medium:
+        summary_preview = top_missing_medium
+    else:
+        summary_preview = sorted(set().union(*missing.values()))[:10]
+    
+    summary = ["gaps.summary", {
+        "total": num_gaps, "high": high_count, "medium": medium_count, "low": low_count, "skills": summary_preview
+    }]
+    
+    # Determine overall ATS impact based on missing skill priorities
+    if high_count >= num_gaps / 2 and high_count >= 5:
+        impact_level = "CRITICAL"
+        overall_impact = ["gaps.impact.critical", {"high": high_count, "skills": high_priority_gaps[:3]}]
+    elif high_count >= 3:
+        impact_level = "MODERATE"
+        overall_impact = ["gaps.impact.moderate", {
+            "high": high_count, "medium": medium_count, "skills": high_priority_gaps[:3]
+        }]
+    elif medium_count >= 10:
+        impact_level = "LOW TO MODERATE"
+        overall_impact = ["gaps.impact.low_to_moderate", {"medium": medium_count}]
+    else:
+        impact_level = "LOW"
+        overall_impact = ["gaps.impact.low", {}]
+    
+    # Generate comprehensive recommendations
+    if high_count > 0:
+        recommendation = ["gaps.recommendation.high", {"high": high_count, "skills": high_priority_gaps[:5]}]
     elif medium_count > 0:
-        consolidated_recommendation = (
-            f"📈 RECOMMENDED IMPROVEMENTS:\n"
-            f"1. Expand your skillset gradually by learning medium-priority skills like: {', '.join([g['skill'] for g in medium_importance_gaps[:5]])}.\n"
-            f"2. Integrate new skills into your existing projects and update your resume accordingly.\n"
-            f"3. Focus on skills relevant to your target role and industry.\n"
-            f"4. Use online resources, certifications, or personal projects to demonstrate competency."
-        )
+        recommendation = ["gaps.recommendation.medium", {"skills": medium_priority_gaps[:5]}]
+    else:
+        recommendation = ["gaps.recommendation.maintain", {}]
+    
+    return {
+        "messages": {
+            "summary": summary,
+            "overall_impact": overall_impact,
+            "recommendation": recommendation
+        },
+        "impact_level": impact_level,
+        "missing_skills_count": num_gaps,
+        "high_priority_gaps": high_priority_gaps,
+        "medium_priority_gaps": medium_priority_gaps,
+        "low_priority_gaps": low_priority_gaps,
+        "priority_breakdown": {
+            "high": high_count,
+            "medium": medium_count,
+            "low": low_count
+        }
+    }
+
+
+def skill_gap_codes(skills_found: Dict[str, List[str]]) -> Dict[str, Any]:
+    """
+    Skill gap analysis with its summary, impact and recommendation as
+    messages (see advice_messages.render_skill_gaps) and without
+    missing_by_category, which follows from skills_found.
+    """
+    return _gap_codes(_missing_skills(skills_found))
+
+
+def skill_gap_analysis(skills_found: Dict[str, List[str]]) -> Dict[str, Any]:
+    """
+    Analyze skill gaps with comprehensive ATS impact assessment.
+    
+    Args:
+        skills_found: Dictionary of categorized skills found in resume
+        
+    Returns:
+        Dictionary containing gap analysis summary, impact, and recommendations
+    """
+    missing = _missing_skills(skills_found)
+    return render_skill_gaps(_gap_codes(missing), _missing_by_category(missing))
+
+
+def advice_codes(ats_score: int, has_strengths: bool, has_weaknesses: bool, has_skill_gaps: bool) -> List[Message]:
+    """
+    The blocks of the optimization report, in order, as messages (see
+    advice_messages.render_advice). The report header and footer are implied.
+    """
+    if ats_score >= 85:
+        band = "excellent"
+    elif ats_score >= 70:
+        band = "strong"
+    elif ats_score >= 55:
+        band = "good"
+    elif ats_score >= 40:
+        band = "needs_improvement"
     else:
-        consolidated_recommendation = (
-            f"✓ MAINTAIN AND REFINE:\n"
-            f"1. Your skill coverage is strong. Continue to keep current skills updated.\n"
-            f"2. Stay informed about emerging technologies in your field.\n"
-            f"3. Tailor your resume for specific job applications by emphasizing relevant skills from your existing skillset."
-        )
+        band = "critical"
+    advice = [[f"advice.score.{band}", {"score": ats_score}]]
     
-    return {
-        "summary": summary_text,
-        "overall_impact": overall_impact_summary,
-        "impact_level": impact_level,
-        "recommendation": consolidated_recommendation,
-        "missing_skills_count": num_gaps,
-        "high_priority_gaps": [g["skill"] for g in high_importance_gaps[:10]],
-        "medium_priority_gaps": [g["skill"] for g in medium_importance_gaps[:10]],
-        "low_priority_gaps": [g["skill"] for g in low_importance_gaps[:10]],
-        "missing_by_category": missing_by_category,
-        "priority_breakdown": {
-            "high": high_count,
-            "medium": medium_count,
-            "low": low_count
-        }
-    }
+    if has_strengths:
+        advice.append(["advice.strengths", {}])
+    if has_weaknesses:
+        advice.append(["advice.weaknesses", {}])
+    if has_skill_gaps:
+        advice.append(["advice.skill_gaps", {}])
+    advice.append(["advice.tips", {}])
+    
+    if ats_score < 60:
+        advice.append(["advice.next_steps.immediate", {}])
+    elif ats_score < 80:
+        advice.append(["advice.next_steps.recommended", {}])
+    else:
+        advice.append(["advice.next_steps.optimization", {}])
+    return advice
 
 
 def get_ats_optimization_advice(
@@ -629,190 +2210,438 @@ def get_ats_optimization_advice(
     Returns:
         List of actionable advice strings formatted for easy reading
     """
-    advice = []
-    
-    # ========================================================================
-    # OVERALL SCORE ASSESSMENT
-    # ========================================================================
-    advice.append("=" * 70)
-    advice.append("ATS RESUME ANALYSIS REPORT")
-    advice.append("=" * 70)
-    advice.append("")
+    has_strengths = bool(enhanced_strengths and enhanced_strengths.get('individual_tips'))
+    messages = advice_codes(ats_score, has_strengths, bool(resume_weaknesses), bool(skill_gaps))
+    return render_advice(messages, enhanced_strengths, resume_weaknesses, skill_gaps)
+
+
+def document_hash(file_path: str, data: Optional[bytes] = None) -> str:
+    """SHA-256 hex digest of a document as the cache keys it: data, or the bytes at file_path."""
+    if data is None:
+        with open(file_path, 'rb') as f:
+            data = f.read()
+    return hashlib.sha256(data).hexdigest()
+
+
+def extraction_fingerprint(extract_options: Optional[Dict[str, Any]] = None) -> str:
+    """Fingerprint of the extraction_settings of extract_options, for cache keys."""
+    settings = extraction_settings(extract_options)
+    return hashlib.sha256(json.dumps(settings, sort_keys=True).encode("utf-8")).hexdigest()[:16]
+
+
+def cache_lookup(
+    cache: Optional["AnalysisCache"],
+    file_path: str,
+    kind: str = "analyze_resume",
+    rules_fingerprint: str = RULES_FINGERPRINT,
+    data: Optional[bytes] = None,
+    content_hash: Optional[str] = None,
+    extract_options: Optional[Dict[str, Any]] = None
+) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+    """
+    Look up a cached result for the PDF at file_path.
     
-    if ats_score >= 85:
-        advice.append(f"✓✓✓ EXCELLENT! Your resume scored {ats_score}/100")
-        advice.append("")
-        advice.append("Your resume is highly optimized for ATS systems. You're in the top tier")
-        advice.append("and should pass most automated screenings. Focus on tailoring for specific")
-        advice.append("roles to maximize your success rate.")
-    elif ats_score >= 70:
-        advice.append(f"✓✓ STRONG! Your resume scored {ats_score}/100")
-        advice.append("")
-        advice.append("Your resume is well-optimized and likely to pass most ATS screenings.")
-        advice.append("With some targeted improvements, you can reach the excellent tier.")
-    elif ats_score >= 55:
-        advice.append(f"◐ GOOD! Your resume scored {ats_score}/100")
-        advice.append("")
-        advice.append("Your resume will pass many ATS screenings but has significant room for")
-        advice.append("improvement. Focus on the high-priority items below to boost your score.")
-    elif ats_score >= 40:
-        advice.append(f"⚠ NEEDS IMPROVEMENT! Your resume scored {ats_score}/100")
-        advice.append("")
-        advice.append("Your resume may struggle with many ATS systems. Immediate optimization")
-        advice.append("is recommended to improve your chances of getting past automated screening.")
-    else:
-        advice.append(f"⚠⚠ CRITICAL! Your resume scored {ats_score}/100")
-        advice.append("")
-        advice.append("Your resume is at high risk of being filtered out by ATS systems.")
-        advice.append("Urgent optimization needed. Follow the recommendations below carefully.")
-    
-    advice.append("")
-    
-    # ========================================================================
-    # STRENGTHS SECTION
-    # ========================================================================
-    if enhanced_strengths and enhanced_strengths.get('individual_tips'):
-        advice.append("=" * 70)
-        advice.append("✓ YOUR STRENGTHS")
-        advice.append("=" * 70)
-        advice.append("")
-        advice.append(enhanced_strengths.get('summary', 'Your resume has several strong points.'))
-        advice.append("")
-        advice.append("KEY STRENGTHS:")
-        
-        for i, tip in enumerate(enhanced_strengths['individual_tips'][:8], 1):
-            advice.append(f"  {i}. {tip}")
-        
-        advice.append("")
-    
-    # ========================================================================
-    # WEAKNESSES SECTION - PRIORITIZED
-    # ========================================================================
-    if resume_weaknesses:
-        advice.append("=" * 70)
-        advice.append("⚠ AREAS FOR IMMEDIATE IMPROVEMENT")
-        advice.append("=" * 70)
-        advice.append("")
-        advice.append(f"Identified {len(resume_weaknesses)} issues that need attention:")
-        advice.append("")
-        
-        for i, weakness in enumerate(resume_weaknesses[:10], 1):
-            advice.append(f"{i}. ISSUE: {weakness.get('weakness', 'Issue identified')}")
-            advice.append(f"   IMPACT: {weakness.get('impact', 'May affect ATS performance')}")
-            advice.append(f"   FIX: {weakness.get('fix', 'Address this issue')}")
-            advice.append("")
-    
-    # ========================================================================
-    # SKILL GAP ANALYSIS
-    # ========================================================================
-    if skill_gaps:
-        advice.append("=" * 70)
-        advice.append("📊 SKILL GAP ANALYSIS")
-        advice.append("=" * 70)
-        advice.append("")
-        
-        advice.append(f"SUMMARY: {skill_gaps.get('summary', 'Analysis complete')}")
-        advice.append("")
+    Args:
+        cache: Cache to consult, or None to disable caching
+        file_path: Path to the PDF resume file
+        kind: Pipeline that produced the result (see AnalysisCache.make_key)
+        rules_fingerprint: Fingerprint of the rules the result depends on
+        data: PDF bytes already in memory, keyed instead of reading file_path
+        content_hash: The document's document_hash, if already computed
+        extract_options: The extraction options in effect (including the
+            policy's, see ExecutionPolicy.extract_options); results of the
+            same PDF under other page caps or word budgets are kept apart
         
-        advice.append(f"ATS IMPACT: {skill_gaps.get('overall_impact', 'Variable impact based on role')}")
-        advice.append("")
+    Returns:
+        (cache_key, result). The key is None when caching is disabled; the
+        result is None on a miss, otherwise it is re-stamped with this
+        file's path and marked as a cache hit.
+    """
+    if cache is None:
+        return None, None
+    
+    if content_hash is None:
+        content_hash = document_hash(file_path, data)
+    key = cache.content_key(content_hash, ANALYSIS_VERSION, rules_fingerprint, kind=kind,
+                            options=extraction_fingerprint(extract_options))
+    
+    result = cache.get(key)
+    if result is not None:
+        metadata = result.setdefault("metadata", {})
+        metadata["file_path"] = file_path
+        metadata["file_name"] = Path(file_path).name
+        metadata["cache_hit"] = True
+    return key, result
+
+
+# ============================================================================
+# NEAR-DUPLICATE REUSE - Answer copies of an analyzed resume from its result
+# ============================================================================
+#
+# A result is a function of the extracted text alone (the file name aside),
+# so a resume whose text is exactly that of an analyzed one reuses its
+# result. A near-duplicate whose text differs even by a name or a contact
+# line is scored from its own text: every field, the score included, can
+# depend on the difference. The index only reports it as a near-duplicate.
+
+# Estimated text similarity from which an upload is reported as a
+# near-duplicate of an already analyzed resume. near_duplicates.py queries
+# default to it too, so an index gives the same answers from either
+NEAR_DUPLICATE_THRESHOLD = 0.95
+
+
+def open_near_duplicate_index(location: str) -> "NearDuplicateIndex":
+    """Open (or create) the near-duplicate index file at location."""
+    try:
+        from near_duplicates import NearDuplicateIndex
+    except ImportError:
+        raise ImportError("numpy not installed. Run: pip install numpy")
+    return NearDuplicateIndex.open(location, create=True)
+
+
+def text_cache_lookup(
+    cache: Optional["AnalysisCache"],
+    artifact: Dict[str, Any],
+    file_path: str,
+    kind: str = "analyze_resume",
+    rules_fingerprint: str = RULES_FINGERPRINT
+) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+    """
+    Look up a cached result scored from exactly this artifact's text, e.g.
+    of another file holding the same resume.
+    
+    Args:
+        cache: Cache to consult, or None to disable caching
+        artifact: This resume's extraction artifact
+        file_path: Path recorded in the reused result's metadata
+        kind: Pipeline whose result is wanted (see cache_lookup)
+        rules_fingerprint: Fingerprint of the rules the result depends on
         
-        # Show high priority gaps prominently
-        if skill_gaps.get('high_priority_gaps'):
-            advice.append("🎯 HIGH-PRIORITY MISSING SKILLS (Learn These First):")
-            for skill in skill_gaps['high_priority_gaps'][:8]:
-                advice.append(f"  • {skill}")
-            advice.append("")
+    Returns:
+        (cache_key, result), as cache_lookup. The key is derived from the
+        text, so the same text keys the same result whatever the extraction
+        options; the reused result carries this artifact's extraction
+        caveats instead of those it was stored with.
+    """
+    if cache is None:
+        return None, None
+    
+    text_hash = hashlib.sha256(artifact["text"].encode("utf-8")).hexdigest()
+    key = cache.content_key(text_hash, ANALYSIS_VERSION, rules_fingerprint, kind=kind, options="text")
+    
+    result = cache.get(key)
+    if result is not None:
+        result.pop("partial", None)
+        result.pop("limit_exceeded", None)
+        metadata = result.setdefault("metadata", {})
+        metadata.pop("preflight_flags", None)
+        metadata["file_path"] = file_path
+        metadata["file_name"] = Path(file_path).name
+        metadata["cache_hit"] = True
+        annotate_result(result, artifact)
+    return key, result
+
+
+def near_duplicate_lookup(
+    index: "NearDuplicateIndex",
+    artifact: Dict[str, Any],
+    content_hash: str,
+    threshold: float = NEAR_DUPLICATE_THRESHOLD
+) -> Tuple[Optional[Any], Optional[Dict[str, Any]]]:
+    """
+    Fingerprint a resume and find the analyzed resume whose extracted text
+    is most similar to it (a template copy with a name or a date changed).
+    
+    Args:
+        index: NearDuplicateIndex keyed by document_hash
+        artifact: This resume's extraction artifact
+        content_hash: This resume's document_hash, left out of the matches
+        threshold: Minimum estimated similarity of the two texts
         
-        # Show medium priority if space
-        if skill_gaps.get('medium_priority_gaps') and len(skill_gaps.get('high_priority_gaps', [])) < 5:
-            advice.append("📈 MEDIUM-PRIORITY MISSING SKILLS (Consider Learning):")
-            for skill in skill_gaps['medium_priority_gaps'][:5]:
-                advice.append(f"  • {skill}")
-            advice.append("")
+    Returns:
+        (signature, duplicate_of). The signature is this resume's MinHash
+        signature, to add it to the index once analyzed; None when the text
+        was cut short by a limit or has no words. duplicate_of is
+        {"document_sha256", "similarity"} of the closest match, for
+        metadata["near_duplicate_of"], or None. The match's path is not
+        included: it names another student's upload.
+    """
+    if artifact.get("limit_exceeded"):
+        return None, None  # Partial text is not this document's fingerprint
+    signature = index.signature(artifact["text"])
+    if signature is None:
+        return None, None
+    
+    matches = index.query(signature, threshold=threshold, k=1, exclude=content_hash)
+    if not matches:
+        return signature, None
+    match_hash, similarity = matches[0]
+    return signature, {"document_sha256": match_hash, "similarity": round(similarity, 3)}
+
+
+# ============================================================================
+# ANALYSIS PROFILES - Run only the stages the requested outputs depend on
+# ============================================================================
+
+# Scoring stages and the stages whose output each one reads
+STAGE_DEPENDENCIES: Dict[str, List[str]] = {
+    "skills": [],
+    "score": ["skills"],
+    "skill_gaps": ["skills"],
+    "advice": ["score", "skill_gaps"],
+    "sections": [],
+}
+
+# stage -> fn(doc, outputs of the stages run so far). Strengths, weaknesses,
+# gaps and advice come out as messages; stage_fields renders them as needed
+STAGE_RUNNERS: Dict[str, Callable[[ResumeDocument, Dict[str, Any]], Any]] = {
+    "skills": lambda doc, done: extract_skills(doc),
+    "score": lambda doc, done: ats_score_codes(doc, done["skills"]),
+    "skill_gaps": lambda doc, done: skill_gap_codes(done["skills"]),
+    "advice": lambda doc, done: advice_codes(
+        done["score"][0], bool(done["score"][1]), bool(done["score"][2]), bool(done["skill_gaps"])
+    ),
+    "sections": lambda doc, done: detect_sections(doc),
+}
+
+# Profile -> stages whose outputs it asks for (their dependencies run too).
+# Each profile includes everything the one before it returns:
+#   score   ats_score and score_breakdown, for bulk ranking
+#   skills  plus skill gaps (and suggested roles in the wrapper)
+#   full    every field
+ANALYSIS_PROFILES: Dict[str, List[str]] = {
+    "score": ["score"],
+    "skills": ["score", "skill_gaps"],
+    "full": list(STAGE_DEPENDENCIES),
+}
+DEFAULT_PROFILE = "full"
+
+# How strengths, weaknesses, skill gaps and advice are reported:
+#   text   rendered sentences, as the frontend displays them
+#   codes  [code, params] messages (see advice_messages) and no
+#          missing_by_category; render_result turns them into text later
+ADVICE_FORMATS = ["text", "codes"]
+DEFAULT_ADVICE_FORMAT = "text"
+
+
+def profile_cache_kind(kind: str, profile: str, advice_format: str = DEFAULT_ADVICE_FORMAT) -> str:
+    """Cache kind for a profile's results; full text results keep the plain kind."""
+    if profile != DEFAULT_PROFILE:
+        kind = f"{kind}:{profile}"
+    return kind if advice_format == DEFAULT_ADVICE_FORMAT else f"{kind}:{advice_format}"
+
+
+def check_advice_format(advice_format: str) -> None:
+    """
+    Raises:
+        ValueError: If advice_format is not one of ADVICE_FORMATS
+    """
+    if advice_format not in ADVICE_FORMATS:
+        raise ValueError(f"Unknown advice format: {advice_format} (choose from {', '.join(ADVICE_FORMATS)})")
+
+
+def resolve_stages(targets: List[str], dependencies: Dict[str, List[str]] = STAGE_DEPENDENCIES) -> List[str]:
+    """
+    Every stage the targets need, each listed after the stages it depends on.
+    
+    Raises:
+        ValueError: If a stage is not in the dependency graph
+    """
+    order = []
+    
+    def visit(stage: str) -> None:
+        if stage not in dependencies:
+            raise ValueError(f"Unknown analysis stage: {stage}")
+        if stage not in order:
+            for dependency in dependencies[stage]:
+                visit(dependency)
+            order.append(stage)
+    
+    for target in targets:
+        visit(target)
+    return order
+
+
+def profile_stages(
+    profile: str,
+    profiles: Dict[str, List[str]] = ANALYSIS_PROFILES,
+    dependencies: Dict[str, List[str]] = STAGE_DEPENDENCIES
+) -> List[str]:
+    """
+    Stages to run, in order, for a named profile.
+    
+    Raises:
+        ValueError: If the profile is unknown
+    """
+    if profile not in profiles:
+        raise ValueError(f"Unknown analysis profile: {profile} (choose from {', '.join(profiles)})")
+    return resolve_stages(profiles[profile], dependencies)
+
+
+def run_stages(
+    doc: ResumeDocument,
+    stages: List[str],
+    runners: Dict[str, Callable[[ResumeDocument, Dict[str, Any]], Any]] = STAGE_RUNNERS,
+    instrumentation: Union[Instrumentation, _NullInstrumentation] = NULL_INSTRUMENTATION
+) -> Dict[str, Any]:
+    """Run stages in order (see resolve_stages); returns stage -> output."""
+    done = {}
+    for stage in stages:
+        with instrumentation.stage(stage):
+            done[stage] = runners[stage](doc, done)
+    return done
+
+
+def _render_fields(fields: Dict[str, Any]) -> None:
+    """Render the message fields of a "codes" result in place."""
+    if "enhanced_strengths" in fields:
+        fields["enhanced_strengths"] = render_strengths(fields["enhanced_strengths"], fields["ats_score"])
+    if "resume_weaknesses" in fields:
+        fields["resume_weaknesses"] = render_weaknesses(fields["resume_weaknesses"])
+    if "skill_gaps" in fields:
+        missing = _missing_skills(fields["skills_found"])
+        fields["skill_gaps"] = render_skill_gaps(fields["skill_gaps"], _missing_by_category(missing))
+    if "ats_optimization_advice" in fields:
+        fields["ats_optimization_advice"] = render_advice(
+            fields["ats_optimization_advice"], fields["enhanced_strengths"],
+            fields["resume_weaknesses"], fields["skill_gaps"]
+        )
+
+
+def stage_fields(done: Dict[str, Any], advice_format: str = DEFAULT_ADVICE_FORMAT) -> Dict[str, Any]:
+    """
+    Result fields produced by the scoring stages in done (see run_stages),
+    with messages rendered unless advice_format is "codes".
+    """
+    fields = {}
+    if "score" in done:
+        ats_score, enhanced_strengths, resume_weaknesses, score_breakdown = done["score"]
+        fields["ats_score"] = ats_score
+        fields["score_breakdown"] = score_breakdown
+    if "skills" in done:
+        fields["skills_found"] = done["skills"]
+        fields["total_skills_found"] = sum(len(v) for v in done["skills"].values())
+    if "skill_gaps" in done:
+        fields["skill_gaps"] = done["skill_gaps"]
+    if "score" in done:
+        fields["enhanced_strengths"] = enhanced_strengths
+        fields["resume_weaknesses"] = resume_weaknesses
+    if "advice" in done:
+        fields["ats_optimization_advice"] = done["advice"]
+    if advice_format != "codes":
+        _render_fields(fields)
+    return fields
+
+
+def render_result(result: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    The "text" form of a stored "codes" result, identical to what the
+    analysis returns with advice_format "text". Other results (text, errors)
+    are returned as they are; the given result is not modified.
+    """
+    metadata = result.get("metadata") or {}
+    if metadata.get("advice_format") != "codes":
+        return result
+    rendered = dict(result)
+    rendered["metadata"] = {**metadata, "advice_format": "text"}
+    _render_fields(rendered)
+    return rendered
+
+
+def score_resume_text(
+    resume_text: Union[str, ResumeDocument],
+    file_path: str,
+    instrumentation: Union[Instrumentation, _NullInstrumentation] = NULL_INSTRUMENTATION,
+    profile: str = DEFAULT_PROFILE,
+    advice_format: str = DEFAULT_ADVICE_FORMAT
+) -> Dict[str, Any]:
+    """
+    Scoring stage: run the scoring rules of a profile over already-extracted text.
+    
+    Args:
+        resume_text: Text produced by the extraction stage (or its ResumeDocument)
+        file_path: Source path recorded in the result metadata
+        instrumentation: Collector for per-stage timings (see start_instrumentation);
+            the caller decides whether to attach its report to the result
+        profile: Which outputs to compute (see ANALYSIS_PROFILES); stages
+            no requested output depends on are skipped
+        advice_format: "text" or "codes" (see ADVICE_FORMATS)
         
-        advice.append("RECOMMENDATION:")
-        advice.append(skill_gaps.get('recommendation', 'Continue skill development'))
-        advice.append("")
-    
-    # ========================================================================
-    # GENERAL OPTIMIZATION TIPS
-    # ========================================================================
-    advice.append("=" * 70)
-    advice.append("💡 GENERAL ATS OPTIMIZATION TIPS")
-    advice.append("=" * 70)
-    advice.append("")
-    advice.append("1. TAILOR FOR EACH JOB:")
-    advice.append("   • Customize your resume for each application")
-    advice.append("   • Mirror keywords from the job description")
-    advice.append("   • Highlight most relevant experiences first")
-    advice.append("")
-    advice.append("2. USE STANDARD FORMATTING:")
-    advice.append("   • Use standard section headers (Experience, Education, Skills)")
-    advice.append("   • Avoid tables, text boxes, headers/footers")
-    advice.append("   • Use standard fonts (Arial, Calibri, Times New Roman)")
-    advice.append("   • Save as PDF for consistency")
-    advice.append("")
-    advice.append("3. OPTIMIZE KEYWORD USAGE:")
-    advice.append("   • Include both acronyms and full terms (AI and Artificial Intelligence)")
-    advice.append("   • Use industry-standard terminology")
-    advice.append("   • Add relevant synonyms naturally")
-    advice.append("")
-    advice.append("4. QUANTIFY ACHIEVEMENTS:")
-    advice.append("   • Use specific metrics (increased by 40%, managed team of 5)")
-    advice.append("   • Include numbers, percentages, timeframes")
-    advice.append("   • Show tangible impact of your work")
-    advice.append("")
-    advice.append("5. PROOFREAD CAREFULLY:")
-    advice.append("   • Check for spelling and grammar errors")
-    advice.append("   • Ensure consistent formatting")
-    advice.append("   • Verify all dates and information are accurate")
-    advice.append("")
-    
-    # ========================================================================
-    # FINAL RECOMMENDATIONS
-    # ========================================================================
-    advice.append("=" * 70)
-    advice.append("🎯 NEXT STEPS")
-    advice.append("=" * 70)
-    advice.append("")
+    Returns:
+        The analysis result dictionary (see analyze_resume)
     
-    if ats_score < 60:
-        advice.append("IMMEDIATE PRIORITY:")
-        advice.append("1. Fix all critical weaknesses listed above")
-        advice.append("2. Add missing sections (if any)")
-        advice.append("3. Expand your skills section significantly")
-        advice.append("4. Add quantifiable achievements with metrics")
-        advice.append("5. Reanalyze your resume after changes")
-    elif ats_score < 80:
-        advice.append("RECOMMENDED ACTIONS:")
-        advice.append("1. Address high-impact weaknesses first")
-        advice.append("2. Add 5-10 more relevant technical skills")
-        advice.append("3. Incorporate more action verbs in experience descriptions")
-        advice.append("4. Add specific metrics to demonstrate impact")
-        advice.append("5. Review and update based on target job descriptions")
-    else:
-        advice.append("OPTIMIZATION ACTIONS:")
-        advice.append("1. Fine-tune for specific job applications")
-        advice.append("2. Keep skills updated with latest technologies")
-        advice.append("3. Continuously add quantifiable achievements")
-        advice.append("4. Maintain consistent formatting and structure")
-        advice.append("5. Consider adding certifications or recent projects")
-    
-    advice.append("")
-    advice.append("=" * 70)
-    advice.append("End of ATS Analysis Report")
-    advice.append("=" * 70)
+    Raises:
+        ValueError: If the profile or advice format is unknown
+    """
+    check_advice_format(advice_format)
+    # Tokenize once; every scorer below shares these views
+    doc = as_document(resume_text)
     
-    return advice
+    done = run_stages(doc, profile_stages(profile), STAGE_RUNNERS, instrumentation)
+    with instrumentation.stage("render"):
+        fields = stage_fields(done, advice_format)
+    
+    instrumentation.counters["char_count"] = len(doc.text)
+    instrumentation.counters["word_count"] = doc.word_count
+    
+    # Compile and return all results
+    result = {"success": True, **fields, "word_count": doc.word_count}
+    if "sections" in done:
+        result["sections_detected"] = done["sections"]
+    result["metadata"] = {
+        "file_path": file_path,
+        "file_name": Path(file_path).name,
+        "analysis_version": ANALYSIS_VERSION,
+        "profile": profile,
+        "advice_format": advice_format
+    }
+    return result
 
 
-def analyze_resume(file_path: str) -> Dict[str, Any]:
+def analyze_resume(
+    file_path: str,
+    cache: Optional["AnalysisCache"] = None,
+    use_sidecar: bool = False,
+    extract_options: Optional[Dict[str, Any]] = None,
+    instrument: bool = False,
+    data: Optional[Union[bytes, str]] = None,
+    policy: Optional[ExecutionPolicy] = None,
+    profile: str = DEFAULT_PROFILE,
+    advice_format: str = DEFAULT_ADVICE_FORMAT,
+    near_duplicates: Optional["NearDuplicateIndex"] = None,
+    near_duplicate_threshold: float = NEAR_DUPLICATE_THRESHOLD
+) -> Dict[str, Any]:
     """
     Main function to analyze a resume and return comprehensive results.
     
     Args:
-        file_path: Path to the PDF resume file
+        file_path: Path to the PDF resume file, or to a stored extraction
+            sidecar (*.extract.json) to re-score without parsing the PDF.
+            With data, only the name recorded in the result metadata
+        cache: Optional result cache; unchanged PDFs are answered from it
+        use_sidecar: Reuse/write the extraction sidecar next to the PDF
+        extract_options: Extraction limits (max_pages, word_budget, workers)
+        instrument: Add metadata["instrumentation"] with per-stage wall/CPU
+            time, page/character/word counts, regex scans and peak RSS
+        data: The document itself, as raw or base64-encoded PDF bytes; it is
+            parsed in memory and nothing is written to disk
+        policy: Resource limits for this job (default: DEFAULT_POLICY). A
+            result scored from pages extracted before a limit was hit has
+            "partial": true and a "limit_exceeded" block; a job stopped
+            outright returns error_type "LimitExceeded"
+        profile: "score", "skills" or "full" (see ANALYSIS_PROFILES). Smaller
+            profiles skip the stages their fields do not depend on and omit
+            the fields of those stages from the result
+        advice_format: "text" (default) returns strengths, weaknesses, skill
+            gaps and advice as sentences. "codes" returns them as [code,
+            params] messages and leaves out missing_by_category, for a
+            payload about a tenth the size; render_result gives the text
+        near_duplicates: Optional NearDuplicateIndex; every analyzed resume
+            is fingerprinted into it, and one at least near_duplicate_threshold
+            similar to an analyzed one gets metadata["near_duplicate_of"].
+            With a cache, a resume whose extracted text is exactly that of
+            an analyzed one reuses its result (see text_cache_lookup)
+        near_duplicate_threshold: Similarity from which a match is reported
         
     Returns:
         Dictionary containing all analysis results including:
@@ -826,46 +2655,73 @@ def analyze_resume(file_path: str) -> Dict[str, Any]:
         - word_count: Total word count
         - sections_detected: Which sections were found
     """
+    policy = policy or DEFAULT_POLICY
+    instrumentation = start_instrumentation(file_path, instrument, policy)
+    if profile not in ANALYSIS_PROFILES:
+        return {
+            "success": False,
+            "error": f"Unknown analysis profile: {profile}",
+            "error_type": "ValueError",
+            "message": f"The analysis profile must be one of: {', '.join(ANALYSIS_PROFILES)}."
+        }
+    if advice_format not in ADVICE_FORMATS:
+        return {
+            "success": False,
+            "error": f"Unknown advice format: {advice_format}",
+            "error_type": "ValueError",
+            "message": f"The advice format must be one of: {', '.join(ADVICE_FORMATS)}."
+        }
     try:
-        # Extract text from PDF
-        resume_text = extract_resume_text(file_path)
+        if data is not None:
+            data = decode_pdf_payload(data)
         
-        # Extract skills from resume
-        skills_found = extract_skills(resume_text)
-        
-        # Calculate comprehensive ATS score
-        ats_score, enhanced_strengths, resume_weaknesses, score_breakdown = calculate_ats_score(
-            resume_text, skills_found
-        )
+        kind = profile_cache_kind("analyze_resume", profile, advice_format)
+        extract_options = policy.extract_options(extract_options)
+        content_hash = document_hash(file_path, data) if near_duplicates is not None else None
+        with instrumentation.stage("cache_lookup"):
+            cache_key, cached = cache_lookup(cache, file_path, kind=kind, data=data, content_hash=content_hash,
+                                             extract_options=extract_options)
+        if cached is not None:
+            if instrument:
+                cached["metadata"]["instrumentation"] = instrumentation.report()
+            return cached
         
-        # Analyze skill gaps
-        skill_gaps = skill_gap_analysis(skills_found)
+        # Extract text from PDF (or a stored sidecar)
+        with instrumentation.stage("extract", check_deadline=False):
+            artifact = load_resume_artifact(
+                file_path, use_sidecar=use_sidecar, extract_options=extract_options, data=data
+            )
+        instrumentation.counters["page_count"] = artifact.get("page_count")
         
-        # Generate optimization advice
-        ats_optimization_advice = get_ats_optimization_advice(
-            ats_score, enhanced_strengths, resume_weaknesses, skill_gaps
-        )
+        text_key = signature = duplicate_of = result = None
+        if near_duplicates is not None:
+            with instrumentation.stage("near_duplicate_lookup"):
+                text_key, result = text_cache_lookup(cache, artifact, file_path, kind=kind)
+                signature, duplicate_of = near_duplicate_lookup(
+                    near_duplicates, artifact, content_hash, threshold=near_duplicate_threshold
+                )
+        if result is None:
+            result = score_resume_text(artifact["text"], file_path, instrumentation, profile, advice_format)
+            annotate_result(result, artifact)
+            if text_key is not None and is_cacheable(result):
+                cache.put(text_key, result)
         
-        # Compile and return all results
-        return {
-            "success": True,
-            "ats_score": ats_score,
-            "score_breakdown": score_breakdown,
-            "skills_found": skills_found,
-            "total_skills_found": sum(len(v) for v in skills_found.values()),
-            "skill_gaps": skill_gaps,
-            "enhanced_strengths": enhanced_strengths,
-            "resume_weaknesses": resume_weaknesses,
-            "ats_optimization_advice": ats_optimization_advice,
-            "word_count": len(resume_text.split()),
-            "sections_detected": detect_sections(resume_text),
-            "metadata": {
-                "file_path": file_path,
-                "file_name": Path(file_path).name,
-                "analysis_version": "1.0.0"
-            }
-        }
+        if cache_key is not None and is_cacheable(result):
+            cache.put(cache_key, result)
+        if signature is not None:
+            near_duplicates.add(content_hash, signature, path=file_path)
+        # Attached after caching: the match depends on what was indexed before
+        if duplicate_of is not None:
+            result["metadata"]["near_duplicate_of"] = duplicate_of
+        # Attached after caching: timings describe this run, not the cached result
+        if instrument:
+            result["metadata"]["instrumentation"] = instrumentation.report()
+        return result
         
+    except LimitExceeded as e:
+        return limit_exceeded_result(e)
+    except PreflightError as e:
+        return preflight_error_result(e)
     except FileNotFoundError as e:
         return {
             "success": False,
@@ -889,12 +2745,381 @@ def analyze_resume(file_path: str) -> Dict[str, Any]:
         }
 
 
+# ============================================================================
+# BATCH MODE
+# ============================================================================
+
+def collect_batch_inputs(source: str) -> List[str]:
+    """
+    Resolve a batch source into a sorted list of resume paths.
+
+    Args:
+        source: A directory (searched recursively for PDFs), a glob pattern,
+            or a manifest file listing one resume path per line. Blank lines
+            and lines starting with '#' are ignored; relative manifest paths
+            are resolved against the manifest's directory.
+
+    Returns:
+        List of resume file paths
+    """
+    source_path = Path(source)
+
+    if source_path.is_dir():
+        return sorted(str(p) for p in source_path.rglob("*") if p.suffix.lower() == ".pdf")
+
+    is_resume_file = source_path.suffix.lower() == ".pdf" or source.endswith(SIDECAR_SUFFIX)
+    if source_path.is_file() and not is_resume_file:
+        paths = []
+        with open(source_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                entry = line.strip()
+                if not entry or entry.startswith("#"):
+                    continue
+                entry_path = Path(entry)
+                if not entry_path.is_absolute():
+                    entry_path = source_path.parent / entry_path
+                paths.append(str(entry_path))
+        return paths
+
+    if source_path.is_file():
+        return [str(source_path)]
+
+    import glob
+    return sorted(glob.glob(source, recursive=True))
+
+
+# Each batch worker process opens the cache (and near-duplicate index) once
+# and reuses it
+_worker_caches: Dict[Tuple[str, int], "AnalysisCache"] = {}
+_worker_near_duplicates: Dict[str, "NearDuplicateIndex"] = {}
+
+
+def _get_worker_cache(cache_location: Optional[str], cache_max_bytes: int) -> Optional["AnalysisCache"]:
+    if not cache_location:
+        return None
+    from analysis_cache import open_cache
+    cache_id = (cache_location, cache_max_bytes)
+    if cache_id not in _worker_caches:
+        _worker_caches[cache_id] = open_cache(cache_location, max_bytes=cache_max_bytes)
+    return _worker_caches[cache_id]
+
+
+def _get_worker_near_duplicates(location: Optional[str]) -> Optional["NearDuplicateIndex"]:
+    if not location:
+        return None
+    if location not in _worker_near_duplicates:
+        _worker_near_duplicates[location] = open_near_duplicate_index(location)
+    return _worker_near_duplicates[location]
+
+
+def _analyze_timed(
+    file_path: str,
+    cache_location: Optional[str] = None,
+    cache_max_bytes: int = 0,
+    use_sidecar: bool = False,
+    extract_options: Optional[Dict[str, Any]] = None,
+    instrument: bool = False,
+    policy: Optional[ExecutionPolicy] = None,
+    profile: str = DEFAULT_PROFILE,
+    advice_format: str = DEFAULT_ADVICE_FORMAT,
+    near_duplicates_location: Optional[str] = None,
+    near_duplicate_threshold: float = NEAR_DUPLICATE_THRESHOLD
+) -> Tuple[str, Dict[str, Any], float]:
+    """Analyze one resume in a worker process and report its wall time."""
+    start = time.perf_counter()
+    cache = _get_worker_cache(cache_location, cache_max_bytes)
+    near_duplicates = _get_worker_near_duplicates(near_duplicates_location)
+    result = analyze_resume(file_path, cache=cache, use_sidecar=use_sidecar,
+                            extract_options=extract_options, instrument=instrument, policy=policy,
+                            profile=profile, advice_format=advice_format, near_duplicates=near_duplicates,
+                            near_duplicate_threshold=near_duplicate_threshold)
+    return file_path, result, time.perf_counter() - start
+
+
+def _percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * pct // 100))
+    return sorted_values[int(rank) - 1]
+
+
+def run_batch(
+    file_paths: List[str],
+    output,
+    workers: int = None,
+    cache_location: Optional[str] = None,
+    cache_max_bytes: int = 0,
+    use_sidecar: bool = False,
+    extract_options: Optional[Dict[str, Any]] = None,
+    instrument: bool = False,
+    policy: Optional[ExecutionPolicy] = None,
+    profile: str = DEFAULT_PROFILE,
+    advice_format: str = DEFAULT_ADVICE_FORMAT,
+    near_duplicates_location: Optional[str] = None,
+    near_duplicate_threshold: float = NEAR_DUPLICATE_THRESHOLD
+) -> Dict[str, Any]:
+    """
+    Analyze many resumes across a process pool, writing one JSON Lines record
+    per file to `output` as soon as it completes. A failing file produces an
+    error record instead of aborting the run.
+
+    Args:
+        file_paths: Resume paths to analyze
+        output: Writable text stream for the JSON Lines records
+        workers: Process pool size (defaults to the CPU count)
+        cache_location: Optional result cache path shared by all workers
+        cache_max_bytes: Size bound for the cache
+        use_sidecar: Reuse/write extraction sidecars next to each PDF
+        extract_options: Extraction limits applied to every file
+        instrument: Include the instrumentation block in every record
+        policy: Resource limits applied to each file
+        profile: Analysis profile for every file (see ANALYSIS_PROFILES)
+        advice_format: "text" or "codes" for every record (see ADVICE_FORMATS)
+        near_duplicates_location: Optional near-duplicate index file shared by
+            all workers (see analyze_resume's near_duplicates)
+        near_duplicate_threshold: Similarity from which a match is reported
+
+    Returns:
+        Throughput summary for the run
+    """
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    latencies = []
+    succeeded = 0
+    failed = 0
+    run_start = time.perf_counter()
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(_analyze_timed, path, cache_location, cache_max_bytes,
+                            use_sidecar, extract_options, instrument, policy, profile, advice_format,
+                            near_duplicates_location, near_duplicate_threshold): path
+            for path in file_paths
+        }
+
+        for future in as_completed(futures):
+            file_path = futures[future]
+            try:
+                _, result, elapsed = future.result()
+            except Exception as e:
+                # The worker itself died (e.g. crashed inside the PDF parser)
+                result = {
+                    "success": False,
+                    "error": str(e),
+                    "error_type": type(e).__name__,
+                    "message": "Worker failed while analyzing this file."
+                }
+                elapsed = None
+
+            if result.get("success"):
+                succeeded += 1
+            else:
+                failed += 1
+            if elapsed is not None:
+                latencies.append(elapsed)
+
+            record = {"file_path": file_path, "elapsed_ms": None if elapsed is None else round(elapsed * 1000, 1)}
+            record.update(result)
+            output.write(json.dumps(record, ensure_ascii=False) + "\n")
+            output.flush()
+
+    wall_time = time.perf_counter() - run_start
+    latencies.sort()
+
+    return {
+        "files": len(file_paths),
+        "succeeded": succeeded,
+        "failed": failed,
+        "wall_time_s": round(wall_time, 3),
+        "files_per_sec": round(len(file_paths) / wall_time, 2) if wall_time > 0 else 0.0,
+        "p50_ms": round(_percentile(latencies, 50) * 1000, 1),
+        "p95_ms": round(_percentile(latencies, 95) * 1000, 1)
+    }
+
+
+def batch_main(args) -> None:
+    """Command-line handler for --batch."""
+    file_paths = collect_batch_inputs(args.batch)
+    if not file_paths:
+        print(f"✗ No resumes found for batch source: {args.batch}", file=sys.stderr)
+        sys.exit(1)
+
+    print(f"Analyzing {len(file_paths)} resumes...", file=sys.stderr)
+    cache_max_bytes = args.cache_max_mb * 1024 * 1024
+    extract_options = extraction_options_from_args(args)
+    policy = policy_from_args(args)
+    # CPU time accumulates across the whole run, so batches only cap memory
+    policy.apply_process_limits(cpu=False)
+    if args.near_duplicates:
+        # Create the index once up front, so workers only ever open it
+        try:
+            open_near_duplicate_index(args.near_duplicates)
+        except (ImportError, OSError, ValueError) as e:
+            print(f"✗ Cannot open near-duplicate index: {e}", file=sys.stderr)
+            sys.exit(1)
+
+    try:
+        if args.output:
+            with open(args.output, 'w', encoding='utf-8') as f:
+                summary = run_batch(file_paths, f, workers=args.workers,
+                                    cache_location=args.cache, cache_max_bytes=cache_max_bytes,
+                                    use_sidecar=args.sidecar, extract_options=extract_options,
+                                    instrument=args.instrument, policy=policy, profile=args.profile,
+                                    advice_format=args.advice_format,
+                                    near_duplicates_location=args.near_duplicates,
+                                    near_duplicate_threshold=args.near_duplicate_threshold)
+        else:
+            summary = run_batch(file_paths, sys.stdout, workers=args.workers,
+                                cache_location=args.cache, cache_max_bytes=cache_max_bytes,
+                                use_sidecar=args.sidecar, extract_options=extract_options,
+                                instrument=args.instrument, policy=policy, profile=args.profile,
+                                advice_format=args.advice_format,
+                                near_duplicates_location=args.near_duplicates,
+                                near_duplicate_threshold=args.near_duplicate_threshold)
+    except OSError as e:
+        print(f"✗ Error writing batch output: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    print(
+        f"\n✓ Batch complete: {summary['succeeded']}/{summary['files']} succeeded, "
+        f"{summary['failed']} failed in {summary['wall_time_s']}s "
+        f"({summary['files_per_sec']} files/sec, "
+        f"p50 {summary['p50_ms']} ms, p95 {summary['p95_ms']} ms per file)",
+        file=sys.stderr
+    )
+    print(json.dumps({"summary": summary}), file=sys.stderr)
+
+    sys.exit(0 if summary['failed'] == 0 else 1)
+
+
 # ============================================================================
 # COMMAND LINE INTERFACE
 # ============================================================================
 
+def add_extraction_arguments(parser: "argparse.ArgumentParser") -> None:
+    """Register the extraction limit options shared by both CLIs."""
+    parser.add_argument(
+        '--max-pages',
+        type=int,
+        default=DEFAULT_MAX_PAGES,
+        help=f'Only extract the first N pages; 0 for no cap (default: {DEFAULT_MAX_PAGES})'
+    )
+    parser.add_argument(
+        '--word-budget',
+        type=int,
+        default=DEFAULT_WORD_BUDGET,
+        help=f'Stop extracting once this many words are collected; 0 for no limit (default: {DEFAULT_WORD_BUDGET})'
+    )
+    parser.add_argument(
+        '--no-preflight',
+        action='store_true',
+        help='Skip the structural triage that rejects image-only, encrypted or damaged PDFs before extraction'
+    )
+    parser.add_argument(
+        '--extract-workers',
+        type=int,
+        default=1,
+        help=f'Extract pages of documents with {PARALLEL_MIN_PAGES}+ pages across N processes (default: 1)'
+    )
+
+
+def extraction_options_from_args(args) -> Dict[str, Any]:
+    """Turn parsed extraction arguments into extract_options."""
+    return {
+        "max_pages": args.max_pages or None,
+        "word_budget": args.word_budget or None,
+        "workers": max(1, args.extract_workers),
+        "preflight": not args.no_preflight
+    }
+
+
+def add_profile_argument(parser: "argparse.ArgumentParser", profiles: Dict[str, List[str]]) -> None:
+    """Register --profile with the given profile names."""
+    parser.add_argument(
+        '--profile',
+        choices=list(profiles),
+        default=DEFAULT_PROFILE,
+        help=f'Outputs to compute, smallest first: {", ".join(profiles)}. "score" is ats_score and '
+             f'score_breakdown only; stages no requested output needs are skipped (default: {DEFAULT_PROFILE})'
+    )
+
+
+def add_advice_format_argument(parser: "argparse.ArgumentParser") -> None:
+    """Register --advice-format, shared by both CLIs."""
+    parser.add_argument(
+        '--advice-format',
+        choices=ADVICE_FORMATS,
+        default=DEFAULT_ADVICE_FORMAT,
+        help='Report strengths, weaknesses, skill gaps and advice as rendered "text" or as compact '
+             f'"codes" messages to render later (default: {DEFAULT_ADVICE_FORMAT})'
+    )
+
+
+def add_near_duplicate_arguments(parser: "argparse.ArgumentParser") -> None:
+    """Register --near-duplicates and --near-duplicate-threshold, shared by both CLIs."""
+    parser.add_argument(
+        '--near-duplicates',
+        metavar='PATH',
+        help='Near-duplicate index file (see near_duplicates.py): fingerprint every analyzed resume into it, '
+             'report near-duplicates of analyzed resumes and, with --cache, answer resumes with the same text '
+             'as an analyzed one from its cached result'
+    )
+    parser.add_argument(
+        '--near-duplicate-threshold',
+        type=float,
+        metavar='SIMILARITY',
+        default=NEAR_DUPLICATE_THRESHOLD,
+        help='Text similarity (0-1) from which a resume is reported as a near-duplicate '
+             f'(default: {NEAR_DUPLICATE_THRESHOLD})'
+    )
+
+
+def add_policy_arguments(parser: "argparse.ArgumentParser") -> None:
+    """Register the execution policy options shared by both CLIs."""
+    parser.add_argument(
+        '--max-words-per-page',
+        type=int,
+        default=0,
+        help='Stop extracting at a page with more words than this, e.g. '
+             f'{SUGGESTED_MAX_WORDS_PER_PAGE}; the pages before it are still scored (default: no limit)'
+    )
+    parser.add_argument(
+        '--stage-deadline',
+        type=float,
+        default=0,
+        metavar='SECONDS',
+        help='Stop the job when a stage runs longer than this; extraction keeps the pages done so far (default: no deadline)'
+    )
+    parser.add_argument(
+        '--max-memory-mb',
+        type=int,
+        default=0,
+        help='Address-space limit for the process; exceeding it returns a limit result (default: no limit)'
+    )
+    parser.add_argument(
+        '--max-cpu-seconds',
+        type=int,
+        default=0,
+        help='CPU time limit for a single-resume run (default: no limit)'
+    )
+
+
+def policy_from_args(args) -> ExecutionPolicy:
+    """Turn parsed execution policy arguments into an ExecutionPolicy."""
+    return ExecutionPolicy(
+        max_words_per_page=args.max_words_per_page or None,
+        stage_deadline_s=args.stage_deadline or None,
+        max_memory_mb=args.max_memory_mb or None,
+        max_cpu_s=args.max_cpu_seconds or None
+    )
+
+
 def main():
     """Main entry point for command-line usage."""
+    import argparse
+    from analysis_cache import open_cache
+    
     parser = argparse.ArgumentParser(
         description='Analyze resume and calculate ATS score with comprehensive feedback',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -904,6 +3129,15 @@ Examples:
   %(prog)s resume.pdf --output results.json
   %(prog)s resume.pdf --pretty
   %(prog)s resume.pdf -o results.json --pretty
+  %(prog)s - --name resume.pdf < resume.pdf                     (raw or base64 PDF on stdin)
+  %(prog)s --batch resumes/ -o results.jsonl --workers 8
+  %(prog)s --batch "uploads/**/*.pdf" -o results.jsonl
+  %(prog)s --batch manifest.txt -o results.jsonl
+  %(prog)s --batch resumes/ --sidecar -o results.jsonl          (extract once, keep sidecars)
+  %(prog)s --batch "resumes/**/*.extract.json" -o rescored.jsonl (re-score, no PDF parsing)
+  %(prog)s --batch resumes/ --profile score -o ranking.jsonl     (scores only, for bulk ranking)
+  %(prog)s --batch resumes/ --advice-format codes -o stored.jsonl (compact messages, rendered later)
+  %(prog)s resume.pdf --cache cache/ats.db --near-duplicates cache/cohort.ndx (reuse results for template copies)
 
 For integration with Node.js/React:
   See documentation for API integration examples
@@ -912,7 +3146,24 @@ For integration with Node.js/React:
     
     parser.add_argument(
         'resume_path',
-        help='Path to the PDF resume file'
+        nargs='?',
+        help=f'Path to the PDF resume file, or {STDIN_PATH} to read raw or base64 PDF bytes from stdin'
+    )
+    parser.add_argument(
+        '--name',
+        default=BUFFER_NAME,
+        help=f'File name recorded in metadata for a resume read from stdin (default: {BUFFER_NAME})'
+    )
+    parser.add_argument(
+        '--batch', '-b',
+        metavar='SOURCE',
+        help='Analyze many resumes: a directory, glob pattern or manifest file (writes JSON Lines)'
+    )
+    parser.add_argument(
+        '--workers', '-w',
+        type=int,
+        default=None,
+        help='Batch mode: number of worker processes (default: CPU count)'
     )
     parser.add_argument(
         '--output', '-o',
@@ -923,17 +3174,69 @@ For integration with Node.js/React:
         action='store_true',
         help='Pretty print JSON output with indentation'
     )
+    parser.add_argument(
+        '--cache',
+        metavar='PATH',
+        help='Result cache: a .db/.sqlite file or a directory (reuses results for unchanged PDFs)'
+    )
+    parser.add_argument(
+        '--cache-max-mb',
+        type=int,
+        default=256,
+        help='Maximum cache size in MB before least recently used entries are evicted (default: 256)'
+    )
+    add_extraction_arguments(parser)
+    add_policy_arguments(parser)
+    parser.add_argument(
+        '--sidecar',
+        action='store_true',
+        help=f'Store extracted text next to each PDF as <file>{SIDECAR_SUFFIX} and reuse it on later runs'
+    )
+    parser.add_argument(
+        '--instrument',
+        action='store_true',
+        help='Add per-stage timings and counters to metadata.instrumentation'
+    )
+    add_profile_argument(parser, ANALYSIS_PROFILES)
+    add_advice_format_argument(parser)
+    add_near_duplicate_arguments(parser)
     parser.add_argument(
         '--version', '-v',
         action='version',
-        version='%(prog)s 1.0.0'
+        version=f'%(prog)s {ANALYSIS_VERSION}'
     )
     
     args = parser.parse_args()
     
+    if args.batch:
+        batch_main(args)
+        return
+    
+    if not args.resume_path:
+        parser.error("resume_path is required unless --batch is given")
+    
     # Analyze the resume
     print("Analyzing resume...", file=sys.stderr)
-    results = analyze_resume(args.resume_path)
+    cache = open_cache(args.cache, max_bytes=args.cache_max_mb * 1024 * 1024) if args.cache else None
+    near_duplicates = open_near_duplicate_index(args.near_duplicates) if args.near_duplicates else None
+    resume_path, data = args.resume_path, None
+    if resume_path == STDIN_PATH:
+        resume_path, data = args.name, sys.stdin.buffer.read()
+    policy = policy_from_args(args)
+    policy.apply_process_limits()
+    results = analyze_resume(
+        resume_path,
+        cache=cache,
+        use_sidecar=args.sidecar,
+        extract_options=extraction_options_from_args(args),
+        instrument=args.instrument,
+        data=data,
+        policy=policy,
+        profile=args.profile,
+        advice_format=args.advice_format,
+        near_duplicates=near_duplicates,
+        near_duplicate_threshold=args.near_duplicate_threshold
+    )
     
     # Format output
     indent = 2 if args.pretty else None
@@ -958,6 +3261,8 @@ For integration with Node.js/React:
     # Print summary to stderr (won't interfere with JSON output)
     if results.get('success'):
         print(f"\n✓ Analysis complete! ATS Score: {results['ats_score']}/100", file=sys.stderr)
+        if results.get('partial'):
+            print(f"  Partial result: {results['limit_exceeded']['limit']} reached during extraction", file=sys.stderr)
     else:
         print(f"\n✗ Analysis failed: {results.get('error', 'Unknown error')}", file=sys.stderr)
     
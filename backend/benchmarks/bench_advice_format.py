@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Payload size and render cost of --advice-format codes against text.
+
+Analyzes a synthetic corpus (see resume_corpus.py) through the wrapper in
+both formats, reports the JSON size of each result as Node.js would store
+it, times scoring in each format and rendering a "codes" result back to text,
+and checks that render_result gives exactly the "text" result for every
+resume.
+
+Usage:
+    python benchmarks/bench_advice_format.py
+    python benchmarks/bench_advice_format.py --count 96 --min-ratio 8
+
+Exit code 0 when every rendered result matches and the size ratio is at
+least --min-ratio, 1 otherwise.
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+import statistics
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(BENCH_DIR, '..'))
+sys.path.insert(0, BENCH_DIR)
+
+import analyze_resume_wrapper as wrapper
+from ats_resume_analyzer import render_result
+from resume_corpus import generate_corpus
+
+
+def payload_bytes(result):
+    return len(json.dumps(result, ensure_ascii=False).encode("utf-8"))
+
+
+def best_of(fn, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare text and codes advice output")
+    parser.add_argument("--count", type=int, default=48, help="Resumes in the corpus (default: 48)")
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs, best kept (default: 5)")
+    parser.add_argument("--min-ratio", type=float, default=8.0,
+                        help="Smallest allowed text/codes total size ratio (default: 8)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        entries = generate_corpus(tmp, count=args.count, seed=args.seed)
+        sidecars = [e["sidecar"] for e in entries]
+
+        text = [wrapper.run_analysis(path) for path in sidecars]
+        codes = [wrapper.run_analysis(path, advice_format="codes") for path in sidecars]
+
+        mismatches = [r["metadata"]["file_name"] for r, c in zip(text, codes) if render_result(c) != r]
+
+        text_s = best_of(lambda: [wrapper.run_analysis(path) for path in sidecars], args.repeat)
+        codes_s = best_of(lambda: [wrapper.run_analysis(path, advice_format="codes") for path in sidecars],
+                          args.repeat)
+        render_s = best_of(lambda: [render_result(c) for c in codes], args.repeat)
+
+    text_sizes = [payload_bytes(r) for r in text]
+    codes_sizes = [payload_bytes(r) for r in codes]
+    ratio = sum(text_sizes) / sum(codes_sizes)
+    per_resume = lambda seconds: seconds * 1000 / len(sidecars)
+
+    print(f"{len(sidecars)} resumes")
+    print(f"{'format':<8} {'median':>10} {'max':>10} {'total':>12} {'ms/resume':>10}")
+    for name, sizes, seconds in (("text", text_sizes, text_s), ("codes", codes_sizes, codes_s)):
+        print(f"{name:<8} {statistics.median(sizes):>9.0f}B {max(sizes):>9}B {sum(sizes):>11}B "
+              f"{per_resume(seconds):>10.3f}")
+    print(f"render_result: {per_resume(render_s):.3f} ms/resume")
+
+    if mismatches:
+        print(f"\n✗ Rendered codes differ from text for: {', '.join(mismatches)}")
+        sys.exit(1)
+    if ratio < args.min_ratio:
+        print(f"\n✗ codes payloads are only {ratio:.1f}x smaller (need {args.min_ratio:g}x)")
+        sys.exit(1)
+    print(f"\n✓ codes payloads are {ratio:.1f}x smaller and render to identical text")
+
+
+if __name__ == "__main__":
+    main()
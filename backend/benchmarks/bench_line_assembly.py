@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for line reconstruction in extract_resume_text.
+
+Compares the original approach (bucket words by round(top), sort each bucket,
+grow the document with repeated string concatenation) against the current
+assemble_page_lines engine on synthetic word boxes for 1-, 2- and 5-page
+resumes. No PDF parsing is involved, so this isolates line assembly cost.
+
+Usage:
+    python benchmarks/bench_line_assembly.py
+    python benchmarks/bench_line_assembly.py --repeat 200 --two-column
+"""
+
+import os
+import sys
+import random
+import argparse
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from ats_resume_analyzer import assemble_page_lines
+
+
+def legacy_assemble(pages):
+    """The pre-engine algorithm, kept verbatim as the 'before' baseline."""
+    text = ""
+    for words in pages:
+        lines_dict = {}
+        for w in words:
+            top = round(float(w['top']))
+            if top not in lines_dict:
+                lines_dict[top] = []
+            lines_dict[top].append(w)
+
+        sorted_tops = sorted(lines_dict.keys())
+        for top in sorted_tops:
+            line_words = sorted(lines_dict[top], key=lambda x: float(x['x0']))
+            line_text = " ".join(w['text'] for w in line_words)
+            text += line_text + "\n"
+    return text
+
+
+def current_assemble(pages, page_width=612.0):
+    parts = []
+    for words in pages:
+        boxes = [(w['x0'], w['top'], w['x1'], w['bottom'], w['text']) for w in words]
+        lines, _ = assemble_page_lines(boxes, page_width)
+        for line in lines:
+            parts.append(line)
+            parts.append("\n")
+    return "".join(parts)
+
+
+def synthetic_page(rng, lines=55, words_per_line=11, two_column=False):
+    """Word boxes shaped like pdfplumber.extract_words() output."""
+    words = []
+    columns = [(40.0, 280.0), (320.0, 570.0)] if two_column else [(40.0, 570.0)]
+    for col_index, (left, right) in enumerate(columns):
+        pitch = 13.5 + col_index * 2.1
+        for i in range(lines):
+            top = 40.0 + i * pitch + rng.choice((0.0, 0.3, 0.6))
+            x = left
+            for _ in range(words_per_line // len(columns)):
+                width = rng.uniform(12.0, 48.0)
+                if x + width > right:
+                    break
+                words.append({
+                    'x0': x, 'x1': x + width,
+                    'top': top, 'bottom': top + 10.0,
+                    'text': rng.choice(("python", "react", "developed", "team", "2023", "•", "api", "data"))
+                })
+                x += width + 4.0
+    rng.shuffle(words)
+    return words
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark line reconstruction before/after')
+    parser.add_argument('--repeat', type=int, default=100, help='Timing repetitions per case')
+    parser.add_argument('--two-column', action='store_true', help='Use a two-column page layout')
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    print(f"{'pages':>5} {'words':>7} {'before (ms)':>12} {'after (ms)':>11} {'speedup':>8}")
+    for page_count in (1, 2, 5):
+        pages = [synthetic_page(rng, two_column=args.two_column) for _ in range(page_count)]
+        word_count = sum(len(p) for p in pages)
+
+        before = min(timeit.repeat(lambda: legacy_assemble(pages), number=1, repeat=args.repeat))
+        after = min(timeit.repeat(lambda: current_assemble(pages), number=1, repeat=args.repeat))
+        print(f"{page_count:>5} {word_count:>7} {before * 1000:>12.3f} {after * 1000:>11.3f} {before / after:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Benchmark for near_duplicates.NearDuplicateIndex at cohort scale.
+
+Builds a synthetic cohort (see resume_corpus.py) in which some resumes are
+template copies: the same resume under another name with a few words
+changed. Every resume is fingerprinted into the index, then fresh copies of
+the templates are looked up both through LSH and by a brute-force scan of
+every signature, at the index threshold and at the threshold the analyzer
+reports near-duplicates from. Reports fingerprinting, query and all-pairs cost,
+LSH recall against the scan, and the error of the similarity estimate
+against the exact Jaccard similarity of the shingle sets.
+
+Usage:
+    python benchmarks/bench_near_duplicates.py
+    python benchmarks/bench_near_duplicates.py --resumes 50000 --templates 500
+
+Exit code 0 when recall at the reporting threshold is at least --min-recall, 1
+otherwise.
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+import statistics
+
+import numpy as np
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(BENCH_DIR, '..'))
+sys.path.insert(0, BENCH_DIR)
+
+from near_duplicates import NearDuplicateIndex, shingle_hashes
+from ats_resume_analyzer import NEAR_DUPLICATE_THRESHOLD
+from resume_corpus import generate_resume, build_artifact, FIRST_NAMES, LAST_NAMES
+
+
+def resume_text(rng):
+    return build_artifact(generate_resume(rng), b"", "resume.pdf")["text"]
+
+
+def template_copy(rng, text, edits):
+    """text under another name, with `edits` words replaced by words from elsewhere in it."""
+    lines = text.split("\n")
+    name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+    handle = name.lower().replace(" ", ".")
+    lines[0] = name.upper()
+    lines[1] = (f"{handle}@example.com | +91 98{rng.randint(10000000, 99999999)} | "
+                f"linkedin.com/in/{handle.replace('.', '-')} | github.com/{handle.replace('.', '')}")
+    words = "\n".join(lines).split(" ")
+    for _ in range(edits):
+        words[rng.randrange(len(words))] = rng.choice(words)
+    return " ".join(words)
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def jaccard(a, b):
+    a, b = set(shingle_hashes(a)), set(shingle_hashes(b))
+    return len(a & b) / len(a | b)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark near-duplicate resume detection")
+    parser.add_argument("--resumes", type=int, default=20000, help="Resumes in the cohort (default: 20000)")
+    parser.add_argument("--templates", type=int, default=200, help="Templates copied in the cohort (default: 200)")
+    parser.add_argument("--copies", type=int, default=4, help="Copies of each template (default: 4)")
+    parser.add_argument("--queries", type=int, default=200, help="Fresh copies looked up (default: 200)")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--min-recall", type=float, default=0.99,
+                        help="Smallest allowed LSH recall at the reporting threshold (default: 0.99)")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    templates = [resume_text(rng) for _ in range(args.templates)]
+    texts = {}
+    for t, template in enumerate(templates):
+        texts[f"template_{t:04d}.pdf"] = template
+        for c in range(args.copies):
+            texts[f"template_{t:04d}_copy_{c}.pdf"] = template_copy(rng, template, rng.randint(0, 2))
+    while len(texts) < args.resumes:
+        texts[f"resume_{len(texts):06d}.pdf"] = resume_text(rng)
+
+    index = NearDuplicateIndex()
+    start = time.perf_counter()
+    signatures = {key: index.signature(text) for key, text in texts.items()}
+    signature_s = time.perf_counter() - start
+    start = time.perf_counter()
+    for key, signature in signatures.items():
+        index.add(key, signature)
+    add_s = time.perf_counter() - start
+    print(f"{len(index)} resumes ({args.templates} templates x {args.copies} copies), "
+          f"banding {index.bands} x {index.rows} for threshold {index.threshold}")
+    print(f"fingerprint {signature_s * 1000 / len(texts):.3f} ms/resume, "
+          f"add {add_s * 1e6 / len(texts):.1f} us/resume")
+
+    start = time.perf_counter()
+    index.query(next(iter(texts.values())))  # Folds the adds into the sorted band tables
+    print(f"first query (sorts the band tables) {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    keys = list(signatures)
+    matrix = np.stack([signatures[key] for key in keys])
+    queries = [template_copy(rng, templates[rng.randrange(len(templates))], rng.randint(0, 2))
+               for _ in range(args.queries)]
+
+    failed = False
+    for threshold in (index.threshold, NEAR_DUPLICATE_THRESHOLD):
+        lsh_times, scan_times, found, expected, errors = [], [], 0, 0, []
+        for query in queries:
+            signature = index.signature(query)
+            start = time.perf_counter()
+            matches = index.query(signature, threshold=threshold)
+            lsh_times.append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            agreement = np.count_nonzero(matrix == signature, axis=1) / index.num_perm
+            truth = {keys[i] for i in np.flatnonzero(agreement >= threshold)}
+            scan_times.append(time.perf_counter() - start)
+
+            matched = {key for key, _ in matches}
+            found += len(matched & truth)
+            expected += len(truth)
+            errors.extend(abs(similarity - jaccard(query, texts[key])) for key, similarity in matches[:3])
+
+        recall = found / expected if expected else 1.0
+        print(f"\nthreshold {threshold}: {expected} near-duplicates of {len(queries)} queries")
+        print(f"  LSH query  median {statistics.median(lsh_times) * 1000:.3f} ms, "
+              f"p95 {percentile(lsh_times, 95) * 1000:.3f} ms, recall {recall:.4f}")
+        print(f"  full scan  median {statistics.median(scan_times) * 1000:.3f} ms, "
+              f"p95 {percentile(scan_times, 95) * 1000:.3f} ms")
+        if errors:
+            print(f"  similarity estimate vs exact Jaccard: mean error {statistics.mean(errors):.3f}, "
+                  f"max {max(errors):.3f}")
+        if threshold == NEAR_DUPLICATE_THRESHOLD and recall < args.min_recall:
+            failed = True
+
+    start = time.perf_counter()
+    groups = index.groups(index.threshold)
+    groups_s = time.perf_counter() - start
+    complete = sum(1 for group in groups if len(group) == args.copies + 1 and group[0].startswith("template_"))
+    print(f"\ngroups: {len(groups)} in {groups_s * 1000:.0f} ms; "
+          f"{complete}/{args.templates} templates grouped with all their copies")
+
+    if failed:
+        print(f"\n✗ Recall at {NEAR_DUPLICATE_THRESHOLD} is below {args.min_recall}")
+        sys.exit(1)
+    print(f"\n✓ LSH finds at least {args.min_recall:.0%} of near-exact copies")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Adversarial-input check for the regexes that scan untrusted resume text.
+
+Each pattern is searched over pathological inputs (long digit runs,
+separator runs, dotted word runs, near-miss tails that never complete a
+match) at a base size and at --scale times that size. A linear-time pattern
+gets about --scale times slower; one that backtracks quadratically gets about
+--scale squared times slower. The check fails if any input grows faster than
+--max-growth, or if the large input costs more than --max-us-per-kchar.
+
+Usage:
+    python benchmarks/bench_regex_adversarial.py
+    python benchmarks/bench_regex_adversarial.py --chars 50000 --scale 8 --max-growth 20
+
+Exit code 0 when every pattern stays within bounds, 1 otherwise.
+"""
+
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from ats_resume_analyzer import (
+    EMAIL_PATTERN,
+    PHONE_PATTERN,
+    QUANTIFIED_PATTERN,
+    DATE_PATTERN,
+    SECTION_HEADER_PATTERN
+)
+
+PATTERNS = {
+    "email": EMAIL_PATTERN,
+    "phone": PHONE_PATTERN,
+    "quantified": QUANTIFIED_PATTERN,
+    "date": DATE_PATTERN,
+    "section header": SECTION_HEADER_PATTERN,
+}
+
+
+def repeat_to(unit: str, n: int) -> str:
+    return (unit * (n // len(unit) + 1))[:n]
+
+
+# name -> builder of an n-character input. Each is aimed at one pattern and
+# never completes a match for it, so that search runs to the end of the text;
+# every pattern is still run on every input
+INPUTS = {
+    "digit run": lambda n: "1" * n,
+    "dotted digits": lambda n: repeat_to("1.", n),
+    "digit pairs": lambda n: repeat_to("12 ", n),
+    "dotted words": lambda n: repeat_to("a.", n),
+    "email charset": lambda n: repeat_to("a1.-_%+", n),
+    "local part, no @": lambda n: repeat_to("ab.", n) + " @x",
+    "domain, no tld": lambda n: "a@" + repeat_to("b-1", n),
+    "at signs": lambda n: repeat_to("a.b@", n),
+    "separator run": lambda n: "Jan" + repeat_to(" ,./", n) + "x",
+    "month letters": lambda n: "Sep" + "t" * n,
+    "phone near-miss": lambda n: repeat_to("123-456-789 ", n),
+    "plus run": lambda n: repeat_to("+1 ", n),
+    "metric near-miss": lambda n: repeat_to("10 user", n),
+    "header prefix": lambda n: "x" + repeat_to("skill", n),
+}
+
+
+def best_of(fn, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check resume regexes for super-linear backtracking")
+    parser.add_argument("--chars", type=int, default=20000, help="Base input size (default: 20000)")
+    parser.add_argument("--scale", type=int, default=8, help="Large input is this many times the base (default: 8)")
+    parser.add_argument("--max-growth", type=float, default=24.0,
+                        help="Largest allowed large/base time ratio (default: 24, i.e. 3x linear)")
+    parser.add_argument("--max-us-per-kchar", type=float, default=2000.0,
+                        help="Largest allowed cost of the large input per 1000 chars (default: 2000 us)")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per input, best kept (default: 5)")
+    args = parser.parse_args()
+
+    small_n = args.chars
+    large_n = args.chars * args.scale
+    # Below this the timer noise dominates the ratio, so only the cost bound applies
+    noise_floor = 0.002
+
+    failures = []
+    print(f"{'pattern':<15} {'input':<19} {str(small_n) + ' ch':>11} {str(large_n) + ' ch':>11} "
+          f"{'growth':>7} {'us/kchar':>9}")
+    for pattern_name, pattern in PATTERNS.items():
+        for input_name, build in INPUTS.items():
+            small, large = build(small_n), build(large_n)
+            small_s = best_of(lambda: pattern.search(small), args.repeat)
+            large_s = best_of(lambda: pattern.search(large), args.repeat)
+
+            growth = large_s / max(small_s, 1e-9)
+            us_per_kchar = large_s * 1e6 / (len(large) / 1000)
+            ok = us_per_kchar <= args.max_us_per_kchar and (
+                large_s < noise_floor or growth <= args.max_growth
+            )
+            if not ok:
+                failures.append(f"{pattern_name} / {input_name}")
+            print(f"{pattern_name:<15} {input_name:<19} {small_s * 1000:>9.2f}ms {large_s * 1000:>9.2f}ms "
+                  f"{growth:>6.1f}x {us_per_kchar:>9.1f}{'' if ok else '  ✗'}")
+
+    if failures:
+        print(f"\n✗ Super-linear or over budget: {', '.join(failures)}")
+        sys.exit(1)
+    print(f"\n✓ All patterns within {args.max_growth:g}x growth for {args.scale}x input")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Benchmark for skill_index.SkillIndex at cohort scale.
+
+Indexes N synthetic resumes (random skill sets drawn from SKILL_DB, random
+ATS scores), then times saving, memory-mapping and a set of typical placement
+queries, checking every answer against a brute-force scan of the same data.
+
+Usage:
+    python benchmarks/bench_skill_index.py
+    python benchmarks/bench_skill_index.py --resumes 100000 --top 20
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from skill_index import SkillIndex, skill_vocabulary
+
+QUERIES = [
+    ("react AND node AND (mongodb OR postgresql)",
+     lambda s: "react" in s and "node" in s and ("mongodb" in s or "postgresql" in s)),
+    ("python AND machine learning AND NOT java",
+     lambda s: "python" in s and "machine learning" in s and "java" not in s),
+    ("docker OR kubernetes",
+     lambda s: "docker" in s or "kubernetes" in s),
+    ("(aws OR azure OR gcp) AND ci/cd",
+     lambda s: ("aws" in s or "azure" in s or "gcp" in s) and "ci/cd" in s),
+]
+
+
+def best_of(fn, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return result, best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the skill search index")
+    parser.add_argument("--resumes", type=int, default=50000, help="Resumes to index (default: 50000)")
+    parser.add_argument("--top", type=int, default=10, help="k for top-k queries (default: 10)")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per query, best kept (default: 5)")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    vocabulary = skill_vocabulary()
+    # Popular skills show up far more often than niche ones
+    weights = [1.0 / (rank + 1) ** 0.6 for rank in range(len(vocabulary))]
+    rng.shuffle(weights)
+
+    truth = []
+    index = SkillIndex()
+    start = time.perf_counter()
+    for i in range(args.resumes):
+        skills = set(rng.choices(vocabulary, weights, k=rng.randint(4, 30)))
+        score = rng.randint(30, 100)
+        truth.append((f"resume_{i:06d}.pdf", skills, score))
+        index.add_skills(truth[-1][0], skills, score)
+    build_ms = (time.perf_counter() - start) * 1000
+    print(f"Indexed {args.resumes} resumes in {build_ms:.0f} ms "
+          f"({build_ms * 1000 / args.resumes:.1f} us/resume)")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "cohort.skx")
+        _, save_ms = best_of(lambda: index.save(path), 1)
+        print(f"Saved {os.path.getsize(path) / 1024:.0f} KB in {save_ms:.1f} ms")
+
+        mapped, open_ms = best_of(lambda: SkillIndex.open(path), 1)
+        print(f"Memory-mapped in {open_ms:.2f} ms\n")
+
+        print(f"{'query':<46} {'matches':>8} {'count':>9} {'top-' + str(args.top):>9} {'cold top-k':>11}")
+        for query, predicate in QUERIES:
+            expected = sorted(
+                ((key, score) for key, skills, score in truth if predicate(skills)),
+                key=lambda item: -item[1]
+            )
+            cold, cold_ms = best_of(lambda: SkillIndex.open(path).search(query, k=args.top), 1)
+            count, count_ms = best_of(lambda: mapped.count(query), args.repeat)
+            top, top_ms = best_of(lambda: mapped.search(query, k=args.top), args.repeat)
+
+            assert count == len(expected), (query, count, len(expected))
+            assert top == expected[:args.top] == cold, query
+            print(f"{query:<46} {count:>8} {count_ms:>7.2f}ms {top_ms:>7.2f}ms {cold_ms:>9.2f}ms")
+        mapped.close()
+
+    print("\n✓ All query results match a brute-force scan")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Serialize and parse cost of the ats-wire format against plain JSON output.
+
+Analyzes a synthetic corpus (see resume_corpus.py) through the wrapper, then
+for every result times what each side of the Node.js <-> Python boundary
+pays: serializing (json.dumps + UTF-8 encode, as the wrapper prints today,
+against WireSchema.pack) and parsing (json.loads against WireSchema.unpack,
+which also expands interned skill IDs). Every frame is checked to decode to
+the original result. msgpack is measured too when it is installed.
+
+Usage:
+    python benchmarks/bench_wire_format.py
+    python benchmarks/bench_wire_format.py --count 96 --advice-format codes
+
+Exit code 0 when every frame round-trips, 1 otherwise.
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+import statistics
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(BENCH_DIR, '..'))
+sys.path.insert(0, BENCH_DIR)
+
+import analyze_resume_wrapper as wrapper
+from ats_resume_analyzer import ADVICE_FORMATS
+from resume_corpus import generate_corpus
+
+
+def best_of(fn, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def codecs():
+    """name -> (serialize, parse) over a result dict / the serialized bytes."""
+    schema = wrapper.get_wire_schema()
+    found = {
+        "json": (lambda r: json.dumps(r, ensure_ascii=False).encode("utf-8"), json.loads),
+        "ats-wire": (schema.pack, schema.unpack),
+    }
+    try:
+        import msgpack
+        found["msgpack"] = (msgpack.packb, msgpack.unpackb)
+    except ImportError:
+        print("msgpack not installed; skipping it", file=sys.stderr)
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark result serialization formats")
+    parser.add_argument("--count", type=int, default=48, help="Resumes in the corpus (default: 48)")
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--repeat", type=int, default=7, help="Timed runs, best kept (default: 7)")
+    parser.add_argument("--advice-format", choices=ADVICE_FORMATS, default="text",
+                        help="Advice format of the results being serialized (default: text)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        entries = generate_corpus(tmp, count=args.count, seed=args.seed)
+        results = [wrapper.run_analysis(e["sidecar"], advice_format=args.advice_format) for e in entries]
+
+    failures = []
+    rows = []
+    for name, (serialize, parse) in codecs().items():
+        payloads = [serialize(r) for r in results]
+        if any(parse(p) != r for p, r in zip(payloads, results)):
+            failures.append(name)
+        serialize_s = best_of(lambda: [serialize(r) for r in results], args.repeat)
+        parse_s = best_of(lambda: [parse(p) for p in payloads], args.repeat)
+        sizes = [len(p) for p in payloads]
+        rows.append((name, statistics.median(sizes), sum(sizes), serialize_s, parse_s))
+
+    per_result = lambda seconds: seconds * 1e6 / len(results)
+    base_total, base_serialize, base_parse = rows[0][2], rows[0][3], rows[0][4]
+    print(f"{len(results)} results, advice format {args.advice_format}")
+    print(f"{'format':<9} {'median':>9} {'total':>11} {'size':>6} {'serialize':>12} {'parse':>12}")
+    for name, median, total, serialize_s, parse_s in rows:
+        print(f"{name:<9} {median:>8.0f}B {total:>10}B {total / base_total:>5.2f}x "
+              f"{per_result(serialize_s):>9.1f} us {per_result(parse_s):>9.1f} us"
+              f"   ({serialize_s / base_serialize:.2f}x / {parse_s / base_parse:.2f}x of json)")
+
+    if failures:
+        print(f"\n✗ Did not round-trip: {', '.join(failures)}")
+        sys.exit(1)
+    print("\n✓ Every format round-trips every result")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Startup regression check for ats_resume_analyzer.
+
+Imports the analyzer in fresh interpreters under `python -X importtime`,
+takes the best cumulative import time over several runs and fails if it
+exceeds the budget. It also fails if the import pulls in any module that
+should only load on the code paths that need it (pdfplumber, nltk, numpy,
+process pools, the SQLite cache backend). tests/test_import_time.py runs the
+same check under pytest.
+
+Usage:
+    python benchmarks/check_import_time.py
+    python benchmarks/check_import_time.py --budget-ms 80 --runs 10
+
+Exit code 0 when within budget, 1 otherwise.
+"""
+
+import os
+import re
+import sys
+import json
+import argparse
+import subprocess
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+MODULE = "ats_resume_analyzer"
+
+# Modules that must not be imported by `import ats_resume_analyzer`
+LAZY_MODULES = ["pdfplumber", "nltk", "numpy", "concurrent.futures", "multiprocessing", "sqlite3", "argparse"]
+
+IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|\s+(\S.*)$")
+
+DEFAULT_BUDGET_MS = 60.0
+
+
+def _env():
+    env = dict(os.environ)
+    # Measure with bytecode caching, as in production
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    return env
+
+
+def importtime_report():
+    """
+    (cumulative import time of MODULE in microseconds, names of every module
+    it imported) from one fresh interpreter under -X importtime.
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {MODULE}"],
+        cwd=BACKEND_DIR, env=_env(), capture_output=True, text=True, check=True
+    )
+    cumulative_us = None
+    imported = set()
+    for line in proc.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            name = match.group(3).strip()
+            imported.add(name)
+            if name == MODULE:
+                cumulative_us = int(match.group(2))
+    if cumulative_us is None:
+        raise RuntimeError(f"No importtime entry for {MODULE}:\n{proc.stderr[-2000:]}")
+    return cumulative_us, imported
+
+
+def measure_import_us() -> int:
+    """Cumulative import time of MODULE in microseconds, from one fresh interpreter."""
+    return importtime_report()[0]
+
+
+def eagerly_imported() -> list:
+    """Modules from LAZY_MODULES that a plain import loads."""
+    code = f"import sys, json, {MODULE}; print(json.dumps(sorted(sys.modules)))"
+    proc = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=BACKEND_DIR, env=_env(), capture_output=True, text=True, check=True
+    )
+    loaded = set(json.loads(proc.stdout))
+    return [name for name in LAZY_MODULES if name in loaded]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=f'Check the import-time budget of {MODULE}')
+    parser.add_argument('--budget-ms', type=float, default=DEFAULT_BUDGET_MS,
+                        help=f'Maximum cumulative import time (default: {DEFAULT_BUDGET_MS:.0f} ms)')
+    parser.add_argument('--runs', type=int, default=5, help='Fresh-interpreter runs; the best is compared (default: 5)')
+    args = parser.parse_args()
+
+    measure_import_us()  # warm-up: writes bytecode caches
+    best_ms = min(measure_import_us() for _ in range(args.runs)) / 1000
+    eager = eagerly_imported()
+
+    ok = best_ms <= args.budget_ms and not eager
+    print(f"{MODULE}: import {best_ms:.1f} ms (budget {args.budget_ms:.0f} ms)")
+    if eager:
+        print(f"✗ Imported eagerly but should be lazy: {', '.join(eager)}")
+    print("✓ Within startup budget" if ok else "✗ Startup budget exceeded")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,408 @@
+#!/usr/bin/env python3
+"""
+Synthetic resume corpus for benchmarks.
+
+Generates reproducible PDF resumes offline (no PDF library needed to write
+them) that vary in page count, column layout, skill density and section mix,
+with skills drawn from SKILL_DB. Each resume is laid out as positioned word
+boxes, which are written both as a minimal PDF and as the matching extraction
+sidecar (*.extract.json), so the scoring stages can be benchmarked even where
+pdfplumber is not installed.
+
+Usage:
+    python benchmarks/resume_corpus.py corpus/ --count 48 --seed 1234
+
+    from resume_corpus import generate_corpus
+    entries = generate_corpus("corpus/", count=48, seed=1234)
+"""
+
+import os
+import sys
+import json
+import random
+import hashlib
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from ats_resume_analyzer import (
+    SKILL_DB,
+    ACTION_VERBS,
+    ARTIFACT_FORMAT,
+    EXTRACTOR_VERSION,
+    SIDECAR_SUFFIX,
+    assemble_page_lines,
+    extraction_settings,
+    save_artifact,
+)
+
+
+# US Letter, 10pt Helvetica
+PAGE_WIDTH = 612.0
+PAGE_HEIGHT = 792.0
+MARGIN = 50.0
+FONT_SIZE = 10.0
+LINE_HEIGHT = 14.0
+CHAR_WIDTH = 0.5 * FONT_SIZE     # Average Helvetica advance, close enough for layout
+SPACE_WIDTH = 0.278 * FONT_SIZE
+
+# Two-column layout: a narrow sidebar and a main column with a wide gutter.
+# The sidebar starts a little lower so its baselines do not line up with the
+# main column's.
+SIDEBAR = (MARGIN, 210.0)
+SIDEBAR_OFFSET = 5.0
+MAIN_COLUMN = (250.0, PAGE_WIDTH - MARGIN)
+SINGLE_COLUMN = (MARGIN, PAGE_WIDTH - MARGIN)
+
+SKILL_DENSITIES = {"low": 4, "medium": 14, "high": 36}
+PAGE_COUNTS = [1, 1, 2, 2, 3, 5]
+
+SECTION_HEADINGS = {
+    "summary": "PROFESSIONAL SUMMARY",
+    "education": "EDUCATION",
+    "skills": "TECHNICAL SKILLS",
+    "experience": "WORK EXPERIENCE",
+    "projects": "PROJECTS",
+    "certifications": "CERTIFICATIONS",
+    "awards": "AWARDS",
+}
+# Sections the sidebar holds in a two-column layout
+SIDEBAR_SECTIONS = ("skills", "education", "certifications", "awards")
+
+FIRST_NAMES = ["Aarav", "Diya", "Ishaan", "Meera", "Rohan", "Sara", "Kabir", "Ananya", "Vikram", "Nisha"]
+LAST_NAMES = ["Sharma", "Iyer", "Reddy", "Patel", "Nair", "Gupta", "Khan", "Das", "Menon", "Singh"]
+COMPANIES = ["Infosys", "Zoho", "Flipkart", "Razorpay", "Freshworks", "Swiggy", "TCS", "Wipro", "Atlassian", "Postman"]
+TITLES = ["Software Engineer", "Backend Developer", "Data Analyst", "Frontend Developer",
+          "DevOps Engineer", "Machine Learning Intern", "Full Stack Developer", "QA Engineer"]
+DEGREES = ["B.Tech in Computer Science", "Bachelor of Engineering", "MCA", "M.Tech in Data Science",
+           "BCA", "Diploma in Information Technology"]
+OBJECTS = ["the billing service", "an internal dashboard", "the search API", "CI pipelines",
+           "a recommendation model", "the onboarding flow", "reporting jobs", "the mobile app"]
+OUTCOMES = ["cutting latency by {n}%", "for {n}k daily users", "saving {n} hours a week",
+            "improving test coverage to {n}%", "reducing cloud cost by {n}%", "across {n} teams"]
+FILLER = ["with", "using", "and", "for", "the", "team", "service", "features", "production",
+          "customers", "reliable", "scalable", "tooling", "stakeholders"]
+
+
+# ============================================================================
+# LAYOUT - Flow text lines into positioned word boxes
+# ============================================================================
+
+class PageLayout:
+    """
+    Flows lines of text into columns and pages. Each page keeps its word
+    boxes ([x0, top, x1, bottom, text], as in extraction artifacts) and the
+    placed lines ((x, top, text)) the PDF writer draws.
+    """
+
+    def __init__(self, columns):
+        self.columns = columns
+        self.pages = []
+        self.cursors = [MARGIN] * len(columns)
+        if len(columns) == 2:
+            self.cursors[0] += SIDEBAR_OFFSET
+        self.column_pages = [0] * len(columns)
+
+    def _page(self, index):
+        while len(self.pages) <= index:
+            self.pages.append({"words": [], "lines": []})
+        return self.pages[index]
+
+    def add_line(self, text, column=0):
+        """Place text in the column, wrapping at its width and breaking pages."""
+        left, right = self.columns[column]
+        x = left
+        line_words = []
+        for word in text.split():
+            width = len(word) * CHAR_WIDTH
+            if line_words and x + width > right:
+                self._emit(line_words, column)
+                line_words, x = [], left
+            line_words.append((x, x + width, word))
+            x += width + SPACE_WIDTH
+        if line_words:
+            self._emit(line_words, column)
+
+    def skip(self, column=0):
+        """Leave a blank line."""
+        self.cursors[column] += LINE_HEIGHT / 2
+
+    def _emit(self, line_words, column):
+        if self.cursors[column] + LINE_HEIGHT > PAGE_HEIGHT - MARGIN:
+            self.column_pages[column] += 1
+            self.cursors[column] = MARGIN
+        top = self.cursors[column]
+        page = self._page(self.column_pages[column])
+        for x0, x1, word in line_words:
+            page["words"].append([round(x0, 2), round(top, 2), round(x1, 2), round(top + FONT_SIZE, 2), word])
+        page["lines"].append((line_words[0][0], top, " ".join(word for _, _, word in line_words)))
+        self.cursors[column] += LINE_HEIGHT
+
+    def main_page_count(self):
+        return self.column_pages[-1] + 1
+
+    def main_fill(self):
+        """Fraction of the current main-column page already used."""
+        return (self.cursors[-1] - MARGIN) / (PAGE_HEIGHT - 2 * MARGIN)
+
+
+# ============================================================================
+# CONTENT - Resume sections built from SKILL_DB vocabulary
+# ============================================================================
+
+def _all_skills():
+    return sorted({skill for skills in SKILL_DB.values() for skill in skills})
+
+
+def _bullet(rng, skills):
+    verb = rng.choice(ACTION_VERBS).capitalize()
+    parts = [verb, rng.choice(OBJECTS)]
+    parts += rng.sample(FILLER, 3)
+    if skills:
+        parts += ["using", rng.choice(skills)]
+    if rng.random() < 0.6:
+        parts.append(rng.choice(OUTCOMES).format(n=rng.randint(5, 90)))
+    return "- " + " ".join(parts)
+
+
+def _experience_entry(rng, skills):
+    lines = [
+        f"{rng.choice(TITLES)} | {rng.choice(COMPANIES)}",
+        f"{rng.choice(['Jan', 'Apr', 'Jul', 'Oct'])} {rng.randint(2016, 2023)} - Present",
+    ]
+    lines += [_bullet(rng, skills) for _ in range(rng.randint(3, 5))]
+    return lines
+
+
+def _project_entry(rng, skills):
+    stack = ", ".join(rng.sample(skills, min(3, len(skills)))) if skills else "python"
+    return [
+        f"{rng.choice(['Smart', 'Open', 'Rapid', 'Campus', 'Cloud'])} "
+        f"{rng.choice(['Tracker', 'Portal', 'Planner', 'Analyzer', 'Chat'])} | {stack}",
+        _bullet(rng, skills),
+        _bullet(rng, skills),
+    ]
+
+
+def _section_lines(rng, section, skills):
+    if section == "summary":
+        return [f"{rng.choice(TITLES)} with {rng.randint(1, 8)} years of experience building "
+                f"{rng.choice(OBJECTS)} and {rng.choice(OBJECTS)}."]
+    if section == "education":
+        return [rng.choice(DEGREES), f"{rng.choice(['IIT', 'NIT', 'VIT', 'Anna'])} University, "
+                f"{rng.randint(2014, 2024)} | CGPA {rng.randint(65, 97) / 10}"]
+    if section == "skills":
+        return [", ".join(skills[i:i + 6]) for i in range(0, len(skills), 6)] or ["Communication"]
+    if section == "certifications":
+        return [f"{rng.choice(['AWS', 'Azure', 'Google Cloud', 'Oracle'])} Certified "
+                f"{rng.choice(['Developer', 'Practitioner', 'Associate'])}"]
+    if section == "awards":
+        return [f"Winner, {rng.choice(['Smart India Hackathon', 'Code Sprint', 'HackerEarth Challenge'])} "
+                f"{rng.randint(2018, 2024)}"]
+    return []
+
+
+def generate_resume(rng, pages=1, columns=1, skill_density="medium", sections=None):
+    """
+    Lay out one synthetic resume.
+
+    Args:
+        rng: random.Random instance (the only source of randomness)
+        pages: Target page count; experience and project entries are added
+            until the main column reaches it
+        columns: 1 for a single column, 2 for sidebar + main column
+        skill_density: "low", "medium" or "high" (see SKILL_DENSITIES)
+        sections: Sections to include (keys of SECTION_HEADINGS); experience
+            is always present. Defaults to all of them.
+
+    Returns:
+        Dictionary with the spec, the skills used and per-page word boxes
+    """
+    sections = [s for s in SECTION_HEADINGS if sections is None or s in sections or s == "experience"]
+    skills = rng.sample(_all_skills(), SKILL_DENSITIES[skill_density])
+
+    layout = PageLayout([SIDEBAR, MAIN_COLUMN] if columns == 2 else [SINGLE_COLUMN])
+    main = len(layout.columns) - 1
+
+    name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+    layout.add_line(name.upper(), main)
+    handle = name.lower().replace(" ", ".")
+    layout.add_line(f"{handle}@example.com | +91 98{rng.randint(10000000, 99999999)} | "
+                    f"linkedin.com/in/{handle.replace('.', '-')} | github.com/{handle.replace('.', '')}", main)
+    layout.skip(main)
+
+    for section in sections:
+        column = 0 if columns == 2 and section in SIDEBAR_SECTIONS else main
+        layout.add_line(SECTION_HEADINGS[section], column)
+        if section == "experience":
+            for line in _experience_entry(rng, skills):
+                layout.add_line(line, column)
+        elif section == "projects":
+            for line in _project_entry(rng, skills):
+                layout.add_line(line, column)
+        else:
+            for line in _section_lines(rng, section, skills):
+                layout.add_line(line, column)
+        layout.skip(column)
+
+    # Pad the main column up to the requested length
+    while layout.main_page_count() < pages or (pages > 1 and layout.main_fill() < 0.5):
+        entry = _experience_entry(rng, skills) if rng.random() < 0.6 else _project_entry(rng, skills)
+        for line in entry:
+            layout.add_line(line, main)
+        layout.skip(main)
+
+    return {
+        "spec": {"pages": pages, "columns": columns, "skill_density": skill_density, "sections": sections},
+        "skills": sorted(skills),
+        "pages": [{"width": PAGE_WIDTH, "height": PAGE_HEIGHT, **page} for page in layout.pages],
+    }
+
+
+# ============================================================================
+# OUTPUT - Minimal PDF writer and matching sidecar artifact
+# ============================================================================
+
+def _pdf_string(text):
+    return "(" + text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)") + ")"
+
+
+def _content_stream(lines):
+    """One text-showing operation per placed line."""
+    ops = ["BT", f"/F1 {FONT_SIZE:g} Tf"]
+    for x, top, text in lines:
+        baseline = PAGE_HEIGHT - top - FONT_SIZE * 0.8
+        ops.append(f"1 0 0 1 {x:.2f} {baseline:.2f} Tm")
+        ops.append(_pdf_string(text) + " Tj")
+    ops.append("ET")
+    return "\n".join(ops).encode("latin-1", errors="replace")
+
+
+def render_pdf(resume):
+    """Serialize a generated resume as a PDF 1.4 file using the standard Helvetica font."""
+    page_count = len(resume["pages"])
+    first_page_obj = 4
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        ("<< /Type /Pages /Count %d /Kids [%s] >>" % (
+            page_count,
+            " ".join(f"{first_page_obj + 2 * i} 0 R" for i in range(page_count))
+        )).encode("ascii"),
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>",
+    ]
+    for i, page in enumerate(resume["pages"]):
+        stream = _content_stream(page["lines"])
+        objects.append((
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {page['width']:g} {page['height']:g}] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {first_page_obj + 2 * i + 1} 0 R >>"
+        ).encode("ascii"))
+        objects.append(b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream")
+
+    out = bytearray(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+    xref_offset = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for offset in offsets:
+        out += b"%010d 00000 n \n" % offset
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref_offset)
+    return bytes(out)
+
+
+def build_artifact(resume, pdf_bytes, source_name):
+    """The extraction sidecar extract_resume_artifact would store for this PDF."""
+    text_parts = []
+    pages = []
+    for page in resume["pages"]:
+        boxes = [tuple(w) for w in page["words"]]
+        lines, columns = assemble_page_lines(boxes, page["width"])
+        pages.append({"width": page["width"], "height": page["height"], "columns": columns, "words": page["words"]})
+        for line in lines:
+            text_parts.append(line)
+            text_parts.append("\n")
+    return {
+        "format": ARTIFACT_FORMAT,
+        "extractor_version": EXTRACTOR_VERSION,
+        "source_sha256": hashlib.sha256(pdf_bytes).hexdigest(),
+        "source_name": source_name,
+        "page_count": len(pages),
+        "total_pages": len(pages),
+        "truncated": False,
+        "limit_exceeded": None,
+        "preflight": {
+            "file_size": len(pdf_bytes),
+            "page_count": len(pages),
+            "text_pages": len(pages),
+            "image_pages": 0,
+            "font_count": 1,
+            "encrypted": False,
+            "flags": [],
+        },
+        "extract_options": extraction_settings(),
+        "text": "".join(text_parts),
+        "pages": pages,
+    }
+
+
+def generate_corpus(out_dir, count=48, seed=1234, with_sidecars=True):
+    """
+    Write `count` resumes to out_dir as resume_NNN.pdf (plus sidecars) and a
+    manifest.json describing each one. The same seed always yields the same
+    bytes.
+
+    Returns:
+        Manifest entries: {"pdf", "sidecar", "spec", "skills"}
+    """
+    rng = random.Random(seed)
+    out = Path(out_dir)
+    out.mkdir(parents=True, exist_ok=True)
+    optional_sections = [s for s in SECTION_HEADINGS if s != "experience"]
+
+    entries = []
+    for i in range(count):
+        # Cycle the layout axes so even small corpora cover every combination
+        columns = 1 + (i % 2)
+        skill_density = list(SKILL_DENSITIES)[(i // 2) % len(SKILL_DENSITIES)]
+        pages = PAGE_COUNTS[i % len(PAGE_COUNTS)]
+        if i % 4 == 3:
+            sections = rng.sample(optional_sections, rng.randint(1, len(optional_sections) - 1))
+        else:
+            sections = None
+
+        resume = generate_resume(rng, pages=pages, columns=columns,
+                                 skill_density=skill_density, sections=sections)
+        pdf_bytes = render_pdf(resume)
+        pdf_path = out / f"resume_{i:03d}.pdf"
+        pdf_path.write_bytes(pdf_bytes)
+
+        entry = {"pdf": str(pdf_path), "sidecar": None, "spec": resume["spec"], "skills": resume["skills"]}
+        if with_sidecars:
+            sidecar = str(pdf_path) + SIDECAR_SUFFIX
+            save_artifact(build_artifact(resume, pdf_bytes, pdf_path.name), sidecar)
+            entry["sidecar"] = sidecar
+        entries.append(entry)
+
+    with open(out / "manifest.json", "w", encoding="utf-8") as f:
+        json.dump({"seed": seed, "count": count, "resumes": entries}, f, indent=2)
+    return entries
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic PDF resume corpus")
+    parser.add_argument("out_dir", help="Directory to write the corpus into")
+    parser.add_argument("--count", type=int, default=48, help="Number of resumes (default: 48)")
+    parser.add_argument("--seed", type=int, default=1234, help="Random seed (default: 1234)")
+    parser.add_argument("--no-sidecars", action="store_true", help="Only write the PDFs")
+    args = parser.parse_args()
+
+    entries = generate_corpus(args.out_dir, count=args.count, seed=args.seed,
+                              with_sidecars=not args.no_sidecars)
+    pages = sum(e["spec"]["pages"] for e in entries)
+    print(f"✓ Wrote {len(entries)} resumes ({pages} target pages) to {args.out_dir}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,350 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for ats_resume_analyzer.py and analyze_resume_wrapper.py.
+
+Times the public functions of both modules, individually and end-to-end,
+over a reproducible synthetic corpus (see resume_corpus.py) and writes the
+results as JSON. A saved run can be passed back with --compare to flag any
+benchmark whose median got slower than the regression threshold.
+
+Stages that parse PDFs need pdfplumber; without it they are reported as
+skipped and the rest of the suite runs from the corpus sidecars. The CLI
+entry points (main, batch_main) and the worker-mode servers are not timed
+directly; run_batch and handle_job cover the work they do.
+
+Usage:
+    python benchmarks/run_benchmarks.py --output before.json
+    python benchmarks/run_benchmarks.py --compare before.json --threshold 10
+    python benchmarks/run_benchmarks.py --corpus corpus/ --count 96 --repeat 9 --only wrapper.
+"""
+
+import os
+import io
+import sys
+import json
+import time
+import shutil
+import platform
+import argparse
+import tempfile
+import statistics
+from pathlib import Path
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(BENCH_DIR, '..'))
+sys.path.insert(0, BENCH_DIR)
+
+import ats_resume_analyzer as analyzer
+import analyze_resume_wrapper as wrapper
+from analysis_cache import open_cache
+from resume_corpus import generate_corpus
+
+RESULTS_FORMAT = "ats-bench"
+RESULTS_VERSION = 1
+
+
+class Skip(Exception):
+    """Raised by a benchmark setup when it cannot run in this environment."""
+
+
+def _require_pdfplumber():
+    try:
+        analyzer._import_pdfplumber()
+    except ImportError:
+        raise Skip("pdfplumber not installed")
+
+
+# ============================================================================
+# CORPUS CONTEXT
+# ============================================================================
+
+class Context:
+    """Corpus inputs, pre-computed once so each benchmark times only its target."""
+
+    def __init__(self, corpus_dir, entries, scratch_dir):
+        self.corpus_dir = corpus_dir
+        self.scratch_dir = scratch_dir
+        self.pdfs = [e["pdf"] for e in entries]
+        self.sidecars = [e["sidecar"] for e in entries]
+        self.artifacts = [analyzer.load_artifact(path) for path in self.sidecars]
+        self.texts = [a["text"] for a in self.artifacts]
+        self.pages = [
+            ([tuple(w) for w in page["words"]], page["width"])
+            for a in self.artifacts for page in a["pages"]
+        ]
+        self.skills = [analyzer.extract_skills(text) for text in self.texts]
+        self.scores = [analyzer.calculate_ats_score(text, skills) for text, skills in zip(self.texts, self.skills)]
+        self.gaps = [analyzer.skill_gap_analysis(skills) for skills in self.skills]
+        self._cache = None
+
+    @property
+    def cache(self):
+        """A result cache already holding every corpus resume."""
+        if self._cache is None:
+            self._cache = open_cache(os.path.join(self.scratch_dir, "bench_cache.db"))
+            for path in self.sidecars:
+                analyzer.analyze_resume(path, cache=self._cache)
+                wrapper.run_analysis(path, cache=self._cache)
+        return self._cache
+
+
+# ============================================================================
+# BENCHMARKS - name -> setup(ctx) returning the calls making up one round
+# ============================================================================
+
+def _calls(fn, arg_lists):
+    return [(fn, args) for args in arg_lists]
+
+
+def _document_views(text):
+    doc = analyzer.ResumeDocument(text)
+    return doc.lower, doc.token_set, doc.stripped_lines, doc.section_boundaries
+
+
+def _extract_calls(ctx, fn):
+    _require_pdfplumber()
+    return _calls(fn, [(path,) for path in ctx.pdfs])
+
+
+def _run_batch(ctx):
+    analyzer.run_batch(ctx.sidecars, io.StringIO(), workers=2)
+
+
+def _save_artifacts(ctx):
+    target = os.path.join(ctx.scratch_dir, "artifact.extract.json")
+    return _calls(analyzer.save_artifact, [(artifact, target) for artifact in ctx.artifacts])
+
+
+def _signature_calls(ctx):
+    from near_duplicates import NearDuplicateIndex
+    return _calls(NearDuplicateIndex().signature, [(t,) for t in ctx.texts])
+
+
+BENCHMARKS = [
+    # Extraction stage
+    ("analyzer.extract_resume_artifact", lambda ctx: _extract_calls(ctx, analyzer.extract_resume_artifact)),
+    ("analyzer.extract_resume_text", lambda ctx: _extract_calls(ctx, analyzer.extract_resume_text)),
+    ("analyzer.assemble_page_lines", lambda ctx: _calls(analyzer.assemble_page_lines, ctx.pages)),
+    ("analyzer.save_artifact", _save_artifacts),
+    ("analyzer.load_artifact", lambda ctx: _calls(analyzer.load_artifact, [(p,) for p in ctx.sidecars])),
+    ("analyzer.load_resume_text[sidecar reuse]", lambda ctx: _calls(
+        lambda path: analyzer.load_resume_text(path, use_sidecar=True), [(p,) for p in ctx.pdfs])),
+
+    # Scoring stage
+    ("analyzer.ResumeDocument[views]", lambda ctx: _calls(_document_views, [(t,) for t in ctx.texts])),
+    ("analyzer.match_skills", lambda ctx: _calls(analyzer.match_skills, [(t.lower(),) for t in ctx.texts])),
+    ("analyzer.extract_skills", lambda ctx: _calls(analyzer.extract_skills, [(t,) for t in ctx.texts])),
+    ("analyzer.detect_sections", lambda ctx: _calls(analyzer.detect_sections, [(t,) for t in ctx.texts])),
+    ("analyzer.calculate_ats_score", lambda ctx: _calls(
+        analyzer.calculate_ats_score, list(zip(ctx.texts, ctx.skills)))),
+    ("analyzer.skill_gap_analysis", lambda ctx: _calls(analyzer.skill_gap_analysis, [(s,) for s in ctx.skills])),
+    ("analyzer.get_ats_optimization_advice", lambda ctx: _calls(
+        analyzer.get_ats_optimization_advice,
+        [(score[0], score[1], score[2], gaps) for score, gaps in zip(ctx.scores, ctx.gaps)])),
+    ("analyzer.score_resume_text", lambda ctx: _calls(
+        analyzer.score_resume_text, [(t, p) for t, p in zip(ctx.texts, ctx.pdfs)])),
+    ("analyzer.score_resume_text[codes]", lambda ctx: _calls(
+        lambda text, path: analyzer.score_resume_text(text, path, advice_format="codes"),
+        list(zip(ctx.texts, ctx.pdfs)))),
+    ("analyzer.render_result", lambda ctx: _calls(analyzer.render_result, [
+        (analyzer.score_resume_text(t, p, advice_format="codes"),) for t, p in zip(ctx.texts, ctx.pdfs)])),
+
+    # Wrapper-only stages
+    ("wrapper.suggest_roles", lambda ctx: _calls(wrapper.suggest_roles, [(s,) for s in ctx.skills])),
+    ("wrapper.extract_experience_entries", lambda ctx: _calls(
+        wrapper.extract_experience_entries, [(t,) for t in ctx.texts])),
+    ("wrapper.extract_projects", lambda ctx: _calls(wrapper.extract_projects, [(t,) for t in ctx.texts])),
+
+    # End-to-end
+    ("analyzer.analyze_resume[pdf]", lambda ctx: _extract_calls(ctx, analyzer.analyze_resume)),
+    ("analyzer.analyze_resume[sidecar]", lambda ctx: _calls(analyzer.analyze_resume, [(p,) for p in ctx.sidecars])),
+    ("analyzer.analyze_resume[cache hit]", lambda ctx: _calls(
+        analyzer.analyze_resume, [(p, ctx.cache) for p in ctx.sidecars])),
+    ("analyzer.cache_lookup", lambda ctx: _calls(analyzer.cache_lookup, [(ctx.cache, p) for p in ctx.sidecars])),
+    ("near_duplicates.signature", _signature_calls),
+    ("analyzer.collect_batch_inputs", lambda ctx: [(analyzer.collect_batch_inputs, (ctx.corpus_dir,))]),
+    ("analyzer.run_batch[sidecars, 2 workers]", lambda ctx: [(_run_batch, (ctx,))]),
+    ("wrapper.run_analysis[pdf]", lambda ctx: _extract_calls(ctx, wrapper.run_analysis)),
+    ("wrapper.run_analysis[sidecar]", lambda ctx: _calls(wrapper.run_analysis, [(p,) for p in ctx.sidecars])),
+    ("wrapper.handle_job[sidecar]", lambda ctx: _calls(
+        wrapper.handle_job, [({"id": i, "file_path": p},) for i, p in enumerate(ctx.sidecars)])),
+]
+
+
+# ============================================================================
+# RUNNER
+# ============================================================================
+
+def time_benchmark(calls, repeat):
+    """
+    Run every call once as a warm-up, then `repeat` timed rounds.
+
+    Returns:
+        Per-call statistics in milliseconds
+    """
+    for fn, args in calls:
+        fn(*args)
+
+    per_call = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for fn, args in calls:
+            fn(*args)
+        per_call.append((time.perf_counter() - start) * 1000 / len(calls))
+
+    return {
+        "calls": len(calls),
+        "median_ms": round(statistics.median(per_call), 4),
+        "mean_ms": round(statistics.fmean(per_call), 4),
+        "min_ms": round(min(per_call), 4),
+        "stdev_ms": round(statistics.stdev(per_call), 4) if len(per_call) > 1 else 0.0
+    }
+
+
+def run_suite(ctx, repeat=5, only=None):
+    results = {}
+    for name, setup in BENCHMARKS:
+        if only and not any(pattern in name for pattern in only):
+            continue
+        try:
+            calls = setup(ctx)
+        except Skip as e:
+            results[name] = {"skipped": str(e)}
+            print(f"  {name:<48} skipped ({e})", file=sys.stderr)
+            continue
+        stats = time_benchmark(calls, repeat)
+        results[name] = stats
+        print(f"  {name:<48} {stats['median_ms']:>10.3f} ms  (min {stats['min_ms']:.3f}, "
+              f"n={stats['calls']})", file=sys.stderr)
+    return results
+
+
+def environment():
+    try:
+        analyzer._import_pdfplumber()
+        has_pdfplumber = True
+    except ImportError:
+        has_pdfplumber = False
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "analysis_version": analyzer.ANALYSIS_VERSION,
+        "extractor_version": analyzer.EXTRACTOR_VERSION,
+        "pdfplumber": has_pdfplumber
+    }
+
+
+def compare_results(baseline, current, threshold_pct, min_delta_ms):
+    """
+    Compare medians benchmark by benchmark.
+
+    Returns:
+        (rows, regressions) where each row is (name, before, after, change %)
+        and regressions lists the names slower than the threshold
+    """
+    rows = []
+    regressions = []
+    for name, after in current["results"].items():
+        before = baseline.get("results", {}).get(name)
+        if not before or "median_ms" not in before or "median_ms" not in after:
+            continue
+        old, new = before["median_ms"], after["median_ms"]
+        change = (new - old) / old * 100 if old > 0 else 0.0
+        rows.append((name, old, new, change))
+        if change > threshold_pct and new - old > min_delta_ms:
+            regressions.append(name)
+    return rows, regressions
+
+
+def load_corpus(corpus_dir, count, seed):
+    """Reuse the corpus in corpus_dir if its manifest matches, else generate it."""
+    manifest_path = Path(corpus_dir) / "manifest.json"
+    if manifest_path.exists():
+        with open(manifest_path, encoding="utf-8") as f:
+            manifest = json.load(f)
+        if manifest.get("seed") == seed and manifest.get("count") == count:
+            return manifest["resumes"]
+    print(f"Generating {count} synthetic resumes (seed {seed})...", file=sys.stderr)
+    return generate_corpus(corpus_dir, count=count, seed=seed)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the resume analyzer over a synthetic corpus")
+    parser.add_argument("--corpus", metavar="DIR",
+                        help="Corpus directory (generated there if missing; default: a temporary directory)")
+    parser.add_argument("--count", type=int, default=48, help="Resumes in the corpus (default: 48)")
+    parser.add_argument("--seed", type=int, default=1234, help="Corpus random seed (default: 1234)")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed rounds per benchmark (default: 5)")
+    parser.add_argument("--only", action="append", metavar="SUBSTRING",
+                        help="Only run benchmarks whose name contains this (repeatable)")
+    parser.add_argument("--output", "-o", help="Write results JSON here (default: stdout)")
+    parser.add_argument("--compare", metavar="BASELINE", help="Compare against a previous results JSON")
+    parser.add_argument("--threshold", type=float, default=10.0,
+                        help="With --compare, fail when a median is this many percent slower (default: 10)")
+    parser.add_argument("--min-delta-ms", type=float, default=0.01,
+                        help="Ignore slowdowns smaller than this many ms per call (default: 0.01)")
+    args = parser.parse_args()
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    scratch_dir = tempfile.mkdtemp(prefix="ats-bench-")
+    try:
+        corpus_dir = args.corpus or os.path.join(scratch_dir, "corpus")
+        entries = load_corpus(corpus_dir, args.count, args.seed)
+        ctx = Context(corpus_dir, entries, scratch_dir)
+
+        print(f"Running benchmarks ({args.repeat} rounds over {len(entries)} resumes)...", file=sys.stderr)
+        results = run_suite(ctx, repeat=args.repeat, only=args.only)
+        if ctx._cache is not None:
+            ctx._cache.close()
+    finally:
+        shutil.rmtree(scratch_dir, ignore_errors=True)
+
+    report = {
+        "format": RESULTS_FORMAT,
+        "version": RESULTS_VERSION,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "environment": environment(),
+        "corpus": {
+            "seed": args.seed,
+            "count": len(entries),
+            "pages": sum(len(a["pages"]) for a in ctx.artifacts),
+            "words": sum(len(t.split()) for t in ctx.texts)
+        },
+        "repeat": args.repeat,
+        "results": results
+    }
+
+    json_output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(json_output)
+        print(f"✓ Results saved to {args.output}", file=sys.stderr)
+    else:
+        print(json_output)
+
+    if baseline is None:
+        return
+
+    if baseline.get("environment", {}).get("python") != report["environment"]["python"]:
+        print("Note: baseline was recorded on a different Python version", file=sys.stderr)
+    rows, regressions = compare_results(baseline, report, args.threshold, args.min_delta_ms)
+    print(f"\nComparison with {args.compare} (threshold {args.threshold:g}%):", file=sys.stderr)
+    for name, old, new, change in rows:
+        flag = "  ✗ REGRESSION" if name in regressions else ""
+        print(f"  {name:<48} {old:>10.3f} -> {new:>10.3f} ms  {change:+6.1f}%{flag}", file=sys.stderr)
+
+    if regressions:
+        print(f"\n✗ {len(regressions)} benchmark(s) regressed beyond {args.threshold:g}%", file=sys.stderr)
+        sys.exit(1)
+    print("\n✓ No regressions", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
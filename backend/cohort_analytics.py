@@ -0,0 +1,364 @@
+#!/usr/bin/env python3
+"""
+Columnar cohort analytics over stored resume analyses.
+
+Backs the faculty SkillAnalytics and TPO PlacementAnalytics / TPOReports
+views. Analyses are loaded into columns instead of being walked one JSON
+document at a time:
+
+    skills      student x skill 0/1 matrix over the SKILL_DB vocabulary
+    scores      ATS score per student
+    breakdown   student x component matrix (formatting, skills, ...)
+    gaps        student x priority matrix of missing-skill counts
+    groups      optional label per student (e.g. department)
+
+and every aggregate (skill frequency, score histogram, per-category
+coverage, most common high-importance gaps) is a column reduction or a
+matrix product. Rows are appended incrementally as new analyses arrive;
+re-adding a student replaces their row.
+
+Accepts both the analyzer's result dicts (ats_score, skills_found, ...) and
+the atsAnalysis documents the Node.js backend stores (score, skillsFound, ...).
+
+Usage:
+    python cohort_analytics.py results.jsonl --top 15
+    python cohort_analytics.py students.json --group-field department
+
+    from cohort_analytics import CohortAnalytics
+    cohort = CohortAnalytics()
+    cohort.append("asha@college.edu", result, group="CSE")
+    report = cohort.summary()
+
+Dependencies:
+    pip install numpy
+"""
+
+import os
+import sys
+import json
+from typing import Dict, List, Any, Optional
+
+import numpy as np
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, script_dir)
+
+from ats_resume_analyzer import SKILL_DB, GAP_TABLE_BY_IMPORTANCE
+from skill_index import skill_vocabulary
+
+
+BREAKDOWN_COMPONENTS = ["formatting", "skills", "experience", "keywords", "education"]
+GAP_PRIORITIES = ["high", "medium", "low"]
+DEFAULT_SCORE_BINS = list(range(0, 101, 10))
+INITIAL_CAPACITY = 256
+
+
+def _normalize(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Map an analyzer result or a stored atsAnalysis document to one shape."""
+    if "atsAnalysis" in record:
+        record = record["atsAnalysis"]
+    return {
+        "score": record.get("ats_score", record.get("score")),
+        "breakdown": record.get("score_breakdown", record.get("breakdown")) or {},
+        "skills_found": record.get("skills_found", record.get("skillsFound")) or {},
+        "skill_gaps": record.get("skill_gaps", record.get("skillGaps")) or {},
+    }
+
+
+class CohortAnalytics:
+    """Growable columnar store of analyses with vectorized aggregates."""
+
+    def __init__(self, capacity: int = INITIAL_CAPACITY):
+        self.vocabulary = skill_vocabulary()
+        self.skill_ids = {skill: i for i, skill in enumerate(self.vocabulary)}
+        self.categories = list(SKILL_DB)
+
+        # skill x category membership, so per-category figures are one product
+        self.membership = np.zeros((len(self.vocabulary), len(self.categories)), dtype=np.float32)
+        for col, skills in enumerate(SKILL_DB.values()):
+            self.membership[[self.skill_ids[s] for s in skills], col] = 1.0
+        self.high_importance = np.array(
+            sorted({self.skill_ids[s] for _, s in GAP_TABLE_BY_IMPORTANCE.get("High", ())}),
+            dtype=np.intp
+        )
+
+        self.keys: List[str] = []
+        self.rows: Dict[str, int] = {}
+        self.size = 0
+        self._allocate(max(1, capacity))
+
+    def _allocate(self, capacity: int) -> None:
+        """Create or grow the column arrays to `capacity` rows."""
+        old = self.size
+        skills = np.zeros((capacity, len(self.vocabulary)), dtype=np.uint8)
+        scores = np.full(capacity, np.nan, dtype=np.float32)
+        breakdown = np.full((capacity, len(BREAKDOWN_COMPONENTS)), np.nan, dtype=np.float32)
+        gaps = np.full((capacity, len(GAP_PRIORITIES)), np.nan, dtype=np.float32)
+        groups = np.empty(capacity, dtype=object)
+        if old:
+            skills[:old] = self.skills[:old]
+            scores[:old] = self.scores[:old]
+            breakdown[:old] = self.breakdown[:old]
+            gaps[:old] = self.gaps[:old]
+            groups[:old] = self.groups[:old]
+        self.skills, self.scores, self.breakdown, self.gaps, self.groups = skills, scores, breakdown, gaps, groups
+        self.capacity = capacity
+
+    # ------------------------------------------------------------- appending
+
+    def append(self, key: str, record: Dict[str, Any], group: Optional[str] = None) -> int:
+        """
+        Add one analysis (or replace the row already stored under `key`;
+        a replacement without a group keeps the previous label).
+
+        Returns:
+            The row index
+        """
+        data = _normalize(record)
+        row = self.rows.get(key)
+        if row is None:
+            if self.size == self.capacity:
+                self._allocate(self.capacity * 2)
+            row = self.size
+            self.size += 1
+            self.keys.append(key)
+            self.rows[key] = row
+
+        presence = self.skills[row]
+        presence[:] = 0
+        ids = [
+            self.skill_ids[s.lower()]
+            for category_skills in data["skills_found"].values()
+            for s in category_skills
+            if s.lower() in self.skill_ids
+        ]
+        presence[ids] = 1
+
+        self.scores[row] = np.nan if data["score"] is None else data["score"]
+        breakdown = data["breakdown"]
+        self.breakdown[row] = [breakdown.get(c, np.nan) for c in BREAKDOWN_COMPONENTS]
+        priorities = data["skill_gaps"].get("priority_breakdown")
+        if priorities is None and "missing_skills_count" in data["skill_gaps"]:
+            priorities = {"high": 0, "medium": 0, "low": 0}  # "No gaps" results omit the breakdown
+        self.gaps[row] = [(priorities or {}).get(p, np.nan) for p in GAP_PRIORITIES]
+        if group is not None or self.groups[row] is None:
+            self.groups[row] = group
+        return row
+
+    def extend(self, records: List[Dict[str, Any]], key_field: str = "file_path",
+               group_field: Optional[str] = None) -> None:
+        """Append many records, keyed (and optionally grouped) by fields of each record."""
+        needed = self.size + len(records)
+        if needed > self.capacity:
+            self._allocate(max(needed, self.capacity * 2))
+        for record in records:
+            # Unkeyed records always get a new row, numbered by its position
+            key = record.get(key_field) or record.get("email") or f"row-{len(self.keys)}"
+            self.append(key, record, group=record.get(group_field) if group_field else None)
+
+    def __len__(self) -> int:
+        return self.size
+
+    # ------------------------------------------------------------ aggregates
+
+    def _mask(self, group: Optional[str]) -> np.ndarray:
+        if group is None:
+            return np.ones(self.size, dtype=bool)
+        return self.groups[:self.size] == group
+
+    def skill_frequency(self, group: Optional[str] = None, top: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Skills by number of students listing them, most common first."""
+        mask = self._mask(group)
+        students = int(mask.sum())
+        counts = self.skills[:self.size][mask].sum(axis=0, dtype=np.int64)
+        order = np.argsort(-counts, kind="stable")
+        order = order[counts[order] > 0][:top]
+        return [
+            {
+                "skill": self.vocabulary[i],
+                "students": int(counts[i]),
+                "percentage": round(100.0 * float(counts[i]) / students, 1) if students else 0.0
+            }
+            for i in order
+        ]
+
+    def score_distribution(self, group: Optional[str] = None, bins: List[float] = None) -> Dict[str, Any]:
+        """ATS score histogram and summary statistics (unscored rows are ignored)."""
+        edges = DEFAULT_SCORE_BINS if bins is None else bins
+        scores = self.scores[:self.size][self._mask(group)]
+        scores = scores[~np.isnan(scores)]
+        counts, _ = np.histogram(scores, bins=edges)
+        stats = {"count": int(scores.size)}
+        if scores.size:
+            p25, median, p75 = np.percentile(scores, [25, 50, 75])
+            stats.update({
+                "mean": round(float(scores.mean()), 1),
+                "median": round(float(median), 1),
+                "p25": round(float(p25), 1),
+                "p75": round(float(p75), 1),
+                "min": float(scores.min()),
+                "max": float(scores.max())
+            })
+        return {
+            "bins": [[edges[i], edges[i + 1]] for i in range(len(edges) - 1)],
+            "counts": counts.tolist(),
+            **stats
+        }
+
+    def breakdown_averages(self, group: Optional[str] = None) -> Dict[str, Optional[float]]:
+        """Mean of each score component."""
+        breakdown = self.breakdown[:self.size][self._mask(group)]
+        present = ~np.isnan(breakdown)
+        totals = np.where(present, breakdown, 0).sum(axis=0)
+        counts = present.sum(axis=0)
+        return {
+            component: round(float(totals[i] / counts[i]), 1) if counts[i] else None
+            for i, component in enumerate(BREAKDOWN_COMPONENTS)
+        }
+
+    def category_coverage(self, group: Optional[str] = None) -> Dict[str, Dict[str, float]]:
+        """
+        Per SKILL_DB category: share of students with at least one of its
+        skills, and the average number of its skills per student.
+        """
+        skills = self.skills[:self.size][self._mask(group)].astype(np.float32)
+        students = skills.shape[0]
+        per_student = skills @ self.membership
+        covered = (per_student > 0).sum(axis=0)
+        average = per_student.mean(axis=0) if students else np.zeros(len(self.categories))
+        return {
+            category: {
+                "coverage_percentage": round(100.0 * float(covered[i]) / students, 1) if students else 0.0,
+                "average_skills": round(float(average[i]), 2)
+            }
+            for i, category in enumerate(self.categories)
+        }
+
+    def top_missing_high_importance(self, group: Optional[str] = None, top: int = 10) -> List[Dict[str, Any]]:
+        """High-importance skills missing from the most students."""
+        mask = self._mask(group)
+        students = int(mask.sum())
+        if not students or not len(self.high_importance):
+            return []
+        have = self.skills[:self.size][mask][:, self.high_importance].sum(axis=0, dtype=np.int64)
+        missing = students - have
+        order = np.argsort(-missing, kind="stable")[:top]
+        return [
+            {
+                "skill": self.vocabulary[self.high_importance[i]],
+                "students_missing": int(missing[i]),
+                "percentage": round(100.0 * float(missing[i]) / students, 1)
+            }
+            for i in order if missing[i] > 0
+        ]
+
+    def gap_averages(self, group: Optional[str] = None) -> Dict[str, Optional[float]]:
+        """Mean number of missing skills per priority level."""
+        gaps = self.gaps[:self.size][self._mask(group)]
+        present = ~np.isnan(gaps)
+        totals = np.where(present, gaps, 0).sum(axis=0)
+        counts = present.sum(axis=0)
+        return {
+            priority: round(float(totals[i] / counts[i]), 1) if counts[i] else None
+            for i, priority in enumerate(GAP_PRIORITIES)
+        }
+
+    def group_scores(self) -> Dict[str, Dict[str, Any]]:
+        """Student count and mean ATS score per group label."""
+        labels = self.groups[:self.size]
+        result = {}
+        for label in sorted({g for g in labels if g is not None}):
+            scores = self.scores[:self.size][labels == label]
+            scores = scores[~np.isnan(scores)]
+            result[label] = {
+                "students": int((labels == label).sum()),
+                "average_score": round(float(scores.mean()), 1) if scores.size else None
+            }
+        return result
+
+    def summary(self, group: Optional[str] = None, top: int = 10, bins: List[float] = None) -> Dict[str, Any]:
+        """Every aggregate in one JSON-ready dict."""
+        return {
+            "students": int(self._mask(group).sum()),
+            "group": group,
+            "skill_frequency": self.skill_frequency(group, top=top),
+            "score_distribution": self.score_distribution(group, bins=bins),
+            "breakdown_averages": self.breakdown_averages(group),
+            "category_coverage": self.category_coverage(group),
+            "top_missing_high_importance": self.top_missing_high_importance(group, top=top),
+            "gap_averages": self.gap_averages(group),
+            "groups": self.group_scores() if group is None else {}
+        }
+
+    # ----------------------------------------------------------- persistence
+
+    def save(self, path: str) -> None:
+        """Store the columns as a compressed .npz file."""
+        n = self.size
+        np.savez_compressed(
+            path,
+            vocabulary=np.array(self.vocabulary),
+            keys=np.array(self.keys, dtype=str),
+            skills=self.skills[:n],
+            scores=self.scores[:n],
+            breakdown=self.breakdown[:n],
+            gaps=self.gaps[:n],
+            groups=np.array(["" if g is None else g for g in self.groups[:n]], dtype=str)
+        )
+
+    @classmethod
+    def load(cls, path: str) -> "CohortAnalytics":
+        """Restore columns saved with save(); more rows can then be appended."""
+        with np.load(path, allow_pickle=False) as data:
+            cohort = cls(capacity=max(INITIAL_CAPACITY, 2 * len(data["keys"])))
+            if data["vocabulary"].tolist() != cohort.vocabulary:
+                raise ValueError(f"Skill vocabulary changed since {path} was saved; rebuild it from results")
+            n = len(data["keys"])
+            cohort.keys = data["keys"].tolist()
+            cohort.rows = {key: i for i, key in enumerate(cohort.keys)}
+            cohort.size = n
+            cohort.skills[:n] = data["skills"]
+            cohort.scores[:n] = data["scores"]
+            cohort.breakdown[:n] = data["breakdown"]
+            cohort.gaps[:n] = data["gaps"]
+            cohort.groups[:n] = [g or None for g in data["groups"].tolist()]
+        return cohort
+
+
+def load_records(path: str) -> List[Dict[str, Any]]:
+    """Read analyses from JSON Lines (batch output) or a JSON array (e.g. exported students)."""
+    with open(path, encoding="utf-8") as f:
+        content = f.read()
+    stripped = content.lstrip()
+    if stripped.startswith("["):
+        records = json.loads(stripped)
+    else:
+        records = [json.loads(line) for line in content.splitlines() if line.strip()]
+    return [r for r in records if r.get("success", True) is not False]
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Summarize a cohort of resume analyses")
+    parser.add_argument("inputs", nargs="+", help="JSON Lines or JSON array files of analyses")
+    parser.add_argument("--key-field", default="file_path", help="Record field identifying a student (default: file_path)")
+    parser.add_argument("--group-field", help="Record field to group by, e.g. department")
+    parser.add_argument("--group", help="Only summarize this group")
+    parser.add_argument("--top", type=int, default=10, help="Entries in ranked lists (default: 10)")
+    parser.add_argument("--pretty", "-p", action="store_true", help="Pretty print JSON output")
+    args = parser.parse_args()
+
+    cohort = CohortAnalytics()
+    try:
+        for path in args.inputs:
+            cohort.extend(load_records(path), key_field=args.key_field, group_field=args.group_field)
+    except (OSError, ValueError) as e:
+        print(f"✗ {e}", file=sys.stderr)
+        sys.exit(1)
+
+    print(json.dumps(cohort.summary(group=args.group, top=args.top), indent=2 if args.pretty else None))
+
+
+if __name__ == "__main__":
+    main()
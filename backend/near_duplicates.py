@@ -0,0 +1,741 @@
+#!/usr/bin/env python3
+"""
+Near-duplicate resume detection with MinHash and locality-sensitive hashing.
+
+Copies of one template resume with a name, a date or a few bullets changed
+are different files, so the content-addressed cache treats each as new.
+Here a resume's extracted text is normalized (lowercased words, contact
+details reduced to their kind; see normalized_words) and cut into
+overlapping word shingles; its MinHash signature is the minimum of each of
+NUM_PERM hash permutations over those shingles. Two signatures agree in any
+one position with probability equal to the Jaccard similarity of the two
+shingle sets, so the fraction of agreeing positions estimates it.
+
+For lookup the signature's first bands x rows values are split into `bands`
+bands of `rows` values, and each band is hashed to one 64-bit value.
+Resumes sharing any band hash are candidates; only those are compared
+signature to signature. The band hashes of every indexed resume are kept
+sorted per band, so finding the candidates for a query is `bands` binary
+searches whatever the cohort size. bands and rows are chosen for the index
+threshold (see lsh_params).
+
+Entries are keyed by document SHA-256 (document_hash, as the analyzer's
+cache keys are), so one document is one entry wherever it was uploaded; the
+path it was first indexed from is kept alongside, for reports.
+
+Queries report matches from the analyzer's NEAR_DUPLICATE_THRESHOLD unless
+told otherwise, so an index answers the same here and in the analyzer. The
+index's own threshold only tunes the banding: it sits below the reporting
+threshold so that nearly every pair above that is a candidate.
+
+The index persists to an append-only file: a header with the parameters,
+then one record per add (key, path, signature). Adding to an index opened
+from a file appends a single record (nothing when the key is already stored
+with the same signature), several processes may add to the same file, and
+each picks up the others' records before answering a query.
+
+Usage:
+    python near_duplicates.py build resumes/ -o cohort.ndx --workers 8
+    python near_duplicates.py duplicates cohort.ndx --threshold 0.9
+    python near_duplicates.py query cohort.ndx resume.pdf
+
+    from near_duplicates import NearDuplicateIndex
+    index = NearDuplicateIndex()
+    index.add(document_hash("students/asha.pdf"), text, path="students/asha.pdf")
+    for key, similarity in index.query(other_text):
+        print(index.path_of(key), similarity)
+
+Dependencies:
+    pip install numpy
+"""
+
+import os
+import re
+import sys
+import json
+import zlib
+import struct
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Tuple, Any, Optional, Union, Iterator
+
+import numpy as np
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, script_dir)
+
+from ats_resume_analyzer import NEAR_DUPLICATE_THRESHOLD, document_hash
+
+
+INDEX_MAGIC = b"ATSNDIX\0"
+INDEX_VERSION = 2
+
+NUM_PERM = 128
+SHINGLE_SIZE = 5
+SEED = 1
+# Similarity new indexes tune their banding for (see lsh_params). LSH finds
+# about half the pairs at the tuned similarity, and nearly all of those at
+# NEAR_DUPLICATE_THRESHOLD
+DEFAULT_THRESHOLD = 0.8
+FALSE_NEGATIVE_WEIGHT = 0.8
+
+# magic, version, num_perm, shingle_size, seed, bands, rows, threshold
+_HEADER = struct.Struct("<8sIIIIIId")
+# key and path lengths, followed by the key and path (UTF-8; an empty path
+# is none) and num_perm little-endian uint32s
+_RECORD_HEADER = struct.Struct("<HH")
+
+_SHINGLE_MULTIPLIER = np.uint64(0x9E3779B97F4A7C15)
+_BAND_MULTIPLIER = np.uint64(0x100000001B3)
+_SHIFT = np.uint64(32)
+
+# Entries added since the band tables were last sorted are scanned linearly;
+# past this many the tables are rebuilt
+_UNSORTED_LIMIT = 1024
+
+_WORD = re.compile(r"\w+")
+# Contact details, each matched from the start of a whitespace-delimited
+# token: an email address, a URL with a path (group 1 is the site name, as
+# in linkedin.com/in/asha or https://github.com/asha), or a phone number.
+# Anchoring at token starts keeps the scan linear in the text length
+_CONTACT = re.compile(
+    r"(?<!\S)(?:[^\s@]*@\S*"
+    r"|(?:[a-z]+://)?(?:www\.)?([a-z0-9-]+)\.[a-z.]{2,}/\S*"
+    r"|\+?\d[\d-]{8,}\d(?!\S))"
+)
+
+
+def _contact_kind(match) -> str:
+    if match.group(1):
+        return match.group(1)
+    return "email" if "@" in match.group(0) else "phone"
+
+
+Signature = np.ndarray
+
+
+def normalized_words(text: str) -> List[str]:
+    """
+    Lowercased words of text (runs of letters and digits, so layout, bullets
+    and punctuation do not matter), with contact details reduced to their
+    kind: an email address becomes "email", a profile or site URL its site
+    name ("linkedin"), a phone number "phone". Copies of one template differ
+    in exactly these, while whether a resume has them still counts.
+    """
+    return _WORD.findall(_CONTACT.sub(_contact_kind, text.lower()))
+
+
+def shingle_hashes(text: str, shingle_size: int = SHINGLE_SIZE) -> np.ndarray:
+    """
+    32-bit hashes (as uint64) of the overlapping shingles of
+    normalized_words(text). Each word is hashed once; a shingle's hash
+    combines the hashes of its words. Text shorter than one shingle is a
+    single shingle.
+    """
+    words = normalized_words(text)
+    word_hashes = np.fromiter((zlib.crc32(word.encode("utf-8")) for word in words),
+                              dtype=np.uint64, count=len(words))
+    if not len(word_hashes):
+        return word_hashes
+    count = max(len(word_hashes) - shingle_size + 1, 1)
+    hashes = np.zeros(count, dtype=np.uint64)
+    for offset in range(min(shingle_size, len(word_hashes))):
+        hashes = hashes * _SHINGLE_MULTIPLIER + word_hashes[offset:offset + count]
+    return hashes >> _SHIFT
+
+
+@lru_cache(maxsize=None)
+def lsh_params(threshold: float, num_perm: int = NUM_PERM) -> Tuple[int, int]:
+    """
+    (bands, rows) with bands * rows <= num_perm minimizing the weighted
+    probability of false positives below threshold and false negatives above
+    it, where a pair of similarity s becomes a candidate with probability
+    1 - (1 - s^rows)^bands. Candidates are verified against the full
+    signature, so a false positive only costs a comparison and false
+    negatives weigh FALSE_NEGATIVE_WEIGHT.
+    """
+    similarity = np.linspace(0.0, 1.0, 1001)[:, None]
+    below = similarity[:, 0] < threshold
+    best = None
+    for bands in range(1, num_perm + 1):
+        rows = np.arange(1, num_perm // bands + 1)
+        candidate = 1.0 - (1.0 - similarity ** rows) ** bands
+        error = ((1.0 - FALSE_NEGATIVE_WEIGHT) * candidate[below].sum(axis=0)
+                 + FALSE_NEGATIVE_WEIGHT * (1.0 - candidate[~below]).sum(axis=0))
+        i = int(np.argmin(error))
+        if best is None or error[i] < best[0]:
+            best = (error[i], bands, int(rows[i]))
+    return best[1], best[2]
+
+
+# ============================================================================
+# INDEX
+# ============================================================================
+
+class NearDuplicateIndex:
+    """
+    MinHash signatures of resumes under caller-chosen keys (document hashes,
+    see the module docstring), searchable for near-duplicates. Re-adding a
+    key with another signature replaces it.
+    """
+
+    def __init__(
+        self,
+        threshold: float = DEFAULT_THRESHOLD,
+        num_perm: int = NUM_PERM,
+        shingle_size: int = SHINGLE_SIZE,
+        seed: int = SEED,
+        bands: Optional[int] = None,
+        rows: Optional[int] = None
+    ):
+        """
+        Args:
+            threshold: Jaccard similarity the banding is tuned for; pairs
+                well below it are rarely found
+            num_perm: Signature length; the similarity estimate has a
+                standard error of about 0.5 / sqrt(num_perm)
+            shingle_size: Words per shingle
+            seed: Seed of the hash functions; signatures are only
+                comparable between indexes with the same num_perm and seed
+            bands, rows: Override the banding chosen for threshold
+        """
+        if bands is None or rows is None:
+            bands, rows = lsh_params(threshold, num_perm)
+        if bands * rows > num_perm:
+            raise ValueError(f"bands x rows exceeds num_perm ({bands} x {rows} > {num_perm})")
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self.seed = seed
+        self.bands = bands
+        self.rows = rows
+
+        # Hash functions h(x) = (a * x + b) mod 2^64 >> 32 with a odd
+        # (multiply-add-shift), one per signature position
+        rng = np.random.RandomState(seed)
+        self._a = rng.randint(0, 1 << 63, size=num_perm, dtype=np.uint64) << np.uint64(1) | np.uint64(1)
+        self._b = rng.randint(0, 1 << 63, size=num_perm, dtype=np.uint64)
+
+        self._keys: List[str] = []
+        self._paths: List[Optional[str]] = []
+        self._ordinals: Dict[str, int] = {}
+        self._size = 0
+        self._signatures = np.zeros((0, num_perm), dtype=np.uint32)
+        self._band_hashes = np.zeros((0, bands), dtype=np.uint64)
+        self._live = np.zeros(0, dtype=bool)
+        # Per band: ordinals sorted by band hash, and the sorted hashes;
+        # they cover ordinals below _sorted_size
+        self._order = np.zeros((bands, 0), dtype=np.int64)
+        self._sorted = np.zeros((bands, 0), dtype=np.uint64)
+        self._sorted_size = 0
+
+        self.path: Optional[str] = None
+        self._log_offset = 0
+        self._lock = threading.RLock()
+
+    # ----------------------------------------------------------- signatures
+
+    def signature(self, text: str) -> Optional[Signature]:
+        """MinHash signature of text, or None when it has no words."""
+        hashes = shingle_hashes(text, self.shingle_size)
+        if not len(hashes):
+            return None
+        permuted = (np.unique(hashes)[:, None] * self._a + self._b) >> _SHIFT
+        return permuted.min(axis=0).astype(np.uint32)
+
+    def _as_signature(self, text_or_signature: Union[str, Signature, None]) -> Optional[Signature]:
+        if text_or_signature is None or isinstance(text_or_signature, str):
+            return self.signature(text_or_signature or "")
+        signature = np.asarray(text_or_signature, dtype=np.uint32)
+        if signature.shape != (self.num_perm,):
+            raise ValueError(f"Expected a signature of {self.num_perm} values, got shape {signature.shape}")
+        return signature
+
+    def _hash_bands(self, signatures: np.ndarray) -> np.ndarray:
+        """n x bands band hashes of an n x num_perm signature matrix (its first bands x rows columns)."""
+        banded = signatures[:, :self.bands * self.rows]
+        blocks = banded.reshape(len(signatures), self.bands, self.rows).astype(np.uint64)
+        hashes = np.zeros((len(signatures), self.bands), dtype=np.uint64)
+        for row in range(self.rows):
+            hashes = hashes * _BAND_MULTIPLIER + blocks[:, :, row]
+        return hashes
+
+    @staticmethod
+    def similarity(a: Signature, b: Signature) -> float:
+        """Estimated Jaccard similarity of two signatures."""
+        return float(np.count_nonzero(a == b)) / len(a)
+
+    # ------------------------------------------------------------ adding
+
+    def _extend(self, keys: List[str], signatures: np.ndarray, paths: List[Optional[str]]) -> None:
+        needed = self._size + len(keys)
+        if needed > len(self._signatures):
+            # Grow geometrically so adding one at a time stays amortized O(1)
+            capacity = max(needed, 2 * len(self._signatures), 64)
+            grown = []
+            for array in (self._signatures, self._band_hashes, self._live):
+                bigger = np.zeros((capacity,) + array.shape[1:], dtype=array.dtype)
+                bigger[:self._size] = array[:self._size]
+                grown.append(bigger)
+            self._signatures, self._band_hashes, self._live = grown
+
+        start = self._size
+        self._signatures[start:needed] = signatures
+        self._band_hashes[start:needed] = self._hash_bands(signatures)
+        self._live[start:needed] = True
+        for ordinal, key in enumerate(keys, start):
+            previous = self._ordinals.get(key)
+            if previous is not None:
+                self._live[previous] = False
+            self._ordinals[key] = ordinal
+            self._keys.append(key)
+        self._paths.extend(paths)
+        self._size = needed
+
+    def add(
+        self,
+        key: str,
+        text_or_signature: Union[str, Signature],
+        path: Optional[str] = None
+    ) -> Optional[Signature]:
+        """
+        Index a resume under key from its text (or a signature computed with
+        this index's parameters), with the path it was read from. When the
+        index was opened from a file, the entry is appended to it. A key
+        already stored with the same signature is left as it is, path
+        included, so re-analyzing a document does not grow the file.
+
+        Returns:
+            The signature, or None if the text has no words (nothing is added)
+        """
+        signature = self._as_signature(text_or_signature)
+        if signature is None:
+            return None
+        with self._lock:
+            self.refresh()
+            stored = self._ordinals.get(key)
+            if stored is not None and np.array_equal(self._signatures[stored], signature):
+                return signature
+            self._extend([key], signature[None, :], [path])
+            if self.path is not None:
+                self._append_record(key, path, signature)
+        return signature
+
+    def __len__(self) -> int:
+        return len(self._ordinals)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._ordinals
+
+    def keys(self) -> Iterator[str]:
+        """Keys of all indexed resumes, in insertion order."""
+        return (key for ordinal, key in enumerate(self._keys) if self._live[ordinal])
+
+    def signature_of(self, key: str) -> Signature:
+        """The stored signature for key (KeyError if absent)."""
+        return self._signatures[self._ordinals[key]].copy()
+
+    def path_of(self, key: str) -> Optional[str]:
+        """The path key was indexed from, if one was given (KeyError if absent)."""
+        return self._paths[self._ordinals[key]]
+
+    # ----------------------------------------------------------- querying
+
+    def _sort_bands(self) -> None:
+        """Fold the unsorted tail into the per-band sorted tables."""
+        hashes = self._band_hashes[:self._size].T
+        self._order = np.argsort(hashes, axis=1, kind="stable")
+        self._sorted = np.take_along_axis(hashes, self._order, axis=1)
+        self._sorted_size = self._size
+
+    def _candidates(self, band_hashes: np.ndarray) -> np.ndarray:
+        """Live ordinals sharing at least one band hash, ascending."""
+        if self._size - self._sorted_size > _UNSORTED_LIMIT:
+            self._sort_bands()
+        found = []
+        for band in range(self.bands):
+            column = self._sorted[band]
+            lo = np.searchsorted(column, band_hashes[band], side="left")
+            hi = np.searchsorted(column, band_hashes[band], side="right")
+            if hi > lo:
+                found.append(self._order[band, lo:hi])
+        tail = self._band_hashes[self._sorted_size:self._size]
+        if len(tail):
+            found.append(np.flatnonzero((tail == band_hashes).any(axis=1)) + self._sorted_size)
+        if not found:
+            return np.zeros(0, dtype=np.int64)
+        ordinals = np.unique(np.concatenate(found))
+        return ordinals[self._live[ordinals]]
+
+    def query(
+        self,
+        text_or_signature: Union[str, Signature],
+        threshold: Optional[float] = None,
+        k: Optional[int] = None,
+        exclude: Optional[str] = None
+    ) -> List[Tuple[str, float]]:
+        """
+        Indexed resumes whose estimated similarity to the given text (or
+        signature) is at least threshold.
+
+        Args:
+            text_or_signature: Resume text, or a signature from this index
+            threshold: Minimum similarity (default: NEAR_DUPLICATE_THRESHOLD).
+                Matches well below the index threshold are rarely candidates
+            k: Return at most this many
+            exclude: Key to leave out (e.g. the query's own key)
+
+        Returns:
+            [(key, similarity)], most similar first
+        """
+        signature = self._as_signature(text_or_signature)
+        if signature is None:
+            return []
+        threshold = NEAR_DUPLICATE_THRESHOLD if threshold is None else threshold
+        with self._lock:
+            self.refresh()
+            ordinals = self._candidates(self._hash_bands(signature[None, :])[0])
+            if not len(ordinals):
+                return []
+            agreement = np.count_nonzero(self._signatures[ordinals] == signature, axis=1) / self.num_perm
+            keep = agreement >= threshold
+            ordinals, agreement = ordinals[keep], agreement[keep]
+            # Most similar first; ties in insertion order
+            ranked = np.lexsort((ordinals, -agreement))
+            matches = [(self._keys[ordinals[i]], float(agreement[i])) for i in ranked]
+        if exclude is not None:
+            matches = [match for match in matches if match[0] != exclude]
+        return matches[:k] if k is not None else matches
+
+    def pairs(self, threshold: Optional[float] = None) -> List[Tuple[str, str, float]]:
+        """
+        Every pair of indexed resumes at least threshold similar (default:
+        NEAR_DUPLICATE_THRESHOLD), most similar first. Only pairs sharing a band
+        are compared, so the cost follows the number of near-duplicates, not
+        the square of the cohort size.
+        """
+        threshold = NEAR_DUPLICATE_THRESHOLD if threshold is None else threshold
+        with self._lock:
+            self.refresh()
+            self._sort_bands()
+            firsts, seconds = [], []
+            for band in range(self.bands):
+                column = self._sorted[band]
+                if len(column) < 2:
+                    continue
+                starts = np.flatnonzero(np.concatenate(([True], column[1:] != column[:-1])))
+                ends = np.append(starts[1:], len(column))
+                for start, end in zip(starts[ends - starts > 1], ends[ends - starts > 1]):
+                    bucket = np.sort(self._order[band, start:end])
+                    bucket = bucket[self._live[bucket]]
+                    i, j = np.triu_indices(len(bucket), k=1)
+                    firsts.append(bucket[i])
+                    seconds.append(bucket[j])
+            if not firsts:
+                return []
+            candidates = np.unique(np.stack((np.concatenate(firsts), np.concatenate(seconds)), axis=1), axis=0)
+            if not len(candidates):
+                return []
+            agreement = np.count_nonzero(
+                self._signatures[candidates[:, 0]] == self._signatures[candidates[:, 1]], axis=1
+            ) / self.num_perm
+            keep = agreement >= threshold
+            candidates, agreement = candidates[keep], agreement[keep]
+            ranked = np.lexsort((candidates[:, 1], candidates[:, 0], -agreement))
+            return [
+                (self._keys[candidates[i, 0]], self._keys[candidates[i, 1]], float(agreement[i]))
+                for i in ranked
+            ]
+
+    def groups(self, threshold: Optional[float] = None) -> List[List[str]]:
+        """
+        Resumes linked by near-duplicate pairs (see pairs), as groups of keys
+        in insertion order, largest group first.
+        """
+        parent: Dict[str, str] = {}
+
+        def root(key: str) -> str:
+            while parent.setdefault(key, key) != key:
+                parent[key] = parent[parent[key]]
+                key = parent[key]
+            return key
+
+        for first, second, _ in self.pairs(threshold):
+            parent[root(first)] = root(second)
+
+        members: Dict[str, List[str]] = {}
+        for key in sorted(parent, key=self._ordinals.__getitem__):
+            members.setdefault(root(key), []).append(key)
+        return sorted(members.values(), key=len, reverse=True)
+
+    # --------------------------------------------------------- persistence
+
+    def _header(self) -> bytes:
+        return _HEADER.pack(INDEX_MAGIC, INDEX_VERSION, self.num_perm, self.shingle_size,
+                            self.seed, self.bands, self.rows, self.threshold)
+
+    def _record(self, key: str, path: Optional[str], signature: Signature) -> bytes:
+        encoded_key = key.encode("utf-8")
+        encoded_path = (path or "").encode("utf-8")
+        return (_RECORD_HEADER.pack(len(encoded_key), len(encoded_path)) + encoded_key + encoded_path
+                + signature.astype("<u4").tobytes())
+
+    def _append_record(self, key: str, path: Optional[str], signature: Signature) -> None:
+        # One write per record on an O_APPEND descriptor, so records from
+        # concurrent writers never interleave
+        record = self._record(key, path, signature)
+        fd = os.open(self.path, os.O_WRONLY | os.O_APPEND)
+        try:
+            os.write(fd, record)
+            # Skip our own record on the next refresh unless others wrote
+            # since the last one (then it is simply read back)
+            if os.fstat(fd).st_size == self._log_offset + len(record):
+                self._log_offset += len(record)
+        finally:
+            os.close(fd)
+
+    def _read_records(self, data: bytes, offset: int) -> int:
+        """Index every complete record in data from offset; returns the end of the last one."""
+        signature_bytes = 4 * self.num_perm
+        keys, paths, blobs = [], [], []
+        while offset + _RECORD_HEADER.size <= len(data):
+            key_length, path_length = _RECORD_HEADER.unpack_from(data, offset)
+            key_end = offset + _RECORD_HEADER.size + key_length
+            path_end = key_end + path_length
+            end = path_end + signature_bytes
+            if end > len(data):
+                break  # Being appended right now; read it next time
+            keys.append(data[offset + _RECORD_HEADER.size:key_end].decode("utf-8"))
+            paths.append(data[key_end:path_end].decode("utf-8") or None)
+            blobs.append(data[path_end:end])
+            offset = end
+        if keys:
+            signatures = np.frombuffer(b"".join(blobs), dtype="<u4").reshape(len(keys), self.num_perm)
+            self._extend(keys, signatures.astype(np.uint32), paths)
+        return offset
+
+    def refresh(self) -> None:
+        """Pick up records other processes appended to this index's file."""
+        if self.path is None:
+            return
+        with self._lock:
+            try:
+                if os.path.getsize(self.path) <= self._log_offset:
+                    return
+                with open(self.path, "rb") as f:
+                    f.seek(self._log_offset)
+                    data = f.read()
+            except OSError:
+                return
+            self._log_offset += self._read_records(data, 0)
+
+    def save(self, path: str) -> None:
+        """
+        Write the live entries atomically as a compacted index file. Layout
+        (little-endian): header, then per entry its key and path lengths
+        (uint16 each), key and path (UTF-8) and signature (num_perm x uint32).
+        """
+        with self._lock:
+            path = Path(path)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(path.suffix + f".{os.getpid()}.tmp")
+            with open(tmp_path, "wb") as f:
+                f.write(self._header())
+                for ordinal, key in enumerate(self._keys):
+                    if self._live[ordinal]:
+                        f.write(self._record(key, self._paths[ordinal], self._signatures[ordinal]))
+            os.replace(tmp_path, path)
+
+    @classmethod
+    def open(cls, path: str, create: bool = False, **params) -> "NearDuplicateIndex":
+        """
+        Load an index file and bind to it, so later adds are appended there.
+
+        Args:
+            path: Index file
+            create: Create an empty index file (with params) if none exists
+            params: Constructor arguments for a new file; an existing file
+                keeps the parameters it was created with
+
+        Raises:
+            ValueError: If the file is not a near-duplicate index or of
+                another version
+        """
+        path = str(path)
+        if create and not os.path.exists(path):
+            index = cls(**params)
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+            try:
+                fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+            except FileExistsError:
+                pass  # Another process created it first; load theirs
+            else:
+                try:
+                    os.write(fd, index._header())
+                finally:
+                    os.close(fd)
+                index.path = path
+                index._log_offset = _HEADER.size
+                return index
+
+        with open(path, "rb") as f:
+            data = f.read()
+        if len(data) < _HEADER.size:
+            raise ValueError(f"Truncated near-duplicate index: {path}")
+        magic, version, num_perm, shingle_size, seed, bands, rows, threshold = _HEADER.unpack_from(data, 0)
+        if magic != INDEX_MAGIC:
+            raise ValueError(f"Not a near-duplicate index: {path}")
+        if version != INDEX_VERSION:
+            raise ValueError(f"Unsupported near-duplicate index version {version}: {path}")
+
+        index = cls(threshold=threshold, num_perm=num_perm, shingle_size=shingle_size,
+                    seed=seed, bands=bands, rows=rows)
+        index._log_offset = index._read_records(data, _HEADER.size)
+        index.path = path
+        return index
+
+
+# ============================================================================
+# BUILDING FROM RESUMES
+# ============================================================================
+
+def _resume_signature(
+    args: Tuple[str, bool, Dict[str, Any]]
+) -> Tuple[str, Optional[str], Optional[np.ndarray], Optional[str]]:
+    """
+    Signature of one resume's extracted text in a worker process:
+    (path, document hash, signature, error).
+    """
+    file_path, use_sidecar, params = args
+    from ats_resume_analyzer import load_resume_text
+    try:
+        content_hash = document_hash(file_path)
+        text = load_resume_text(file_path, use_sidecar=use_sidecar)
+    except Exception as e:
+        return file_path, None, None, f"{type(e).__name__}: {e}"
+    return file_path, content_hash, _worker_index(params).signature(text), None
+
+
+_worker_indexes: Dict[Tuple, NearDuplicateIndex] = {}
+
+
+def _worker_index(params: Dict[str, Any]) -> NearDuplicateIndex:
+    params_id = tuple(sorted(params.items()))
+    if params_id not in _worker_indexes:
+        _worker_indexes[params_id] = NearDuplicateIndex(**params)
+    return _worker_indexes[params_id]
+
+
+def build_index(
+    file_paths: List[str],
+    index: Optional[NearDuplicateIndex] = None,
+    use_sidecar: bool = False,
+    workers: Optional[int] = None
+) -> Tuple[NearDuplicateIndex, List[Tuple[str, str]]]:
+    """
+    Index resumes (PDFs or *.extract.json sidecars) by document hash, with
+    their file paths, extracting their text across a process pool.
+
+    Returns:
+        (index, [(file_path, error)] for resumes that could not be read)
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    index = index if index is not None else NearDuplicateIndex()
+    params = {"threshold": index.threshold, "num_perm": index.num_perm, "shingle_size": index.shingle_size,
+              "seed": index.seed, "bands": index.bands, "rows": index.rows}
+    failures = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        jobs = ((path, use_sidecar, params) for path in file_paths)
+        for file_path, content_hash, signature, error in executor.map(_resume_signature, jobs, chunksize=16):
+            if error is not None:
+                failures.append((file_path, error))
+            elif signature is not None:
+                index.add(content_hash, signature, path=file_path)
+    return index, failures
+
+
+# ============================================================================
+# COMMAND LINE INTERFACE
+# ============================================================================
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Build and search the near-duplicate resume index")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    build = commands.add_parser("build", help="Fingerprint resumes into an index")
+    build.add_argument("source", help="Directory, glob pattern or manifest of resumes (as for --batch)")
+    build.add_argument("--output", "-o", required=True, help="Index file to write")
+    build.add_argument("--append", action="store_true", help="Add to an existing index instead of replacing it")
+    build.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                       help=f"Similarity the banding is tuned for (default: {DEFAULT_THRESHOLD})")
+    build.add_argument("--sidecar", action="store_true", help="Reuse/write extraction sidecars next to each PDF")
+    build.add_argument("--workers", "-w", type=int, default=None, help="Worker processes (default: CPU count)")
+
+    duplicates = commands.add_parser("duplicates", help="List groups of near-duplicate resumes")
+    duplicates.add_argument("index", help="Index file")
+    duplicates.add_argument("--threshold", type=float, default=NEAR_DUPLICATE_THRESHOLD,
+                            help=f"Minimum similarity (default: {NEAR_DUPLICATE_THRESHOLD})")
+    duplicates.add_argument("--pairs", action="store_true", help="Also list every near-duplicate pair")
+
+    query = commands.add_parser("query", help="Find indexed resumes similar to one resume")
+    query.add_argument("index", help="Index file")
+    query.add_argument("resume", help="PDF resume or *.extract.json sidecar")
+    query.add_argument("--threshold", type=float, default=NEAR_DUPLICATE_THRESHOLD,
+                       help=f"Minimum similarity (default: {NEAR_DUPLICATE_THRESHOLD})")
+    query.add_argument("--top", "-k", type=int, default=None, help="Only the k most similar")
+
+    args = parser.parse_args()
+
+    try:
+        if args.command == "build":
+            from ats_resume_analyzer import collect_batch_inputs
+            file_paths = collect_batch_inputs(args.source)
+            if not file_paths:
+                raise ValueError(f"No resumes found for source: {args.source}")
+            existing = (NearDuplicateIndex.open(args.output)
+                        if args.append and Path(args.output).exists() else NearDuplicateIndex(args.threshold))
+            existing.path = None  # Written out once by save, not record by record
+            index, failures = build_index(file_paths, existing, use_sidecar=args.sidecar, workers=args.workers)
+            index.save(args.output)
+            for file_path, error in failures:
+                print(f"✗ {file_path}: {error}", file=sys.stderr)
+            print(f"✓ Indexed {len(index)} resumes into {args.output}", file=sys.stderr)
+            return
+
+        index = NearDuplicateIndex.open(args.index)
+
+        def document(key):
+            return {"document_sha256": key, "file_path": index.path_of(key)}
+
+        if args.command == "duplicates":
+            report = {
+                "threshold": args.threshold,
+                "groups": [
+                    {"documents": [document(key) for key in group]} for group in index.groups(args.threshold)
+                ],
+            }
+            if args.pairs:
+                report["pairs"] = [
+                    {"documents": [document(first), document(second)], "similarity": round(similarity, 3)}
+                    for first, second, similarity in index.pairs(args.threshold)
+                ]
+            print(json.dumps(report, ensure_ascii=False))
+        else:
+            from ats_resume_analyzer import load_resume_text
+            matches = index.query(load_resume_text(args.resume), threshold=args.threshold,
+                                  k=args.top, exclude=document_hash(args.resume))
+            print(json.dumps({
+                "resume": args.resume,
+                "matches": [{**document(key), "similarity": round(similarity, 3)} for key, similarity in matches]
+            }, ensure_ascii=False))
+    except (OSError, ValueError) as e:
+        print(f"✗ {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Vectorized role matching.
+
+Roles and resumes share one skill vocabulary: the role map becomes a
+role x skill 0/1 matrix built once, a resume becomes a 0/1 skill vector, and
+the number of required skills each role finds is a single matrix-vector
+product. A cohort of resumes is encoded as a resume x skill matrix, so every
+resume is scored against every role in one matrix product.
+
+Results have the same fields and ordering as the wrapper's suggest_roles:
+roles matching at least 30% of their skills, best first (ties keep role map
+order), at most 8, each with its matched and missing skills.
+
+Usage:
+    from role_matching import RoleMatcher
+
+    matcher = RoleMatcher(ROLE_SKILL_MAP)
+    roles = matcher.match(result["skills_found"])
+    cohort_roles = matcher.match_cohort([r["skills_found"] for r in results])
+
+Dependencies:
+    pip install numpy
+"""
+
+import heapq
+from typing import Dict, List, Any, Iterable
+
+import numpy as np
+
+
+MIN_MATCH_PERCENTAGE = 30
+DEFAULT_TOP_K = 8
+
+
+class RoleMatcher:
+    """Scores skill sets against a fixed role -> required skills map."""
+
+    def __init__(
+        self,
+        role_skill_map: Dict[str, List[str]],
+        min_match_percentage: float = MIN_MATCH_PERCENTAGE,
+        top_k: int = DEFAULT_TOP_K
+    ):
+        self.roles = list(role_skill_map)
+        self.min_match_percentage = min_match_percentage
+        self.top_k = top_k
+
+        self.skill_ids: Dict[str, int] = {}
+        for required_skills in role_skill_map.values():
+            for skill in required_skills:
+                self.skill_ids.setdefault(skill, len(self.skill_ids))
+
+        # float32 keeps the products on the BLAS path; counts stay exact
+        self.matrix = np.zeros((len(self.roles), len(self.skill_ids)), dtype=np.float32)
+        for row, required_skills in enumerate(role_skill_map.values()):
+            self.matrix[row, [self.skill_ids[s] for s in required_skills]] = 1.0
+        self._matrix_t = np.ascontiguousarray(self.matrix.T)
+
+        # Percentages are relative to the listed requirements, as before
+        self.role_sizes = np.array([len(s) for s in role_skill_map.values()], dtype=np.float64)
+        self._nonempty = self.role_sizes > 0
+        self._divisor = np.where(self._nonempty, self.role_sizes, 1.0)
+        self._role_skills = [sorted(set(s)) for s in role_skill_map.values()]
+
+    # -------------------------------------------------------------- encoding
+
+    @staticmethod
+    def skill_set(skills_found: Dict[str, List[str]]) -> set:
+        """All skills of an analysis result, lowercased, across categories."""
+        return {s.lower() for category_skills in skills_found.values() for s in category_skills}
+
+    def encode(self, skills: Iterable[str]) -> np.ndarray:
+        """0/1 vector over the role vocabulary (skills no role needs are dropped)."""
+        vector = np.zeros(len(self.skill_ids), dtype=np.float32)
+        ids = [self.skill_ids[s] for s in skills if s in self.skill_ids]
+        vector[ids] = 1.0
+        return vector
+
+    def encode_many(self, skill_sets: List[set]) -> np.ndarray:
+        """Resume x skill 0/1 matrix for a cohort."""
+        rows = []
+        cols = []
+        for row, skills in enumerate(skill_sets):
+            for skill in skills:
+                col = self.skill_ids.get(skill)
+                if col is not None:
+                    rows.append(row)
+                    cols.append(col)
+        matrix = np.zeros((len(skill_sets), len(self.skill_ids)), dtype=np.float32)
+        matrix[rows, cols] = 1.0
+        return matrix
+
+    # --------------------------------------------------------------- scoring
+
+    def percentages(self, encoded: np.ndarray) -> np.ndarray:
+        """
+        Match percentage of every role for one encoded resume (1-D) or a
+        cohort (2-D, one row per resume).
+        """
+        counts = (encoded @ self._matrix_t).astype(np.float64)
+        return np.where(self._nonempty, (counts / self._divisor) * 100, 0.0)
+
+    def _top_roles(self, percentages: np.ndarray, skills: set) -> List[Dict[str, Any]]:
+        qualifying = np.flatnonzero(percentages >= self.min_match_percentage)
+        if not len(qualifying):
+            return []
+        rounded = {int(i): round(float(percentages[i]), 1) for i in qualifying}
+        # nlargest is stable like sorted(reverse=True), so ties keep role order
+        best = heapq.nlargest(self.top_k, rounded, key=rounded.__getitem__)
+        return [
+            {
+                "role": self.roles[i],
+                "match_percentage": rounded[i],
+                "matched_skills": [s for s in self._role_skills[i] if s in skills],
+                "missing_skills": [s for s in self._role_skills[i] if s not in skills],
+            }
+            for i in best
+        ]
+
+    def match(self, skills_found: Dict[str, List[str]]) -> List[Dict[str, Any]]:
+        """Suggested roles for one resume's skills_found."""
+        skills = self.skill_set(skills_found)
+        return self._top_roles(self.percentages(self.encode(skills)), skills)
+
+    def match_cohort(self, skills_found_list: List[Dict[str, List[str]]]) -> List[List[Dict[str, Any]]]:
+        """Suggested roles for many resumes, scored in one matrix product."""
+        skill_sets = [self.skill_set(skills_found) for skills_found in skills_found_list]
+        if not skill_sets:
+            return []
+        percentages = self.percentages(self.encode_many(skill_sets))
+        return [self._top_roles(row, skills) for row, skills in zip(percentages, skill_sets)]
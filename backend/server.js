@@ -5,6 +5,7 @@ const bcrypt = require('bcryptjs');
 const busboy = require('busboy');
 const path = require('path');
 const { spawn } = require('child_process');
+const atsWire = require('./utils/atsWire');
 require('dotenv').config({ path: path.join(__dirname, '.env'), override: true });
 
 // Debug: log .env raw content so we can see why dotenv may not be injecting values
@@ -244,29 +245,92 @@ function isEmailStrict(email) {
 // --- ATS Scoring Endpoint ---
 // Uses Python-based ats_resume_analyzer for comprehensive analysis
 
-// Helper to run the Python resume analyzer on a given file path
-function runPythonAnalyzer(filePath) {
-  return new Promise((resolve, reject) => {
-    const scriptPath = path.join(__dirname, 'analyze_resume_wrapper.py');
+// Analyzer output: one JSON document (default), or with ATS_WIRE_FORMAT=ats-wire
+// a compact length-prefixed frame with interned skill IDs (see utils/atsWire.js)
+const ANALYZER_WIRE = process.env.ATS_WIRE_FORMAT === atsWire.WIRE_FORMAT;
 
-    // Auto-detect Python path: prefer .venv/Scripts/python.exe if it exists
-    const venvPythonPath = path.join(__dirname, '..', '.venv', 'Scripts', 'python.exe');
-    const pythonExe = fs.existsSync(venvPythonPath) ? venvPythonPath : 'python';
+function analyzerCommand() {
+  const scriptPath = path.join(__dirname, 'analyze_resume_wrapper.py');
+  // Auto-detect Python path: prefer .venv/Scripts/python.exe if it exists
+  const venvPythonPath = path.join(__dirname, '..', '.venv', 'Scripts', 'python.exe');
+  const pythonExe = fs.existsSync(venvPythonPath) ? venvPythonPath : 'python';
+  return { pythonExe, scriptPath };
+}
+
+// The analyzer's ats-wire schema, fetched once with --wire-schema
+let analyzerWireSchema = null;
+
+function getAnalyzerWireSchema() {
+  if (!analyzerWireSchema) {
+    analyzerWireSchema = new Promise((resolve, reject) => {
+      const { pythonExe, scriptPath } = analyzerCommand();
+      const proc = spawn(pythonExe, [scriptPath, '--wire-schema'], { cwd: __dirname, timeout: 30000 });
+      let stdout = '';
+      proc.stdout.on('data', (data) => { stdout += data.toString(); });
+      proc.on('error', reject);
+      proc.on('close', (code) => {
+        try {
+          if (code !== 0) throw new Error(`--wire-schema exited with code ${code}`);
+          resolve(atsWire.loadSchema(JSON.parse(stdout)));
+        } catch (err) {
+          reject(err);
+        }
+      });
+    });
+    // A failed fetch is retried on the next analysis
+    analyzerWireSchema.catch(() => { analyzerWireSchema = null; });
+  }
+  return analyzerWireSchema;
+}
+
+async function decodeAnalyzerFrame(frame) {
+  try {
+    return atsWire.unpackFrame(await getAnalyzerWireSchema(), frame);
+  } catch (err) {
+    if (!(err instanceof atsWire.WireFormatError)) throw err;
+    // The analyzer's skill tables may have changed since the schema was fetched
+    analyzerWireSchema = null;
+    return atsWire.unpackFrame(await getAnalyzerWireSchema(), frame);
+  }
+}
+
+// Helper to run the Python resume analyzer on a given file path. When pdfBuffer
+// is given, the PDF bytes are piped to the analyzer's stdin instead and filePath
+// is only the name recorded in the result metadata (no temp file is written).
+function runPythonAnalyzer(filePath, pdfBuffer = null) {
+  return new Promise((resolve, reject) => {
+    const { pythonExe, scriptPath } = analyzerCommand();
+
+    // Content-addressed result cache: re-analyzing an unchanged PDF is answered from here
+    const cachePath = path.join(__dirname, 'cache', 'ats_results.db');
+    // Resource limits: a pathological PDF stops with a structured "limit exceeded"
+    // result well before the spawn timeout below has to kill the process
+    const limitArgs = ['--stage-deadline', '20', '--max-cpu-seconds', '45', '--max-memory-mb', '1024'];
+    const wireArgs = ANALYZER_WIRE ? ['--wire-format', atsWire.WIRE_FORMAT] : [];
+    const args = pdfBuffer
+      ? [scriptPath, '-', '--name', filePath, '--cache', cachePath, ...limitArgs, ...wireArgs]
+      : [scriptPath, filePath, '--cache', cachePath, ...limitArgs, ...wireArgs];
 
     console.log(`[PythonAnalyzer] Using Python: ${pythonExe}`);
-    console.log(`[PythonAnalyzer] Running: "${pythonExe}" "${scriptPath}" "${filePath}"`);
+    console.log(`[PythonAnalyzer] Running: "${pythonExe}" ${args.map((a) => `"${a}"`).join(' ')}`);
 
-    const proc = spawn(pythonExe, [scriptPath, filePath], {
+    const proc = spawn(pythonExe, args, {
       cwd: __dirname,
       env: { ...process.env },
       timeout: 60000, // 60 second timeout
     });
 
-    let stdout = '';
+    if (pdfBuffer) {
+      // EPIPE here means the process died early; 'close' reports the failure
+      proc.stdin.on('error', (err) => console.error('[PythonAnalyzer] stdin error:', err.message));
+      proc.stdin.end(pdfBuffer);
+    }
+
+    const stdoutChunks = [];
     let stderr = '';
 
     proc.stdout.on('data', (data) => {
-      stdout += data.toString();
+      stdoutChunks.push(data);
     });
 
     proc.stderr.on('data', (data) => {
@@ -277,10 +341,19 @@ function runPythonAnalyzer(filePath) {
       console.log(`[PythonAnalyzer] Process exited with code ${code}`);
       if (stderr) console.log(`[PythonAnalyzer] stderr: ${stderr}`);
 
+      const stdoutBytes = Buffer.concat(stdoutChunks);
+      const stdout = stdoutBytes.toString();
       if (code !== 0 && !stdout.trim()) {
         return reject(new Error(`Python analyzer failed with code ${code}: ${stderr}`));
       }
 
+      if (ANALYZER_WIRE) {
+        return decodeAnalyzerFrame(stdoutBytes).then(resolve, (err) => {
+          console.error('[PythonAnalyzer] Failed to decode ats-wire output:', err.message);
+          reject(new Error('Failed to parse Python analyzer output'));
+        });
+      }
+
       try {
         const result = JSON.parse(stdout.trim());
         resolve(result);
@@ -309,8 +382,9 @@ app.post('/api/analyze-resume', async (req, res) => {
     const student = await Student.findOne({ email }).lean();
     if (!student) return res.status(404).json({ message: 'Student not found' });
 
-    // We need a PDF file to analyze. Check disk first, then fall back to base64
+    // We need a PDF to analyze. Check disk first, then fall back to base64
     let filePathToAnalyze = null;
+    let pdfBuffer = null;
 
     // Check if resume file exists on disk
     if (student.resumePath) {
@@ -320,33 +394,35 @@ app.post('/api/analyze-resume', async (req, res) => {
       }
     }
 
-    // Fallback: write base64 data to a temp file
+    // Fallback: pipe the stored base64 data to the analyzer's stdin
     if (!filePathToAnalyze && student.resumeData) {
-      const uploadsDir = path.join(__dirname, 'uploads');
-      if (!fs.existsSync(uploadsDir)) fs.mkdirSync(uploadsDir, { recursive: true });
-      const tmpName = `temp_analyze_${Date.now()}.pdf`;
-      const tmpPath = path.join(uploadsDir, tmpName);
-      fs.writeFileSync(tmpPath, Buffer.from(student.resumeData, 'base64'));
-      filePathToAnalyze = tmpPath;
+      pdfBuffer = Buffer.from(student.resumeData, 'base64');
+      filePathToAnalyze = student.resumeFileName || 'resume.pdf';
     }
 
     if (!filePathToAnalyze) {
       return res.status(404).json({ message: 'No resume found for this student. Please upload a resume first.' });
     }
 
-    console.log(`[AnalyzeResume] Analyzing file: ${filePathToAnalyze}`);
+    console.log(`[AnalyzeResume] Analyzing ${pdfBuffer ? 'stored resume' : 'file'}: ${filePathToAnalyze}`);
 
     // Run Python analyzer
-    const result = await runPythonAnalyzer(filePathToAnalyze);
+    const result = await runPythonAnalyzer(filePathToAnalyze, pdfBuffer);
 
     if (!result.success) {
-      return res.status(500).json({
+      // A rejected file or a resource limit means the document itself is
+      // unprocessable (e.g. a scanned, image-only PDF), not a server fault
+      const limited = result.error_type === 'LimitExceeded';
+      const rejected = result.error_type === 'PreflightError';
+      return res.status(limited || rejected ? 422 : 500).json({
         message: result.message || 'Analysis failed',
         error: result.error,
+        ...(limited && { limitExceeded: result.limit_exceeded }),
+        ...(rejected && { errorCode: result.error_code }),
       });
     }
 
-    console.log(`[AnalyzeResume] Analysis complete. ATS Score: ${result.ats_score}/100`);
+    console.log(`[AnalyzeResume] Analysis complete. ATS Score: ${result.ats_score}/100${result.partial ? ' (partial)' : ''}`);
 
     // Save results to student database
     try {
@@ -0,0 +1,611 @@
+#!/usr/bin/env python3
+"""
+Skill search index over analyzed resumes.
+
+Every SKILL_DB entry gets an integer ID and every indexed resume is stored as
+a compact bitset of the skills it contains, together with its ATS score. For
+querying, the index also keeps one bitmap per skill (and per score) across
+all resumes, so a boolean query such as
+
+    react AND node AND (mongodb OR postgresql)
+
+is a handful of big-integer AND/OR operations regardless of how many resumes
+are indexed, and "top-k by ATS score among matches" walks the score bitmaps
+from 100 down until k matches are found.
+
+The index persists to a single file laid out so it can be memory-mapped:
+opening it reads only the header, and rows, bitmaps and keys are decoded on
+first use.
+
+Usage:
+    python skill_index.py build results.jsonl -o cohort.skx
+    python skill_index.py query cohort.skx "react AND node AND (mongodb OR postgresql)" --top 20
+
+    from skill_index import SkillIndex
+    index = SkillIndex()
+    index.add("students/asha.pdf", analyze_resume("students/asha.pdf"))
+    index.save("cohort.skx")
+    for key, score in SkillIndex.open("cohort.skx").search("python AND NOT java", k=10):
+        ...
+"""
+
+import os
+import re
+import sys
+import json
+import mmap
+import struct
+from pathlib import Path
+from typing import Dict, List, Tuple, Any, Optional, Iterator
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, script_dir)
+
+from ats_resume_analyzer import SKILL_DB
+
+
+INDEX_MAGIC = b"ATSSKIX\0"
+INDEX_VERSION = 1
+MAX_SCORE = 100
+
+# magic, version, skill count, resume count, offsets of the sections below
+_HEADER = struct.Struct("<8sIII6Q")
+
+
+def skill_vocabulary() -> List[str]:
+    """Every SKILL_DB skill once, in SKILL_DB order; the position is the skill ID."""
+    seen = {}
+    for skills in SKILL_DB.values():
+        for skill in skills:
+            seen.setdefault(skill, None)
+    return list(seen)
+
+
+def _bit_positions(bitmap: int) -> List[int]:
+    """Indices of the set bits of a non-negative int, ascending."""
+    bits = format(bitmap, "b")[::-1]
+    positions = []
+    i = bits.find("1")
+    while i != -1:
+        positions.append(i)
+        i = bits.find("1", i + 1)
+    return positions
+
+
+# ============================================================================
+# QUERY PARSER
+# ============================================================================
+
+_QUERY_TOKEN = re.compile(r'\s*(?:(\()|(\))|"([^"]*)"|([^\s()"]+))')
+_OPERATORS = {"AND", "OR", "NOT"}
+
+
+def _tokenize_query(query: str) -> List[Tuple[str, str]]:
+    """
+    Split a query into ("(" | ")" | "AND" | "OR" | "NOT" | "SKILL", text)
+    tokens. Adjacent bare words form one multi-word skill ("machine learning").
+    """
+    tokens = []
+    pos = 0
+    query = query.strip()
+    previous_bare = False
+    while pos < len(query):
+        match = _QUERY_TOKEN.match(query, pos)
+        if not match:
+            raise ValueError(f"Invalid query near: {query[pos:]!r}")
+        pos = match.end()
+        open_paren, close_paren, quoted, word = match.groups()
+        bare = False
+        if open_paren:
+            tokens.append(("(", "("))
+        elif close_paren:
+            tokens.append((")", ")"))
+        elif quoted is not None:
+            tokens.append(("SKILL", quoted.strip().lower()))
+        elif word.upper() in _OPERATORS:
+            tokens.append((word.upper(), word))
+        elif previous_bare:
+            tokens[-1] = ("SKILL", f"{tokens[-1][1]} {word.lower()}")
+            bare = True
+        else:
+            tokens.append(("SKILL", word.lower()))
+            bare = True
+        previous_bare = bare
+    return tokens
+
+
+class _QueryParser:
+    """
+    Recursive-descent parser producing a nested tuple expression:
+    ("skill", id) | ("not", expr) | ("and", [exprs]) | ("or", [exprs]).
+    NOT binds tighter than AND, which binds tighter than OR.
+    """
+
+    def __init__(self, tokens: List[Tuple[str, str]], skill_ids: Dict[str, int]):
+        self.tokens = tokens
+        self.pos = 0
+        self.skill_ids = skill_ids
+
+    def parse(self):
+        if not self.tokens:
+            raise ValueError("Empty query")
+        expr = self._or()
+        if self.pos != len(self.tokens):
+            raise ValueError(f"Unexpected {self.tokens[self.pos][1]!r} in query")
+        return expr
+
+    def _peek(self) -> Optional[str]:
+        return self.tokens[self.pos][0] if self.pos < len(self.tokens) else None
+
+    def _or(self):
+        terms = [self._and()]
+        while self._peek() == "OR":
+            self.pos += 1
+            terms.append(self._and())
+        return terms[0] if len(terms) == 1 else ("or", terms)
+
+    def _and(self):
+        terms = [self._not()]
+        while self._peek() == "AND":
+            self.pos += 1
+            terms.append(self._not())
+        return terms[0] if len(terms) == 1 else ("and", terms)
+
+    def _not(self):
+        if self._peek() == "NOT":
+            self.pos += 1
+            return ("not", self._not())
+        return self._atom()
+
+    def _atom(self):
+        kind = self._peek()
+        if kind == "(":
+            self.pos += 1
+            expr = self._or()
+            if self._peek() != ")":
+                raise ValueError("Missing closing parenthesis in query")
+            self.pos += 1
+            return expr
+        if kind == "SKILL":
+            name = self.tokens[self.pos][1]
+            self.pos += 1
+            if name not in self.skill_ids:
+                raise ValueError(f"Unknown skill in query: {name!r}")
+            return ("skill", self.skill_ids[name])
+        raise ValueError("Query ended unexpectedly" if kind is None else f"Unexpected {kind!r} in query")
+
+
+# ============================================================================
+# INDEX
+# ============================================================================
+
+class SkillIndex:
+    """
+    Resumes as skill bitsets plus per-skill and per-score bitmaps across
+    resumes. Resumes are identified by a caller-chosen key (usually the file
+    path); adding an existing key replaces its entry.
+    """
+
+    def __init__(self, vocabulary: Optional[List[str]] = None):
+        self.vocabulary = list(vocabulary) if vocabulary is not None else skill_vocabulary()
+        self.skill_ids = {skill: i for i, skill in enumerate(self.vocabulary)}
+        self.row_bytes = (len(self.vocabulary) + 7) // 8
+
+        self._keys: List[str] = []
+        self._rows: List[int] = []
+        self._scores = bytearray()
+        self._postings: List[int] = [0] * len(self.vocabulary)
+        self._score_postings: List[int] = [0] * (MAX_SCORE + 1)
+        self._live = 0  # Bitmap of resumes that have not been replaced
+        self._ordinals: Optional[Dict[str, int]] = {}
+        # Ordinals added since the bitmaps were last updated, per bitmap. OR-ing
+        # one bit at a time into a growing big int copies it on every add, so
+        # additions are buffered and folded in bulk before the next read.
+        self._pending: Dict[Tuple[str, int], List[int]] = {}
+
+        # Set when the index is backed by a memory-mapped file; see open()
+        self._map = None
+        self._sections = None
+
+    # ---------------------------------------------------------- construction
+
+    def add(self, key: str, result: Dict[str, Any]) -> int:
+        """
+        Index one analysis result (the dict returned by analyze_resume or the
+        wrapper's run_analysis). Failed analyses are rejected.
+
+        Returns:
+            The resume's ordinal within the index
+        """
+        if not result.get("success", True):
+            raise ValueError(f"Cannot index a failed analysis: {key}")
+        skills = {s for found in result.get("skills_found", {}).values() for s in found}
+        return self.add_skills(key, skills, result.get("ats_score", 0))
+
+    def add_skills(self, key: str, skills, ats_score: int) -> int:
+        """Index a resume given directly as a set of skill names and a score."""
+        self._materialize()
+        ordinals = self._key_ordinals()
+
+        previous = ordinals.get(key)
+        if previous is not None:
+            self._remove(previous)
+
+        row = 0
+        for skill in skills:
+            skill_id = self.skill_ids.get(skill)
+            if skill_id is not None:  # Otherwise no longer in this index's vocabulary
+                row |= 1 << skill_id
+        ordinal = self._append(key, row, max(0, min(MAX_SCORE, int(ats_score))))
+        ordinals[key] = ordinal
+        return ordinal
+
+    def _append(self, key: str, row: int, score: int) -> int:
+        """Store a resume's row as the next ordinal; its bitmap bits are buffered."""
+        ordinal = len(self._keys)
+        pending = self._pending
+        for skill_id in _bit_positions(row):
+            pending.setdefault(("skill", skill_id), []).append(ordinal)
+        pending.setdefault(("score", score), []).append(ordinal)
+        pending.setdefault(("live", 0), []).append(ordinal)
+        self._keys.append(key)
+        self._rows.append(row)
+        self._scores.append(score)
+        return ordinal
+
+    def _flush(self) -> None:
+        """Fold buffered additions into the bitmaps."""
+        size = (len(self._keys) + 7) // 8
+        for (kind, i), ordinals in self._pending.items():
+            bits = bytearray(size)
+            for ordinal in ordinals:
+                bits[ordinal >> 3] |= 1 << (ordinal & 7)
+            bitmap = int.from_bytes(bits, "little")
+            if kind == "skill":
+                self._postings[i] |= bitmap
+            elif kind == "score":
+                self._score_postings[i] |= bitmap
+            else:
+                self._live |= bitmap
+        self._pending.clear()
+
+    def _remove(self, ordinal: int) -> None:
+        if self._pending:
+            self._flush()
+        mask = ~(1 << ordinal)
+        for skill_id in _bit_positions(self._rows[ordinal]):
+            self._postings[skill_id] &= mask
+        self._score_postings[self._scores[ordinal]] &= mask
+        self._live &= mask
+
+    def _key_ordinals(self) -> Dict[str, int]:
+        if self._ordinals is None:
+            self._ordinals = {}
+            for ordinal in _bit_positions(self._live_bitmap()):
+                self._ordinals[self._key(ordinal)] = ordinal
+        return self._ordinals
+
+    def __len__(self) -> int:
+        return bin(self._live_bitmap()).count("1")
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._key_ordinals()
+
+    # ---------------------------------------------------------------- access
+
+    def _live_bitmap(self) -> int:
+        if self._pending:
+            self._flush()
+        if self._map is not None and self._live is None:
+            self._live = self._read_bitmap("live", 0)
+        return self._live
+
+    def _posting(self, skill_id: int) -> int:
+        if self._pending:
+            self._flush()
+        if self._map is not None and self._postings[skill_id] is None:
+            self._postings[skill_id] = self._read_bitmap("postings", skill_id)
+        return self._postings[skill_id]
+
+    def _score_posting(self, score: int) -> int:
+        if self._pending:
+            self._flush()
+        if self._map is not None and self._score_postings[score] is None:
+            self._score_postings[score] = self._read_bitmap("score_postings", score)
+        return self._score_postings[score]
+
+    def _key(self, ordinal: int) -> str:
+        if self._map is not None and self._keys[ordinal] is None:
+            offsets = self._sections["key_offsets"]
+            start, end = struct.unpack_from("<QQ", self._map, offsets + 16 * ordinal)
+            blob = self._sections["key_blob"]
+            self._keys[ordinal] = bytes(self._map[blob + start:blob + end]).decode("utf-8")
+        return self._keys[ordinal]
+
+    def skills_of(self, key: str) -> List[str]:
+        """Skills indexed for one resume, in vocabulary order."""
+        ordinal = self._key_ordinals()[key]
+        if self._map is not None and self._rows[ordinal] is None:
+            start = self._sections["rows"] + ordinal * self.row_bytes
+            self._rows[ordinal] = int.from_bytes(self._map[start:start + self.row_bytes], "little")
+        return [self.vocabulary[i] for i in _bit_positions(self._rows[ordinal])]
+
+    # --------------------------------------------------------------- queries
+
+    def _evaluate(self, expr) -> int:
+        op = expr[0]
+        if op == "skill":
+            return self._posting(expr[1])
+        if op == "not":
+            return self._live_bitmap() & ~self._evaluate(expr[1])
+        terms = sorted(expr[1], key=lambda e: e[0] != "skill")  # Cheap terms first
+        bitmap = self._evaluate(terms[0])
+        if op == "and":
+            for term in terms[1:]:
+                if not bitmap:
+                    break
+                bitmap &= self._evaluate(term)
+        else:
+            for term in terms[1:]:
+                bitmap |= self._evaluate(term)
+        return bitmap
+
+    def match(self, query: str) -> int:
+        """Bitmap (over resume ordinals) of the resumes matching a boolean query."""
+        expr = _QueryParser(_tokenize_query(query), self.skill_ids).parse()
+        return self._evaluate(expr) & self._live_bitmap()
+
+    def count(self, query: str) -> int:
+        """Number of resumes matching a boolean query."""
+        return bin(self.match(query)).count("1")
+
+    def search(self, query: str, k: Optional[int] = None, min_score: int = 0) -> List[Tuple[str, int]]:
+        """
+        Resumes matching a boolean query, best ATS score first.
+
+        Args:
+            query: e.g. 'react AND node AND (mongodb OR postgresql)'. Operators
+                are AND, OR, NOT and parentheses; multi-word skills may be
+                written bare ("machine learning") or quoted.
+            k: Return at most k results (None for all)
+            min_score: Ignore resumes scoring below this
+
+        Returns:
+            (key, ats_score) pairs; ties keep indexing order
+        """
+        matches = self.match(query)
+        results = []
+        for score in range(MAX_SCORE, max(0, min_score) - 1, -1):
+            if not matches:
+                break
+            bucket = matches & self._score_posting(score)
+            if not bucket:
+                continue
+            matches &= ~bucket
+            for ordinal in _bit_positions(bucket):
+                results.append((self._key(ordinal), score))
+                if k is not None and len(results) >= k:
+                    return results
+        return results
+
+    def keys(self) -> Iterator[str]:
+        for ordinal in _bit_positions(self._live_bitmap()):
+            yield self._key(ordinal)
+
+    # ----------------------------------------------------------- persistence
+
+    def _materialize(self) -> None:
+        """Decode everything from the mapped file so the index can be modified."""
+        if self._map is None:
+            return
+        self._live_bitmap()
+        for i in range(len(self.vocabulary)):
+            self._posting(i)
+        for score in range(MAX_SCORE + 1):
+            self._score_posting(score)
+        rows = self._sections["rows"]
+        for ordinal in range(len(self._keys)):
+            self._key(ordinal)
+            if self._rows[ordinal] is None:
+                start = rows + ordinal * self.row_bytes
+                self._rows[ordinal] = int.from_bytes(self._map[start:start + self.row_bytes], "little")
+        self._scores = bytearray(self._scores)
+        self.close()
+
+    def _read_bitmap(self, section: str, i: int) -> int:
+        size = self._sections["bitmap_bytes"]
+        start = self._sections[section] + i * size
+        return int.from_bytes(self._map[start:start + size], "little")
+
+    def _compacted(self) -> "SkillIndex":
+        """A copy holding only the live resumes, renumbered in indexing order."""
+        compact = SkillIndex(self.vocabulary)
+        for ordinal in _bit_positions(self._live_bitmap()):
+            compact._append(self._keys[ordinal], self._rows[ordinal], self._scores[ordinal])
+        compact._ordinals = None
+        compact._flush()
+        return compact
+
+    def save(self, path: str) -> None:
+        """
+        Write the live resumes atomically; rows of replaced resumes are left
+        out, so re-adding keys does not grow the file. Layout (all integers
+        little-endian):
+
+            header | vocabulary JSON | rows (n x row_bytes) | scores (n bytes)
+            | live bitmap | skill bitmaps | score bitmaps (101) | key offsets | key blob
+
+        Every bitmap is ceil(n / 8) bytes, so any one can be read by offset.
+        """
+        self._materialize()
+        self._flush()
+        if len(self) < len(self._keys):
+            self._compacted()._write(path)
+        else:
+            self._write(path)
+
+    def _write(self, path: str) -> None:
+        n = len(self._keys)
+        bitmap_bytes = (n + 7) // 8
+        vocabulary = json.dumps(self.vocabulary).encode("utf-8")
+        keys = [key.encode("utf-8") for key in self._keys]
+
+        offsets = {}
+        position = _HEADER.size + len(vocabulary)
+        for name, size in (
+            ("rows", n * self.row_bytes),
+            ("scores", n),
+            ("live", bitmap_bytes),
+            ("postings", len(self.vocabulary) * bitmap_bytes),
+            ("score_postings", (MAX_SCORE + 1) * bitmap_bytes),
+            ("key_offsets", 16 * n),
+        ):
+            offsets[name] = position
+            position += size
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(path.suffix + f".{os.getpid()}.tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(_HEADER.pack(
+                INDEX_MAGIC, INDEX_VERSION, len(self.vocabulary), n,
+                len(vocabulary), offsets["rows"], offsets["live"], offsets["postings"],
+                offsets["score_postings"], offsets["key_offsets"]
+            ))
+            f.write(vocabulary)
+            for row in self._rows:
+                f.write(row.to_bytes(self.row_bytes, "little"))
+            f.write(bytes(self._scores))
+            f.write(self._live.to_bytes(bitmap_bytes, "little"))
+            for bitmap in self._postings:
+                f.write(bitmap.to_bytes(bitmap_bytes, "little"))
+            for bitmap in self._score_postings:
+                f.write(bitmap.to_bytes(bitmap_bytes, "little"))
+            start = 0
+            for key in keys:
+                f.write(struct.pack("<QQ", start, start + len(key)))
+                start += len(key)
+            for key in keys:
+                f.write(key)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def open(cls, path: str) -> "SkillIndex":
+        """
+        Memory-map a saved index. Only the header and vocabulary are read
+        here; bitmaps, rows and keys are decoded as queries touch them.
+        """
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            (magic, version, num_skills, n, vocab_len, rows, live,
+             postings, score_postings, key_offsets) = _HEADER.unpack_from(mapped, 0)
+            if magic != INDEX_MAGIC:
+                raise ValueError(f"Not a skill index: {path}")
+            if version != INDEX_VERSION:
+                raise ValueError(f"Unsupported skill index version {version}: {path}")
+            vocabulary = json.loads(mapped[_HEADER.size:_HEADER.size + vocab_len].decode("utf-8"))
+        except Exception:
+            mapped.close()
+            raise
+        if len(vocabulary) != num_skills:
+            mapped.close()
+            raise ValueError(f"Corrupt skill index header: {path}")
+
+        index = cls(vocabulary)
+        index._map = mapped
+        index._sections = {
+            "rows": rows,
+            "live": live,
+            "postings": postings,
+            "score_postings": score_postings,
+            "key_offsets": key_offsets,
+            "key_blob": key_offsets + 16 * n,
+            "bitmap_bytes": (n + 7) // 8,
+        }
+        index._keys = [None] * n
+        index._rows = [None] * n
+        index._scores = memoryview(mapped)[rows + n * index.row_bytes:rows + n * index.row_bytes + n]
+        index._postings = [None] * num_skills
+        index._score_postings = [None] * (MAX_SCORE + 1)
+        index._live = None
+        index._ordinals = None
+        return index
+
+    def close(self) -> None:
+        """Release the memory map (materialized or in-memory indexes are unaffected)."""
+        if self._map is not None:
+            if isinstance(self._scores, memoryview):
+                view = self._scores
+                self._scores = bytearray(view)
+                view.release()
+            self._map.close()
+            self._map = None
+            self._sections = None
+
+
+def build_index(jsonl_paths: List[str], index: Optional[SkillIndex] = None) -> SkillIndex:
+    """
+    Index the successful records of batch-mode JSON Lines output
+    (ats_resume_analyzer.py --batch), keyed by file path.
+    """
+    index = index if index is not None else SkillIndex()
+    for jsonl_path in jsonl_paths:
+        with open(jsonl_path, encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                if record.get("success"):
+                    index.add(record["file_path"], record)
+    return index
+
+
+# ============================================================================
+# COMMAND LINE INTERFACE
+# ============================================================================
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Build and query the skill search index")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    build = commands.add_parser("build", help="Index batch-mode JSON Lines results")
+    build.add_argument("results", nargs="+", help="JSON Lines files from --batch")
+    build.add_argument("--output", "-o", required=True, help="Index file to write")
+    build.add_argument("--append", action="store_true", help="Add to an existing index instead of replacing it")
+
+    query = commands.add_parser("query", help="Run a boolean skill query")
+    query.add_argument("index", help="Index file")
+    query.add_argument("query", help='e.g. "react AND node AND (mongodb OR postgresql)"')
+    query.add_argument("--top", "-k", type=int, default=None, help="Only the k best ATS scores")
+    query.add_argument("--min-score", type=int, default=0, help="Ignore resumes scoring below this")
+    query.add_argument("--count", action="store_true", help="Only print the number of matches")
+
+    args = parser.parse_args()
+
+    try:
+        if args.command == "build":
+            existing = SkillIndex.open(args.output) if args.append and Path(args.output).exists() else None
+            index = build_index(args.results, existing)
+            index.save(args.output)
+            print(f"✓ Indexed {len(index)} resumes into {args.output}", file=sys.stderr)
+            return
+
+        index = SkillIndex.open(args.index)
+        if args.count:
+            print(json.dumps({"query": args.query, "count": index.count(args.query)}))
+        else:
+            matches = index.search(args.query, k=args.top, min_score=args.min_score)
+            print(json.dumps({
+                "query": args.query,
+                "results": [{"file_path": key, "ats_score": score} for key, score in matches]
+            }, ensure_ascii=False))
+    except (OSError, ValueError) as e:
+        print(f"✗ {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,16 @@
+import os
+import sys
+
+import pytest
+
+# The backend modules are scripts run from this directory, not a package
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, BACKEND_DIR)
+sys.path.insert(0, os.path.join(BACKEND_DIR, 'benchmarks'))
+
+
+@pytest.fixture(scope="session")
+def corpus(tmp_path_factory):
+    """A small synthetic corpus (see benchmarks/resume_corpus.py) with extraction sidecars."""
+    from resume_corpus import generate_corpus
+    return generate_corpus(str(tmp_path_factory.mktemp("corpus")), count=12, seed=99)
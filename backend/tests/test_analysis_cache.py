@@ -0,0 +1,102 @@
+import os
+import time
+
+import pytest
+
+from analysis_cache import AnalysisCache, open_cache
+from ats_resume_analyzer import (
+    cache_lookup,
+    document_hash,
+    extraction_fingerprint,
+    DEFAULT_MAX_PAGES,
+    DEFAULT_WORD_BUDGET,
+)
+
+PDF = b"%PDF-1.4 resume bytes"
+
+
+@pytest.fixture(params=["cache.db", "cache_dir"])
+def cache(request, tmp_path):
+    cache = open_cache(str(tmp_path / request.param), max_bytes=1024 * 1024)
+    yield cache
+    cache.close()
+
+
+def test_key_depends_on_every_component():
+    base = dict(data=PDF, version="1.0.0", rules_fingerprint="rules", kind="analyze_resume", options="opts")
+    key = AnalysisCache.make_key(**base)
+    assert key == AnalysisCache.make_key(**base)
+    for field, other in [("data", PDF + b" "), ("version", "1.0.1"), ("rules_fingerprint", "other"),
+                         ("kind", "wrapper"), ("options", "")]:
+        assert AnalysisCache.make_key(**{**base, field: other}) != key
+
+
+def test_content_key_matches_make_key():
+    digest = document_hash("unused.pdf", PDF)
+    assert AnalysisCache.content_key(digest, "1", "rules", kind="k", options="o") == \
+        AnalysisCache.make_key(PDF, "1", "rules", kind="k", options="o")
+
+
+def test_round_trip(cache):
+    key = AnalysisCache.make_key(PDF, "1", "rules")
+    assert cache.get(key) is None
+    cache.put(key, {"success": True, "ats_score": 71, "skills": ["python"]})
+    assert cache.get(key) == {"success": True, "ats_score": 71, "skills": ["python"]}
+
+
+@pytest.mark.parametrize("location", ["cache.db", "cache_dir"])
+def test_evicts_least_recently_used(tmp_path, location):
+    cache = open_cache(str(tmp_path / location), max_bytes=250)
+    value = {"text": "x" * 80}
+    for key in ("a", "b"):
+        cache.put(key, value)
+        time.sleep(0.01)
+    cache.get("a")
+    time.sleep(0.01)
+    cache.put("c", value)
+    assert cache.get("b") is None
+    assert cache.get("a") == value and cache.get("c") == value
+    cache.close()
+
+
+def test_extraction_fingerprint_fills_defaults():
+    assert extraction_fingerprint(None) == extraction_fingerprint({})
+    assert extraction_fingerprint({}) == extraction_fingerprint(
+        {"max_pages": DEFAULT_MAX_PAGES, "word_budget": DEFAULT_WORD_BUDGET, "preflight": True}
+    )
+    # Options that only change how text is extracted share results
+    assert extraction_fingerprint({"workers": 4, "deadline_s": 20}) == extraction_fingerprint({})
+
+
+@pytest.mark.parametrize("options", [
+    {"max_pages": None},
+    {"max_pages": 2},
+    {"word_budget": 500},
+    {"max_words_per_page": 5000},
+    {"preflight": False},
+])
+def test_extraction_options_change_the_key(options):
+    assert extraction_fingerprint(options) != extraction_fingerprint({})
+
+
+def test_cache_lookup_keeps_extraction_limits_apart(cache, tmp_path):
+    path = tmp_path / "resume.pdf"
+    path.write_bytes(PDF)
+
+    key, result = cache_lookup(cache, str(path), extract_options={"max_pages": 1})
+    assert result is None
+    cache.put(key, {"success": True, "partial": True, "metadata": {}})
+
+    other_key, result = cache_lookup(cache, str(path), extract_options={"max_pages": None})
+    assert other_key != key and result is None
+
+    copy = tmp_path / "copy.pdf"
+    copy.write_bytes(PDF)
+    same_key, result = cache_lookup(cache, str(copy), extract_options={"max_pages": 1})
+    assert same_key == key
+    assert result["partial"] is True
+    assert result["metadata"] == {"file_path": str(copy), "file_name": "copy.pdf", "cache_hit": True}
+
+
+def test_cache_lookup_without_cache(tmp_path):
+    assert cache_lookup(None, os.path.join(str(tmp_path), "missing.pdf")) == (None, None)
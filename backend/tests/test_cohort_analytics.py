@@ -0,0 +1,50 @@
+import pytest
+
+pytest.importorskip("numpy")
+
+from cohort_analytics import CohortAnalytics
+
+
+def result(score, skills, **extra):
+    return {"ats_score": score, "skills_found": {"languages": skills}, **extra}
+
+
+def test_unkeyed_records_never_replace_each_other():
+    cohort = CohortAnalytics(capacity=2)
+    cohort.extend([result(50, ["python"]), result(60, ["java"]), result(70, ["sql"])])
+    cohort.extend([result(80, ["go"]), result(90, ["rust"])])
+    assert len(cohort) == 5
+    assert cohort.keys == ["row-0", "row-1", "row-2", "row-3", "row-4"]
+    assert cohort.score_distribution()["count"] == 5
+
+
+def test_keyed_records_replace_their_row():
+    cohort = CohortAnalytics()
+    cohort.extend([result(50, ["python"], email="a@x.edu"), result(60, ["java"], email="b@x.edu")],
+                  group_field="department")
+    cohort.append("a@x.edu", result(75, ["python", "sql"]), group="CSE")
+    cohort.extend([result(40, ["java"])])
+    assert cohort.keys == ["a@x.edu", "b@x.edu", "row-2"]
+    assert cohort.scores[cohort.rows["a@x.edu"]] == 75
+    frequency = {entry["skill"]: entry["students"] for entry in cohort.skill_frequency()}
+    assert frequency == {"java": 2, "python": 1, "sql": 1}
+    assert cohort.group_scores() == {"CSE": {"students": 1, "average_score": 75.0}}
+
+
+def test_stored_documents_are_accepted():
+    cohort = CohortAnalytics()
+    cohort.append("s1", {"atsAnalysis": {"score": 64, "skillsFound": {"tools": ["Docker"]}}})
+    assert cohort.skill_frequency() == [{"skill": "docker", "students": 1, "percentage": 100.0}]
+
+
+def test_save_and_load(tmp_path):
+    cohort = CohortAnalytics()
+    cohort.extend([result(50, ["python"]), result(70, ["sql"], email="c@x.edu")])
+    path = str(tmp_path / "cohort.npz")
+    cohort.save(path)
+
+    loaded = CohortAnalytics.load(path)
+    assert loaded.keys == cohort.keys
+    assert loaded.summary() == cohort.summary()
+    loaded.extend([result(90, ["go"])])
+    assert loaded.keys[-1] == "row-2"
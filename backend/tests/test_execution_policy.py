@@ -0,0 +1,30 @@
+import argparse
+
+from ats_resume_analyzer import (
+    DEFAULT_POLICY,
+    SUGGESTED_MAX_WORDS_PER_PAGE,
+    ExecutionPolicy,
+    add_policy_arguments,
+    policy_from_args,
+)
+
+
+def parse(*argv):
+    parser = argparse.ArgumentParser()
+    add_policy_arguments(parser)
+    return policy_from_args(parser.parse_args(list(argv)))
+
+
+def test_per_page_word_cap_is_opt_in():
+    assert DEFAULT_POLICY.max_words_per_page is None
+    assert ExecutionPolicy().extract_options()["max_words_per_page"] is None
+    assert parse().max_words_per_page is None
+
+
+def test_cli_limits():
+    policy = parse("--max-words-per-page", str(SUGGESTED_MAX_WORDS_PER_PAGE), "--stage-deadline", "2.5")
+    assert policy.extract_options({"max_pages": 3}) == {
+        "max_pages": 3, "max_words_per_page": SUGGESTED_MAX_WORDS_PER_PAGE, "deadline_s": 2.5
+    }
+    assert policy.checks_stages
+    assert not parse().checks_stages
@@ -0,0 +1,14 @@
+from check_import_time import DEFAULT_BUDGET_MS, LAZY_MODULES, importtime_report
+
+
+def test_import_loads_no_lazy_module():
+    _, imported = importtime_report()
+    eager = sorted(name for name in imported
+                   if any(name == lazy or name.startswith(lazy + ".") for lazy in LAZY_MODULES))
+    assert eager == []
+
+
+def test_import_within_budget():
+    importtime_report()  # Writes bytecode caches
+    best_ms = min(importtime_report()[0] for _ in range(5)) / 1000
+    assert best_ms <= DEFAULT_BUDGET_MS
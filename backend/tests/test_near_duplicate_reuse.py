@@ -0,0 +1,81 @@
+import json
+
+import pytest
+
+import analyze_resume_wrapper as wrapper
+from analysis_cache import open_cache
+from ats_resume_analyzer import analyze_resume
+from near_duplicates import NearDuplicateIndex
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = open_cache(str(tmp_path / "cache.db"))
+    yield cache
+    cache.close()
+
+
+@pytest.fixture
+def index():
+    return NearDuplicateIndex(threshold=0.5)
+
+
+@pytest.fixture
+def sidecar(tmp_path, corpus):
+    """Writes a copy of the first corpus sidecar with its text edited, and returns its path."""
+    with open(corpus[0]["sidecar"], encoding="utf-8") as f:
+        original = json.load(f)
+
+    def write(name, edit=lambda text: text):
+        artifact = dict(original, source_name=name, text=edit(original["text"]))
+        path = tmp_path / f"{name}.extract.json"
+        path.write_text(json.dumps(artifact), encoding="utf-8")
+        return str(path)
+
+    return write
+
+
+def without_metadata(result):
+    return {field: value for field, value in result.items() if field != "metadata"}
+
+
+def other_student(text):
+    # Same template: another name and contact line, one more skill
+    lines = text.split("\n")
+    lines[0] = "ZARA QUINN"
+    lines[1] = "zara.quinn@example.org | +44 7700900123"
+    skills = lines.index("TECHNICAL SKILLS") + 1
+    lines[skills] += ", docker"
+    return "\n".join(lines)
+
+
+@pytest.mark.parametrize("run", [wrapper.run_analysis, analyze_resume])
+def test_near_duplicate_is_scored_from_its_own_text(run, cache, index, sidecar):
+    first = run(sidecar("first"), cache=cache, near_duplicates=index, near_duplicate_threshold=0.5)
+    copy_path = sidecar("copy", other_student)
+    copy = run(copy_path, cache=cache, near_duplicates=index, near_duplicate_threshold=0.5)
+
+    assert without_metadata(copy) == without_metadata(run(copy_path))
+    assert without_metadata(copy) != without_metadata(first)
+    assert "docker" in json.dumps(copy["skills_found"])
+    assert not copy["metadata"].get("cache_hit")
+    assert copy["metadata"]["near_duplicate_of"]["similarity"] >= 0.5
+    assert "near_duplicate_of" not in first["metadata"]
+
+
+def test_identical_text_reuses_the_result(cache, index, sidecar):
+    first = wrapper.run_analysis(sidecar("first"), cache=cache, near_duplicates=index)
+    copy_path = sidecar("copy")
+    copy = wrapper.run_analysis(copy_path, cache=cache, near_duplicates=index)
+
+    assert copy["metadata"]["cache_hit"] is True
+    assert copy["metadata"]["file_path"] == copy_path
+    assert copy["metadata"]["near_duplicate_of"]["similarity"] == 1.0
+    assert without_metadata(copy) == without_metadata(first)
+
+
+def test_near_duplicates_are_reported_without_a_cache(index, sidecar):
+    wrapper.run_analysis(sidecar("first"), near_duplicates=index, near_duplicate_threshold=0.5)
+    copy = wrapper.run_analysis(sidecar("copy", other_student), near_duplicates=index, near_duplicate_threshold=0.5)
+    assert copy["metadata"]["near_duplicate_of"]["document_sha256"] in index
+    assert len(index) == 2
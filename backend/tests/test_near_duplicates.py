@@ -0,0 +1,170 @@
+import json
+import struct
+
+import numpy as np
+import pytest
+
+import near_duplicates
+from ats_resume_analyzer import NEAR_DUPLICATE_THRESHOLD, document_hash
+from near_duplicates import NearDuplicateIndex, normalized_words, build_index, INDEX_MAGIC
+
+# Renamed copies below are about 0.9 similar, under the reporting threshold
+SIMILAR = 0.8
+
+
+@pytest.fixture(scope="module")
+def texts(corpus):
+    found = {}
+    for entry in corpus:
+        with open(entry["sidecar"], encoding="utf-8") as f:
+            found[entry["pdf"]] = json.load(f)["text"]
+    return found
+
+
+def renamed(text):
+    # A template copy: another name and contact line
+    lines = text.split("\n")
+    lines[0] = "ZARA QUINN"
+    lines[1] = "zara.quinn@example.org | +44 7700900123 | linkedin.com/in/zq"
+    return "\n".join(lines)
+
+
+def build(texts, **params):
+    index = NearDuplicateIndex(**params)
+    for key, text in texts.items():
+        index.add(key, text)
+    return index
+
+
+def test_normalized_words():
+    text = "Asha Rao | asha@example.com | +91-9827883760 | https://github.com/asha-rao/site"
+    assert normalized_words(text) == ["asha", "rao", "email", "phone", "github"]
+
+
+def test_query_finds_template_copies(texts):
+    index = build(texts)
+    for key, text in texts.items():
+        matches = index.query(renamed(text), threshold=SIMILAR)
+        assert matches[0][0] == key
+        assert matches[0][1] >= SIMILAR
+        assert all(match == key for match, _ in matches)
+        assert all(similarity >= NEAR_DUPLICATE_THRESHOLD for _, similarity in index.query(renamed(text)))
+
+
+def test_query_agrees_with_signature_similarity(texts):
+    index = build(texts, threshold=0.3)
+    for key in texts:
+        signature = index.signature_of(key)
+        for match, similarity in index.query(signature, threshold=0.3):
+            assert similarity == index.similarity(signature, index.signature_of(match))
+
+
+def test_exclude_k_and_replacement(texts):
+    index = build(texts)
+    key, text = next(iter(texts.items()))
+    index.add("copy", renamed(text))
+    assert [match for match, _ in index.query(text, threshold=SIMILAR, exclude=key)] == ["copy"]
+    assert len(index.query(text, threshold=SIMILAR, k=1)) == 1
+
+    index.add("copy", "an unrelated line of words that shares nothing with any resume here")
+    assert [match for match, _ in index.query(text)] == [key]
+    assert len(index) == len(texts) + 1
+
+
+def test_unsorted_entries_are_found(texts, monkeypatch):
+    # Rebuild the sorted band tables after every few adds
+    monkeypatch.setattr(near_duplicates, "_UNSORTED_LIMIT", 2)
+    index = NearDuplicateIndex()
+    for key, text in texts.items():
+        index.add(key, text)
+        assert index.query(renamed(text), threshold=SIMILAR)[0][0] == key
+
+
+def test_pairs_and_groups(texts):
+    index = build(texts)
+    key, text = next(iter(texts.items()))
+    index.add("copy", renamed(text))
+    assert [(a, b) for a, b, _ in index.pairs(SIMILAR)] == [tuple(sorted([key, "copy"]))]
+    assert sorted(index.groups(SIMILAR)[0]) == sorted([key, "copy"])
+    assert index.pairs() == []
+
+
+def test_empty_text_has_no_signature():
+    index = NearDuplicateIndex()
+    assert index.add("empty", " - , ") is None
+    assert len(index) == 0 and index.query("") == []
+
+
+def test_persistence(texts, tmp_path):
+    path = str(tmp_path / "cohort.ndx")
+    index = NearDuplicateIndex.open(path, create=True, threshold=0.7)
+    for key, text in texts.items():
+        index.add(key, text, path=f"students/{key}")
+
+    reopened = NearDuplicateIndex.open(path)
+    assert (reopened.threshold, reopened.bands, reopened.rows) == (index.threshold, index.bands, index.rows)
+    assert sorted(reopened.keys()) == sorted(texts)
+    for key, text in texts.items():
+        assert np.array_equal(reopened.signature_of(key), index.signature_of(key))
+        assert reopened.path_of(key) == f"students/{key}"
+        assert reopened.query(renamed(text), threshold=SIMILAR) == index.query(renamed(text), threshold=SIMILAR)
+
+
+def test_refresh_picks_up_other_writers(texts, tmp_path):
+    path = str(tmp_path / "cohort.ndx")
+    reader = NearDuplicateIndex.open(path, create=True)
+    writer = NearDuplicateIndex.open(path)
+    key, text = next(iter(texts.items()))
+    writer.add(key, text, path="students/a.pdf")
+    assert reader.query(renamed(text), threshold=SIMILAR)[0][0] == key
+    assert reader.path_of(key) == "students/a.pdf"
+
+
+def test_save_compacts_replaced_entries(texts, tmp_path):
+    path = tmp_path / "cohort.ndx"
+    index = NearDuplicateIndex.open(str(path), create=True)
+    key, text = next(iter(texts.items()))
+    index.add(key, "an older version of the resume text")
+    index.add(key, text)
+    appended = path.stat().st_size
+
+    index.save(str(path))
+    assert path.stat().st_size < appended
+    reopened = NearDuplicateIndex.open(str(path))
+    assert list(reopened.keys()) == [key]
+    assert np.array_equal(reopened.signature_of(key), index.signature_of(key))
+
+
+def test_open_rejects_other_files(tmp_path):
+    header = NearDuplicateIndex()._header()
+    cases = {
+        "foreign.ndx": b"NOTANDX\0" + header[len(INDEX_MAGIC):],
+        "future.ndx": INDEX_MAGIC + struct.pack("<I", 99) + header[len(INDEX_MAGIC) + 4:],
+        "truncated.ndx": header[:10],
+    }
+    for name, data in cases.items():
+        path = tmp_path / name
+        path.write_bytes(data)
+        with pytest.raises(ValueError):
+            NearDuplicateIndex.open(str(path))
+
+
+def test_re_adding_a_stored_document_does_not_grow_the_file(texts, tmp_path):
+    path = tmp_path / "cohort.ndx"
+    index = NearDuplicateIndex.open(str(path), create=True)
+    key, text = next(iter(texts.items()))
+    index.add(key, text, path="first.pdf")
+    size = path.stat().st_size
+    for _ in range(3):
+        index.add(key, text, path="again.pdf")
+        NearDuplicateIndex.open(str(path)).add(key, text)
+    assert path.stat().st_size == size
+    assert index.path_of(key) == "first.pdf"
+
+
+def test_build_keys_by_document_hash(corpus):
+    paths = [entry["sidecar"] for entry in corpus[:4]]
+    index, failures = build_index(paths + [paths[0] + ".missing"], workers=2)
+    assert [path for path, _ in failures] == [paths[0] + ".missing"]
+    assert sorted(index.keys()) == sorted(document_hash(path) for path in paths)
+    assert {index.path_of(document_hash(path)) for path in paths} == set(paths)
@@ -0,0 +1,50 @@
+import pytest
+
+from ats_resume_analyzer import (
+    EMAIL_PATTERN,
+    PHONE_PATTERN,
+    QUANTIFIED_PATTERN,
+    DATE_PATTERN,
+    SECTION_HEADER_PATTERN,
+    heading_words,
+)
+
+
+def findall(pattern, text):
+    return [m.group(0) for m in pattern.finditer(text)]
+
+
+def test_email():
+    assert findall(EMAIL_PATTERN, "mail asha.rao+jobs@mail.example.co.in today") == ["asha.rao+jobs@mail.example.co.in"]
+    assert findall(EMAIL_PATTERN, "asha@localhost, @example.com, asha@.") == []
+    # Local parts are capped at 64 characters, so only the tail of a longer one matches
+    assert findall(EMAIL_PATTERN, "a" * 70 + "@example.com") == []
+
+
+@pytest.mark.parametrize("text", ["555-123-4567", "555.123.4567", "555 123 4567", "5551234567",
+                                  "+91 9827883760", "+919827883760", "+1-5551234567"])
+def test_phone(text):
+    assert findall(PHONE_PATTERN, f"Phone: {text} |") == [text]
+
+
+@pytest.mark.parametrize("text", ["555-123-456", "55512345678", "2019 - 2021"])
+def test_not_a_phone(text):
+    assert findall(PHONE_PATTERN, text) == []
+
+
+def test_quantified():
+    text = "Cut latency by 40%, 3x throughput, 10+ services, 5 million users, 12 Projects, 7 userspace"
+    assert findall(QUANTIFIED_PATTERN, text) == ["40%", "3x", "10+", "5 million", "12 Projects"]
+
+
+def test_dates():
+    assert findall(DATE_PATTERN, "Oct 2019 - Present") == ["Oct 2019", "Present"]
+    assert findall(DATE_PATTERN, "September, 2021") == ["September, 2021"]
+    assert findall(DATE_PATTERN, "2017 - 2021") == ["2017 - 2021"]
+
+
+def test_heading_words():
+    assert heading_words("TECHNICAL SKILLS") == {"technical": True, "skills": True}
+    assert heading_words("Skillset and certifications") == {"skills": False, "certifications": True}
+    assert heading_words("Work History") == {"work history": True}
+    assert heading_words("Python developer") == {}
@@ -0,0 +1,33 @@
+import re
+import time
+
+import pytest
+
+from ats_resume_analyzer import EMAIL_PATTERN
+from bench_regex_adversarial import INPUTS, PATTERNS
+
+
+# A quadratic pattern needs seconds on these; a linear one about a millisecond
+@pytest.mark.parametrize("input_name", sorted(INPUTS))
+@pytest.mark.parametrize("pattern_name", sorted(PATTERNS))
+def test_adversarial_input_is_linear(pattern_name, input_name):
+    text = INPUTS[input_name](40000)
+    pattern = PATTERNS[pattern_name]
+    start = time.perf_counter()
+    for _ in pattern.finditer(text):
+        pass
+    assert time.perf_counter() - start < 0.25
+
+
+
+# The only matches the linear-time email pattern changed. has_email feeds the
+# ATS score, which is why ANALYSIS_VERSION went to 1.0.1 with it
+@pytest.mark.parametrize("text", [
+    "asha@example.c|m",               # '|' was inside the old TLD class
+    "a" * 65 + "@example.com",        # local part over 64 characters
+    "asha@example." + "c" * 64,       # TLD over 63 characters
+])
+def test_email_matches_changed_by_the_length_caps(text):
+    old = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+    assert old.search(text)
+    assert not EMAIL_PATTERN.search(text)
@@ -0,0 +1,47 @@
+import random
+
+import pytest
+
+import analyze_resume_wrapper as wrapper
+from analyze_resume_wrapper import ROLE_SKILL_MAP, suggest_roles, suggest_roles_cohort, suggest_roles_python
+
+ROLE_SKILLS = sorted({skill for skills in ROLE_SKILL_MAP.values() for skill in skills})
+
+
+def random_skills_found(rng):
+    skills = rng.sample(ROLE_SKILLS + ["cobol", "fortran"], rng.randint(0, 25))
+    return {"languages": [s.upper() if rng.random() < 0.2 else s for s in skills[::2]], "tools": skills[1::2]}
+
+
+@pytest.fixture
+def without_numpy(monkeypatch):
+    monkeypatch.setattr(wrapper, "_role_matcher", False)
+
+
+def test_suggestions():
+    roles = suggest_roles({"languages": ["python", "sql"], "data": ["pandas", "excel", "tableau"]})
+    assert roles[0]["role"] == "Data Analyst"
+    assert roles[0]["match_percentage"] == 62.5
+    assert roles[0]["matched_skills"] == ["excel", "pandas", "python", "sql", "tableau"]
+    assert all(role["match_percentage"] >= 30 for role in roles)
+    assert [r["match_percentage"] for r in roles] == sorted((r["match_percentage"] for r in roles), reverse=True)
+
+
+def test_no_skills():
+    assert suggest_roles({}) == []
+
+
+def test_matrix_engine_matches_python_path():
+    pytest.importorskip("numpy")
+    rng = random.Random(5)
+    cohort = [random_skills_found(rng) for _ in range(500)]
+    expected = [suggest_roles_python(skills_found) for skills_found in cohort]
+    assert [suggest_roles(skills_found) for skills_found in cohort] == expected
+    assert suggest_roles_cohort(cohort) == expected
+
+
+def test_works_without_numpy(without_numpy):
+    rng = random.Random(6)
+    cohort = [random_skills_found(rng) for _ in range(50)]
+    assert wrapper.get_role_matcher() is None
+    assert suggest_roles_cohort(cohort) == [suggest_roles_python(skills_found) for skills_found in cohort]
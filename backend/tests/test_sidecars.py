@@ -0,0 +1,95 @@
+import hashlib
+
+import pytest
+
+import ats_resume_analyzer as analyzer
+from ats_resume_analyzer import (
+    ARTIFACT_FORMAT,
+    EXTRACTOR_VERSION,
+    extraction_settings,
+    is_cacheable,
+    load_resume_artifact,
+    save_artifact,
+    sidecar_path,
+)
+
+PDF = b"%PDF-1.4 resume bytes"
+
+
+def artifact(extract_options=None, limit=None):
+    return {
+        "format": ARTIFACT_FORMAT,
+        "extractor_version": EXTRACTOR_VERSION,
+        "source_sha256": hashlib.sha256(PDF).hexdigest(),
+        "source_name": "resume.pdf",
+        "page_count": 1,
+        "total_pages": 1,
+        "truncated": limit is not None,
+        "limit_exceeded": limit,
+        "preflight": None,
+        "extract_options": extraction_settings(extract_options),
+        "text": "Jane Doe\nPython developer\n",
+        "pages": [],
+    }
+
+
+@pytest.fixture
+def extractions(monkeypatch):
+    """Options of every fresh extraction load_resume_artifact runs."""
+    calls = []
+
+    def extract(file_path, **options):
+        calls.append(options)
+        return artifact(options)
+
+    monkeypatch.setattr(analyzer, "extract_resume_artifact", extract)
+    return calls
+
+
+@pytest.fixture
+def pdf(tmp_path):
+    path = tmp_path / "resume.pdf"
+    path.write_bytes(PDF)
+    return str(path)
+
+
+def test_sidecar_reused_under_the_same_options(pdf, extractions):
+    save_artifact(artifact({"max_pages": 40}), sidecar_path(pdf))
+    loaded = load_resume_artifact(pdf, use_sidecar=True, extract_options={"max_pages": 40, "workers": 4})
+    assert loaded["text"] == "Jane Doe\nPython developer\n"
+    assert extractions == []
+
+
+@pytest.mark.parametrize("options", [{"max_pages": None}, {"word_budget": 10}, {"max_words_per_page": 5000}])
+def test_sidecar_from_other_limits_is_replaced(pdf, extractions, options):
+    save_artifact(artifact({"max_pages": 1}), sidecar_path(pdf))
+    load_resume_artifact(pdf, use_sidecar=True, extract_options=options)
+    assert extractions == [options]
+
+    # The fresh extraction replaced the sidecar, so it is reused next time
+    load_resume_artifact(pdf, use_sidecar=True, extract_options=options)
+    assert len(extractions) == 1
+
+
+def test_sidecar_without_options_is_replaced(pdf, extractions):
+    stored = artifact()
+    del stored["extract_options"]
+    save_artifact(stored, sidecar_path(pdf))
+    load_resume_artifact(pdf, use_sidecar=True)
+    assert len(extractions) == 1
+
+
+@pytest.mark.parametrize("limit, cacheable", [
+    (None, True),
+    ("max_pages", True),
+    ("word_budget", True),
+    ("max_words_per_page", True),
+    ("stage_deadline_s", False),
+    ("max_memory_mb", False),
+    ("max_cpu_s", False),
+])
+def test_only_load_dependent_limits_are_uncacheable(limit, cacheable):
+    result = {"success": True}
+    if limit:
+        result.update(partial=True, limit_exceeded={"limit": limit})
+    assert is_cacheable(result) is cacheable
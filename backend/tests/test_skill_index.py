@@ -0,0 +1,79 @@
+import os
+
+import pytest
+
+from skill_index import SkillIndex
+
+RESUMES = {
+    "asha.pdf": ({"react", "node", "mongodb"}, 82),
+    "ben.pdf": ({"react", "node", "postgresql"}, 75),
+    "chen.pdf": ({"python", "django"}, 90),
+    "dev.pdf": ({"react", "java"}, 60),
+}
+
+
+def build(resumes=RESUMES):
+    index = SkillIndex()
+    for key, (skills, score) in resumes.items():
+        index.add_skills(key, skills, score)
+    return index
+
+
+def test_boolean_queries():
+    index = build()
+    assert index.search("react AND node AND (mongodb OR postgresql)") == [("asha.pdf", 82), ("ben.pdf", 75)]
+    assert index.search("react AND NOT node") == [("dev.pdf", 60)]
+    assert index.count("python OR java") == 2
+    assert index.search("react", k=1) == [("asha.pdf", 82)]
+    assert index.search("react", min_score=70) == [("asha.pdf", 82), ("ben.pdf", 75)]
+
+
+def test_unknown_skill_is_rejected():
+    with pytest.raises(ValueError):
+        build().search("react AND cobol-ish")
+
+
+def test_replacing_a_key():
+    index = build()
+    index.add_skills("dev.pdf", {"python"}, 70)
+    assert len(index) == 4
+    assert index.skills_of("dev.pdf") == ["python"]
+    assert index.search("java") == []
+    assert index.search("python") == [("chen.pdf", 90), ("dev.pdf", 70)]
+
+
+def test_save_and_open(tmp_path):
+    path = str(tmp_path / "cohort.skx")
+    index = build()
+    index.save(path)
+
+    opened = SkillIndex.open(path)
+    assert sorted(opened.keys()) == sorted(RESUMES)
+    assert opened.search("react") == index.search("react")
+    assert opened.skills_of("chen.pdf") == index.skills_of("chen.pdf")
+
+    opened.add_skills("eve.pdf", {"react"}, 95)
+    assert opened.search("react")[0] == ("eve.pdf", 95)
+    opened.close()
+
+
+def test_save_drops_replaced_rows(tmp_path):
+    path = str(tmp_path / "cohort.skx")
+    fresh = str(tmp_path / "fresh.skx")
+    index = build()
+    for score in range(50):
+        index.add_skills("dev.pdf", {"react", "java"}, score)
+    index.save(path)
+    build({**RESUMES, "dev.pdf": ({"react", "java"}, 49)}).save(fresh)
+    assert os.path.getsize(path) == os.path.getsize(fresh)
+
+    opened = SkillIndex.open(path)
+    assert len(opened) == 4
+    assert opened.search("java") == [("dev.pdf", 49)]
+    assert opened.search("react") == index.search("react")
+
+    # Re-saving an opened, compacted index keeps it compact
+    opened.add_skills("dev.pdf", {"java"}, 10)
+    opened.save(path)
+    assert os.path.getsize(path) == os.path.getsize(fresh)
+    assert SkillIndex.open(path).search("java") == [("dev.pdf", 10)]
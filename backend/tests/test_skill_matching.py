@@ -0,0 +1,75 @@
+import re
+import random
+
+import pytest
+
+from ats_resume_analyzer import SKILL_DB, match_skills, extract_skills
+
+ALL_SKILLS = sorted({skill for skills in SKILL_DB.values() for skill in skills})
+SYMBOL_SKILLS = {"c++", "c#", "f#"}
+
+
+def per_skill_search(text):
+    """The matcher this replaced: one \\b-bounded search per skill."""
+    return {skill for skill in ALL_SKILLS if re.search(r"\b" + re.escape(skill) + r"\b", text)}
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("c++ developer", {"c++", "c"}),
+    ("c++17 and c++11", {"c++", "c"}),
+    ("modern c++14, python", {"c++", "c", "python"}),
+    ("c#, f# and .net", {"c#", "c", "f#"}),
+    ("c#10", {"c#", "c"}),
+])
+def test_symbol_skills(text, expected):
+    assert expected <= match_skills(text)
+
+
+# Deliberate change from the per-skill search: \b after "+" or "#" needs a
+# word character next, so c++, c# and f# were missed before a space,
+# punctuation or the end of the text
+@pytest.mark.parametrize("text, skill", [
+    ("c++ developer", "c++"),
+    ("languages: c#, java", "c#"),
+    ("f# (functional)", "f#"),
+    ("worked in c++", "c++"),
+    ("c#/.net", "c#"),
+])
+def test_symbol_skills_before_punctuation_are_new_matches(text, skill):
+    assert skill in match_skills(text)
+    assert skill not in per_skill_search(text)
+
+
+@pytest.mark.parametrize("text, absent", [
+    ("javascripting", "javascript"),
+    ("pythonic", "python"),
+    ("abc++", "c++"),
+    ("python3", "python"),
+])
+def test_skills_need_word_boundaries(text, absent):
+    assert absent not in match_skills(text)
+
+
+def test_longest_match_implies_shorter_skills():
+    found = match_skills("spring boot microservices")
+    assert {"spring boot", "spring"} <= found
+
+
+def test_matches_per_skill_search():
+    rng = random.Random(3)
+    fillers = [" ", ",", ".", "-", "/", "(", ")", "17", "11", "x", "_", "\n", "+", "#", "3", "dev"]
+    for _ in range(2000):
+        text = "".join(rng.choice([rng.choice(ALL_SKILLS), rng.choice(fillers)]) for _ in range(30))
+        found, before = match_skills(text), per_skill_search(text)
+        # The only differences allowed: symbol-ending skills followed by a
+        # space or punctuation, which \b used to miss
+        assert before <= found
+        assert found - before <= SYMBOL_SKILLS
+
+
+def test_extract_skills_credits_every_category():
+    found = extract_skills("Python, React and Docker; C++17")
+    for category, skills in found.items():
+        assert set(skills) <= set(SKILL_DB[category])
+    credited = {skill for skills in found.values() for skill in skills}
+    assert {"python", "react", "docker", "c++"} <= credited
@@ -0,0 +1,100 @@
+import io
+import json
+import shutil
+import subprocess
+
+import pytest
+
+import analyze_resume_wrapper as wrapper
+from wire_format import WireSchema, WireFormatError, FRAME_HEADER, read_frame
+
+ATS_WIRE_JS = wrapper.os.path.join(wrapper.script_dir, "utils", "atsWire.js")
+
+
+@pytest.fixture(scope="module")
+def results(corpus):
+    found = []
+    for entry in corpus:
+        for advice_format in ("text", "codes"):
+            found.append(wrapper.run_analysis(entry["sidecar"], advice_format=advice_format))
+    found.append(wrapper.run_analysis(corpus[0]["sidecar"], profile="score"))
+    found.append(wrapper.error_result(ValueError("broken")))
+    return found
+
+
+@pytest.fixture(scope="module")
+def schema():
+    return wrapper.get_wire_schema()
+
+
+def test_round_trip(schema, results):
+    for result in results:
+        frame = schema.pack(result)
+        assert schema.unpack(frame) == result
+
+
+def test_skills_are_interned(schema, results):
+    body = json.loads(schema.pack(results[0])[FRAME_HEADER.size:])
+    assert "skills_found" in body["interned"]
+    assert all(isinstance(i, int) for ids in body["result"]["skills_found"].values() for i in ids)
+
+
+def test_unknown_skills_are_sent_as_they_are(schema):
+    result = {"success": True, "skills_found": {"languages": ["python", "not-a-skill"]}}
+    body = schema.encode(result)
+    assert "skills_found" not in body["interned"]
+    assert schema.decode(json.loads(json.dumps(body))) == result
+
+
+def test_schema_exchange(schema):
+    received = WireSchema.from_dict(json.loads(json.dumps(schema.to_dict())))
+    assert received.schema_id == schema.schema_id
+    tampered = schema.to_dict()
+    tampered["skills"] = tampered["skills"][::-1]
+    with pytest.raises(WireFormatError):
+        WireSchema.from_dict(tampered)
+
+
+def test_frames_from_another_schema_are_refused(schema, results):
+    other = WireSchema(["python"], {})
+    with pytest.raises(WireFormatError):
+        other.unpack(schema.pack(results[0]))
+
+
+def test_truncated_frames(schema, results):
+    frame = schema.pack(results[0])
+    with pytest.raises(WireFormatError):
+        schema.unpack(frame[:-1])
+    stream = io.BytesIO(frame + frame[:10])
+    assert read_frame(stream) == frame
+    with pytest.raises(WireFormatError):
+        read_frame(stream)
+    assert read_frame(io.BytesIO()) is None
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="node not installed")
+def test_node_reader_decodes_every_frame(tmp_path, schema, results):
+    stream = tmp_path / "frames.bin"
+    stream.write_bytes(b"".join(schema.pack(result) for result in results))
+    schema_path = tmp_path / "schema.json"
+    schema_path.write_text(json.dumps(schema.to_dict(), ensure_ascii=False), encoding="utf-8")
+
+    # Fed in small chunks, so frames and headers are split across pushes
+    script = """
+        const fs = require('fs');
+        const atsWire = require(process.argv[1]);
+        const schema = atsWire.loadSchema(JSON.parse(fs.readFileSync(process.argv[2], 'utf8')));
+        const bytes = fs.readFileSync(process.argv[3]);
+        const reader = new atsWire.FrameReader();
+        const results = [];
+        for (let i = 0; i < bytes.length; i += 7) {
+          for (const frame of reader.push(bytes.subarray(i, i + 7))) {
+            results.push(atsWire.unpackFrame(schema, frame));
+          }
+        }
+        if (reader.pending) throw new Error('incomplete frame');
+        process.stdout.write(JSON.stringify(results));
+    """
+    output = subprocess.run(["node", "-e", script, ATS_WIRE_JS, str(schema_path), str(stream)],
+                            capture_output=True, check=True).stdout
+    assert json.loads(output) == results
@@ -0,0 +1,54 @@
+import io
+import json
+import threading
+
+import pytest
+
+import analyze_resume_wrapper as wrapper
+
+
+def job_lines(corpus, prefix):
+    lines = [json.dumps({"id": f"{prefix}{i}", "file_path": entry["sidecar"], "profile": "score"})
+             for i, entry in enumerate(corpus)]
+    return "\n".join(lines + ["not json", json.dumps({"id": f"{prefix}-stop", "cmd": "shutdown"})]) + "\n"
+
+
+def serve(runner, text):
+    written = []
+    wrapper.serve_stream(io.StringIO(text), written.append, runner)
+    return [json.loads(line) for line in b"".join(written).decode("utf-8").splitlines()]
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_every_job_is_answered_before_shutdown(corpus, jobs):
+    runner = wrapper.JobRunner(jobs)
+    try:
+        responses = serve(runner, job_lines(corpus, "a"))
+    finally:
+        runner.shutdown()
+    assert responses[-1] == {"id": "a-stop", "success": True, "shutdown": True}
+    answered = {response["id"]: response for response in responses[:-1]}
+    assert answered.pop(None)["error_type"] == "JSONDecodeError"
+    assert sorted(answered) == sorted(f"a{i}" for i in range(len(corpus)))
+    assert all(response["success"] for response in answered.values())
+
+
+def test_streams_share_one_pool(corpus):
+    runner = wrapper.JobRunner(2)
+    results = {}
+
+    def client(prefix):
+        results[prefix] = serve(runner, job_lines(corpus, prefix))
+
+    try:
+        clients = [threading.Thread(target=client, args=(prefix,)) for prefix in "abc"]
+        for thread in clients:
+            thread.start()
+        for thread in clients:
+            thread.join()
+        assert len(runner.executor._processes) <= 2
+    finally:
+        runner.shutdown()
+    for prefix, responses in results.items():
+        assert responses[-1]["id"] == f"{prefix}-stop"
+        assert len(responses) == len(corpus) + 2
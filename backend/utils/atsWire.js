@@ -0,0 +1,132 @@
+// Reader for the Python analyzer's "ats-wire" output (see wire_format.py).
+//
+// Each result is a frame: a 4-byte big-endian body length, then a UTF-8 JSON
+// body {format, version, schema, interned, result} whose skill names, in the
+// fields listed under "interned", are integer IDs into a schema. The schema
+// is printed once by `analyze_resume_wrapper.py --wire-schema`; its ID is a
+// hash of its content, so a frame written under another schema is refused
+// instead of being mis-decoded.
+const crypto = require('crypto');
+
+const WIRE_FORMAT = 'ats-wire';
+const WIRE_VERSION = 1;
+const FRAME_HEADER_BYTES = 4;
+// A result is tens of KB; anything near this is a corrupt or foreign stream
+const MAX_FRAME_BYTES = 64 * 1024 * 1024;
+
+class WireFormatError extends Error {}
+
+// Build a schema from the --wire-schema JSON, checking that its ID matches
+// its content the way WireSchema.from_dict does
+function loadSchema(data) {
+  if (!data || data.format !== WIRE_FORMAT || data.version !== WIRE_VERSION) {
+    throw new WireFormatError(`Unsupported schema: ${data && data.format} v${data && data.version}`);
+  }
+  // Same bytes as Python's json.dumps(..., ensure_ascii=False, separators=(",", ":"))
+  const content = JSON.stringify([WIRE_FORMAT, WIRE_VERSION, data.skills, data.details]);
+  const schemaId = crypto.createHash('sha256').update(content, 'utf8').digest('hex').slice(0, 16);
+  if (schemaId !== data.schema) {
+    throw new WireFormatError(`Schema ID ${data.schema} does not match its content`);
+  }
+  return { id: schemaId, skills: data.skills, details: data.details };
+}
+
+function expandMissing(schema, interned) {
+  const expanded = {};
+  for (const [category, ids] of Object.entries(interned)) {
+    expanded[category] = ids.map((i) => ({
+      skill: schema.skills[i],
+      importance: schema.details[i][0],
+      ats_impact: schema.details[i][1],
+    }));
+  }
+  return expanded;
+}
+
+// The result carried by a decoded frame body (WireSchema.decode)
+function decodeBody(schema, body) {
+  if (!body || body.format !== WIRE_FORMAT || body.version !== WIRE_VERSION) {
+    throw new WireFormatError(`Unsupported frame: ${body && body.format} v${body && body.version}`);
+  }
+  if (body.schema !== schema.id) {
+    throw new WireFormatError(`Frame uses schema ${body.schema}, this reader has ${schema.id}`);
+  }
+  const { skills } = schema;
+  const names = (ids) => ids.map((i) => skills[i]);
+  const { result } = body;
+  for (const field of body.interned) {
+    if (field === 'skills_found') {
+      for (const category of Object.keys(result.skills_found)) {
+        result.skills_found[category] = names(result.skills_found[category]);
+      }
+    } else if (field === 'skill_gaps.missing_by_category') {
+      result.skill_gaps.missing_by_category = expandMissing(schema, result.skill_gaps.missing_by_category);
+    } else if (field.startsWith('skill_gaps.')) {
+      const name = field.slice('skill_gaps.'.length);
+      result.skill_gaps[name] = names(result.skill_gaps[name]);
+    } else if (field === 'suggested_roles') {
+      for (const role of result.suggested_roles) {
+        role.matched_skills = names(role.matched_skills);
+        role.missing_skills = names(role.missing_skills);
+      }
+    } else {
+      throw new WireFormatError(`Unknown interned field: ${field}`);
+    }
+  }
+  return result;
+}
+
+// The result in one complete frame, header included (WireSchema.unpack)
+function unpackFrame(schema, frame) {
+  if (frame.length < FRAME_HEADER_BYTES) throw new WireFormatError('Truncated frame header');
+  const length = frame.readUInt32BE(0);
+  if (frame.length - FRAME_HEADER_BYTES !== length) {
+    throw new WireFormatError(`Frame length ${length} does not match ${frame.length - FRAME_HEADER_BYTES} body bytes`);
+  }
+  let body;
+  try {
+    body = JSON.parse(frame.subarray(FRAME_HEADER_BYTES).toString('utf8'));
+  } catch (e) {
+    throw new WireFormatError(`Invalid frame body: ${e.message}`);
+  }
+  return decodeBody(schema, body);
+}
+
+// Splits a byte stream (e.g. a worker's stdout) into complete frames:
+// push() each chunk as it arrives and get back the frames it completed
+class FrameReader {
+  constructor() {
+    this.buffer = Buffer.alloc(0);
+  }
+
+  push(chunk) {
+    this.buffer = this.buffer.length ? Buffer.concat([this.buffer, chunk]) : chunk;
+    const frames = [];
+    while (this.buffer.length >= FRAME_HEADER_BYTES) {
+      const length = this.buffer.readUInt32BE(0);
+      if (length > MAX_FRAME_BYTES) {
+        throw new WireFormatError(`Frame of ${length} bytes exceeds the ${MAX_FRAME_BYTES} byte limit`);
+      }
+      if (this.buffer.length < FRAME_HEADER_BYTES + length) break;
+      frames.push(this.buffer.subarray(0, FRAME_HEADER_BYTES + length));
+      this.buffer = this.buffer.subarray(FRAME_HEADER_BYTES + length);
+    }
+    return frames;
+  }
+
+  // Bytes of an incomplete frame left over, e.g. after the stream ended
+  get pending() {
+    return this.buffer.length;
+  }
+}
+
+module.exports = {
+  WIRE_FORMAT,
+  WIRE_VERSION,
+  MAX_FRAME_BYTES,
+  WireFormatError,
+  loadSchema,
+  decodeBody,
+  unpackFrame,
+  FrameReader,
+};
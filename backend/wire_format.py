@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+Compact, versioned wire format for analysis results.
+
+Results cross the Node.js <-> Python boundary as one large JSON document
+that repeats every skill name and, in skill_gaps.missing_by_category, the
+importance and ATS impact sentence of every missing skill. The "ats-wire"
+format sends the same result as length-prefixed frames instead:
+
+    frame   4-byte big-endian body length, then the body
+    body    UTF-8 JSON without whitespace:
+            {"format": "ats-wire", "version": 1, "schema": "<schema id>",
+             "interned": ["skills_found", ...], "result": {...}}
+
+Skill names in the fields listed under "interned" are replaced by integer
+IDs into a schema: the skill vocabulary with each skill's importance and ATS
+impact. The schema is exchanged once (WireSchema.to_dict, or the wrapper's
+--wire-schema), not per result, and its ID is derived from its content, so a
+reader holding a different schema is refused instead of mis-decoding. Fields
+that cannot be interned losslessly are sent as they are and left out of
+"interned". Interned fields in version 1:
+
+    skills_found                        category -> [skill id]
+    skill_gaps.high/medium/low_priority_gaps   [skill id]
+    skill_gaps.missing_by_category      category -> [skill id]; importance and
+                                        ats_impact come from the schema
+    suggested_roles                     matched_skills / missing_skills as [skill id]
+
+The Node.js side reads frames with utils/atsWire.js (loadSchema,
+FrameReader, unpackFrame); server.js uses it when ATS_WIRE_FORMAT=ats-wire.
+
+Usage:
+    from wire_format import WireSchema
+
+    schema = WireSchema(skills, skill_details)
+    frame = schema.pack(result)
+    assert schema.unpack(frame) == result
+"""
+
+import json
+import struct
+import hashlib
+from typing import Dict, List, Tuple, Any, Optional, BinaryIO
+
+WIRE_FORMAT = "ats-wire"
+WIRE_VERSION = 1
+
+FRAME_HEADER = struct.Struct(">I")
+# A result is tens of KB; anything near this is a corrupt or foreign stream
+MAX_FRAME_BYTES = 64 * 1024 * 1024
+
+_GAP_LISTS = ("high_priority_gaps", "medium_priority_gaps", "low_priority_gaps")
+
+
+class WireFormatError(ValueError):
+    """A frame that is truncated, oversized, or of another format, version or schema."""
+
+
+class WireSchema:
+    """
+    Skill vocabulary shared by both ends of the wire. IDs are positions in
+    `skills`, so the order is part of the schema.
+    """
+
+    def __init__(self, skills: List[str], skill_details: Dict[str, Dict[str, str]]):
+        """
+        Args:
+            skills: Every skill name a result may contain; duplicates are dropped
+            skill_details: Skill -> {"importance", "ats_impact"} as reported in
+                missing_by_category; skills without details cannot appear there
+                in interned form
+        """
+        self.skills = list(dict.fromkeys(skills))
+        self.ids = {skill: i for i, skill in enumerate(self.skills)}
+        self.details: List[Optional[Tuple[str, str]]] = []
+        for skill in self.skills:
+            detail = skill_details.get(skill)
+            self.details.append((detail["importance"], detail["ats_impact"]) if detail else None)
+        self.schema_id = hashlib.sha256(
+            json.dumps([WIRE_FORMAT, WIRE_VERSION, self.skills, self.details],
+                       ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        ).hexdigest()[:16]
+
+    # ------------------------------------------------------------- exchange
+
+    def to_dict(self) -> Dict[str, Any]:
+        """The schema as JSON-ready data, for the reading side."""
+        return {
+            "format": WIRE_FORMAT,
+            "version": WIRE_VERSION,
+            "schema": self.schema_id,
+            "skills": self.skills,
+            "details": self.details,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "WireSchema":
+        """
+        Rebuild a schema sent with to_dict.
+
+        Raises:
+            WireFormatError: If it is of another format or version, or its ID
+                does not match its content
+        """
+        if data.get("format") != WIRE_FORMAT or data.get("version") != WIRE_VERSION:
+            raise WireFormatError(f"Unsupported schema: {data.get('format')} v{data.get('version')}")
+        details = {
+            skill: {"importance": detail[0], "ats_impact": detail[1]}
+            for skill, detail in zip(data["skills"], data["details"]) if detail
+        }
+        schema = cls(data["skills"], details)
+        if schema.schema_id != data.get("schema"):
+            raise WireFormatError(f"Schema ID {data.get('schema')} does not match its content")
+        return schema
+
+    # ------------------------------------------------------------- interning
+
+    def _intern_missing(self, missing_by_category: Dict[str, List[Dict[str, str]]]) -> Dict[str, List[int]]:
+        ids = self.ids
+        details = self.details
+        interned = {}
+        for category, entries in missing_by_category.items():
+            category_ids = []
+            for entry in entries:
+                skill_id = ids[entry["skill"]]
+                if len(entry) != 3 or details[skill_id] != (entry["importance"], entry["ats_impact"]):
+                    raise KeyError(entry["skill"])
+                category_ids.append(skill_id)
+            interned[category] = category_ids
+        return interned
+
+    def _expand_missing(self, interned: Dict[str, List[int]]) -> Dict[str, List[Dict[str, str]]]:
+        skills = self.skills
+        details = self.details
+        return {
+            category: [
+                {"skill": skills[i], "importance": details[i][0], "ats_impact": details[i][1]}
+                for i in category_ids
+            ]
+            for category, category_ids in interned.items()
+        }
+
+    def encode(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        The wire body for a result (see the module docstring). The result is
+        not modified.
+        """
+        ids = self.ids
+        encoded = dict(result)
+        interned = []
+
+        # Each field is interned whole or not at all; KeyError means a skill
+        # (or a skill detail) the schema does not know
+        if isinstance(result.get("skills_found"), dict):
+            try:
+                encoded["skills_found"] = {
+                    category: [ids[s] for s in skills] for category, skills in result["skills_found"].items()
+                }
+                interned.append("skills_found")
+            except KeyError:
+                pass
+
+        gaps = result.get("skill_gaps")
+        if isinstance(gaps, dict):
+            encoded_gaps = dict(gaps)
+            for field in _GAP_LISTS:
+                if field in gaps:
+                    try:
+                        encoded_gaps[field] = [ids[s] for s in gaps[field]]
+                        interned.append(f"skill_gaps.{field}")
+                    except KeyError:
+                        pass
+            if "missing_by_category" in gaps:
+                try:
+                    encoded_gaps["missing_by_category"] = self._intern_missing(gaps["missing_by_category"])
+                    interned.append("skill_gaps.missing_by_category")
+                except KeyError:
+                    pass
+            encoded["skill_gaps"] = encoded_gaps
+
+        if isinstance(result.get("suggested_roles"), list):
+            try:
+                encoded["suggested_roles"] = [
+                    {**role,
+                     "matched_skills": [ids[s] for s in role["matched_skills"]],
+                     "missing_skills": [ids[s] for s in role["missing_skills"]]}
+                    for role in result["suggested_roles"]
+                ]
+                interned.append("suggested_roles")
+            except KeyError:
+                pass
+
+        return {
+            "format": WIRE_FORMAT,
+            "version": WIRE_VERSION,
+            "schema": self.schema_id,
+            "interned": interned,
+            "result": encoded,
+        }
+
+    def decode(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        The result carried by a wire body.
+
+        Raises:
+            WireFormatError: If the body is of another format, version or schema
+        """
+        if body.get("format") != WIRE_FORMAT or body.get("version") != WIRE_VERSION:
+            raise WireFormatError(f"Unsupported frame: {body.get('format')} v{body.get('version')}")
+        if body.get("schema") != self.schema_id:
+            raise WireFormatError(f"Frame uses schema {body.get('schema')}, this reader has {self.schema_id}")
+
+        skills = self.skills
+        result = body["result"]
+        for field in body["interned"]:
+            if field == "skills_found":
+                result["skills_found"] = {
+                    category: [skills[i] for i in skill_ids] for category, skill_ids in result["skills_found"].items()
+                }
+            elif field == "skill_gaps.missing_by_category":
+                gaps = result["skill_gaps"]
+                gaps["missing_by_category"] = self._expand_missing(gaps["missing_by_category"])
+            elif field.startswith("skill_gaps."):
+                gaps = result["skill_gaps"]
+                name = field.split(".", 1)[1]
+                gaps[name] = [skills[i] for i in gaps[name]]
+            elif field == "suggested_roles":
+                for role in result["suggested_roles"]:
+                    role["matched_skills"] = [skills[i] for i in role["matched_skills"]]
+                    role["missing_skills"] = [skills[i] for i in role["missing_skills"]]
+            else:
+                raise WireFormatError(f"Unknown interned field: {field}")
+        return result
+
+    # --------------------------------------------------------------- framing
+
+    def pack(self, result: Dict[str, Any]) -> bytes:
+        """One result as a length-prefixed frame."""
+        body = json.dumps(self.encode(result), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        return FRAME_HEADER.pack(len(body)) + body
+
+    def unpack(self, frame: bytes) -> Dict[str, Any]:
+        """
+        The result in one complete frame (header included).
+
+        Raises:
+            WireFormatError: If the frame is truncated or not an ats-wire frame
+        """
+        if len(frame) < FRAME_HEADER.size:
+            raise WireFormatError("Truncated frame header")
+        (length,) = FRAME_HEADER.unpack_from(frame)
+        if len(frame) - FRAME_HEADER.size != length:
+            raise WireFormatError(f"Frame length {length} does not match {len(frame) - FRAME_HEADER.size} body bytes")
+        try:
+            body = json.loads(memoryview(frame)[FRAME_HEADER.size:].tobytes())
+        except ValueError as e:
+            raise WireFormatError(f"Invalid frame body: {e}")
+        return self.decode(body)
+
+
+def read_frame(stream: BinaryIO) -> Optional[bytes]:
+    """
+    Read the next frame (header included) from a binary stream.
+
+    Returns:
+        The frame, or None at a clean end of stream
+
+    Raises:
+        WireFormatError: If the stream ends inside a frame or the length is
+            implausible
+    """
+    header = stream.read(FRAME_HEADER.size)
+    if not header:
+        return None
+    if len(header) < FRAME_HEADER.size:
+        raise WireFormatError("Stream ended inside a frame header")
+    (length,) = FRAME_HEADER.unpack(header)
+    if length > MAX_FRAME_BYTES:
+        raise WireFormatError(f"Frame of {length} bytes exceeds the {MAX_FRAME_BYTES} byte limit")
+    body = stream.read(length)
+    if len(body) < length:
+        raise WireFormatError("Stream ended inside a frame body")
+    return header + body